@@ -1,18 +1,81 @@
-from fastapi import FastAPI
+"""
+Standalone OCR service for screenshot verification.
 
-app = FastAPI()
+    OCR_API_KEY=... OCR_API_PORT=8090 OCR_WORKERS=4 python ocr_api.py
+
+Point the bot at it with `OCR_API_URL` (and `OCR_API_KEY`) in config.py, the bot then never runs tesseract itself.
+"""
+
+import asyncio
+import os
+import sys
+import typing as T
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from aiohttp import web
+from aiohttp_asgi import ASGIResource
+from fastapi import Depends, FastAPI, File, Header, HTTPException, UploadFile
+
+from ocr import OCREngine
 
-@app.get("/ocr")
-async def ocr_endpoint():
-    return {"message": "OCR endpoint running"}
-from fastapi import FastAPI, Header, HTTPException
+API_KEY = os.getenv("OCR_API_KEY")
+PORT = int(os.getenv("OCR_API_PORT", 8090))
+WORKERS = int(os.getenv("OCR_WORKERS", 0)) or None
+
+MAX_BATCH = 10
+MAX_IMAGE_SIZE = 20 * 1024 * 1024
 
 app = FastAPI()
+engine: T.Optional[OCREngine] = None
 
-FASTAPI_KEY = "mysecret123"
 
-@app.get("/ocr")
-async def ocr_endpoint(x_api_key: str = Header(...)):
-    if x_api_key != FASTAPI_KEY:
+async def check_key(x_api_key: T.Optional[str] = Header(None)):
+    # no key configured means nobody gets in, never an open endpoint.
+    if not API_KEY or x_api_key != API_KEY:
         raise HTTPException(status_code=401, detail="Invalid API Key")
-    return {"status": "ok"}
+
+
+async def start_engine(_: web.Application):
+    global engine
+    engine = OCREngine(WORKERS)
+
+
+async def stop_engine(_: web.Application):
+    if engine:
+        engine.close()
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", "workers": engine.workers, "queue_depth": engine.pending}
+
+
+@app.post("/ocr/batch", dependencies=[Depends(check_key)])
+async def ocr_batch(files: T.List[UploadFile] = File(...)):
+    if len(files) > MAX_BATCH:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH} images per batch")
+
+    images = []
+    for file in files:
+        data = await file.read(MAX_IMAGE_SIZE + 1)
+        if len(data) > MAX_IMAGE_SIZE:
+            raise HTTPException(status_code=413, detail=f"{file.filename} is larger than {MAX_IMAGE_SIZE} bytes")
+        images.append(data)
+
+    return {"results": await asyncio.gather(*(engine.process(data) for data in images))}
+
+
+def main():
+    if not API_KEY:
+        sys.exit("OCR_API_KEY is not set, refusing to start an unauthenticated OCR service.")
+
+    aiohttp_app = web.Application()
+    aiohttp_app.router.register_resource(ASGIResource(app, root_path=""))  # type: ignore
+    aiohttp_app.on_startup.append(start_engine)
+    aiohttp_app.on_cleanup.append(stop_engine)
+    web.run_app(aiohttp_app, host=os.getenv("OCR_API_HOST", "127.0.0.1"), port=PORT)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,11 +14,11 @@ from discord.ext import commands
 
 from core import Cog, Context, QuotientView
 from models import *
-from utils import QuoRole, QuoTextChannel, checks
+from utils import QuoRole, QuoTextChannel, checks, emote
 
 from .errors import SMError
 from .events import ScrimEvents, Ssverification, TagEvents, TourneyEvents
-from .helpers import delete_denied_message
+from .helpers import delete_denied_message, export_registrations
 from .slash import *
 from .views import *
 
@@ -161,6 +161,7 @@ class ScrimManager(Cog, name="Esports"):
 
         await EasyTag.create(guild_id=ctx.guild.id, channel_id=channel.id)
         self.bot.cache.eztagchannels.add(channel.id)
+        self.bot.cache.publish("easytag_changed", channel.id)
 
         embed = self.bot.embed(ctx, title="Easy Tagging")
         embed.description = """
@@ -187,6 +188,7 @@ class ScrimManager(Cog, name="Esports"):
 
         await EasyTag.filter(channel_id=channel.id).delete()
         self.bot.cache.eztagchannels.discard(channel.id)
+        self.bot.cache.publish("easytag_changed", channel.id)
         await ctx.success(f"Removed {channel} from EasyTag channels.")
 
     @easytag.command(name="config")
@@ -284,6 +286,7 @@ class ScrimManager(Cog, name="Esports"):
 
         await TagCheck.create(guild_id=ctx.guild.id, channel_id=channel.id, required_mentions=mentions)
         self.bot.cache.tagcheck.add(channel.id)
+        self.bot.cache.publish("tagcheck_changed", channel.id)
 
         await ctx.success(
             f"Successfully added **{channel}** to tagcheck channels.\n\nAdd {role.mention} to your roles to ignore your messages in **{channel}**"
@@ -323,6 +326,7 @@ class ScrimManager(Cog, name="Esports"):
 
         await TagCheck.filter(channel_id=channel.id).delete()
         self.bot.cache.tagcheck.discard(channel.id)
+        self.bot.cache.publish("tagcheck_changed", channel.id)
         await ctx.success(f"Removed {channel} from TagCheck channels.")
 
     @tagcheck.command(name="autodelete", extras={"examples": ["tagcheck autodelete #channel"]})
@@ -385,6 +389,35 @@ class ScrimManager(Cog, name="Esports"):
         await BanLog.update_or_create(guild_id=ctx.guild.id, defaults={"channel_id": channel.id})
         await ctx.success(f"Successfully set {channel.mention} as esports ban/unban log channel.")
 
+    @commands.command(name="export", extras={"examples": ["export tourney 12", "export scrim 45 json"]})
+    @commands.bot_has_permissions(attach_files=True)
+    @commands.cooldown(1, 30, type=commands.BucketType.guild)
+    async def _export(self, ctx: Context, kind: str, record_id: int, fmt: str = "csv"):
+        """
+        Download all registered teams of a tourney or scrim as a `.csv` (or `json`) file.
+        """
+        kind, fmt = kind.lower(), fmt.lower()
+        if kind not in ("tourney", "scrim") or fmt not in ("csv", "json"):
+            return await ctx.error(f"Usage: `{ctx.prefix}export <tourney|scrim> <id> [csv|json]`")
+
+        model, mod_role = (Tourney, "tourney-mod") if kind == "tourney" else (Scrim, "scrims-mod")
+        if not ctx.author.guild_permissions.manage_guild and not model.is_ignorable(ctx.author):
+            return await ctx.error(f"You need `{mod_role}` role or `Manage-Server` permissions to export data.")
+
+        if not await model.filter(pk=record_id, guild_id=ctx.guild.id).exists():
+            return await ctx.error(f"This is not a valid {kind} ID.")
+
+        m = await ctx.simple(f"Crunching the data for you.... {emote.loading}")
+        _file = await export_registrations(self.bot, ctx.guild, kind, record_id, fmt=fmt)
+        await ctx.safe_delete(m)
+
+        if _file.fp.seek(0, 2) > ctx.guild.filesize_limit:
+            _file.close()
+            return await ctx.error("The exported file is too large to be uploaded in this server.")
+
+        _file.reset()
+        await ctx.send(file=_file)
+
     @commands.group(invoke_without_command=True, aliases=("ss",))
     @checks.can_use_tm()
     @commands.cooldown(1, 10, type=commands.BucketType.guild)
@@ -352,6 +352,7 @@ class SMError(Cog):
         await Tourney.filter(registration_channel_id=channel.id).delete()
         await TagCheck.filter(channel_id=channel.id).delete()
         await EasyTag.filter(channel_id=channel.id).delete()
+        self.bot.cache.publish("channel_deleted", channel.id)
 
     @Cog.listener()
     async def on_scrim_registration_delete(self, scrim: Scrim, message: discord.Message, slot):
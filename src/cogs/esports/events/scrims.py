@@ -14,7 +14,7 @@ import discord
 import utils
 from constants import IST, AutocleanType, Day
 from core import Cog
-from models import ArrayRemove, AssignedSlot, BanLog, BannedTeam, Scrim, Timer
+from models import ArrayRemove, AssignedSlot, BanLog, BannedTeam, Schedule, Scrim, Timer
 
 from ..helpers import (
     before_registrations,
@@ -116,20 +116,10 @@ class ScrimEvents(Cog):
         scrim = await Scrim.get_or_none(pk=scrim_id)
 
         if not scrim:  # we don't want to do anything if the scrim is deleted
-            return
-
-        if scrim.open_time != timer.expires:  # If time is not same return :)
-            return
-
-        await Scrim.filter(pk=scrim.id).update(
-            open_time=scrim.open_time + timedelta(hours=24),
-        )
+            return await Schedule.filter(event="scrim_open", key=scrim_id).delete()
 
-        await self.bot.reminders.create_timer(
-            scrim.open_time + timedelta(hours=24),
-            "scrim_open",
-            scrim_id=scrim.id,
-        )  # we don't want to risk this
+        # the schedule has already moved on, keep open_time in step with it.
+        await Scrim.filter(pk=scrim.id).update(open_time=timer.next_fire)
 
         if scrim.toggle is not True or not Day(utils.day_today()) in scrim.open_days:
             return
@@ -157,15 +147,9 @@ class ScrimEvents(Cog):
         scrim = await Scrim.get_or_none(pk=scrim_id)
 
         if not scrim:  # deleted probably
-            return
-
-        if timer.expires != scrim.autoclean_time:
-            return
-
-        next_autoclean_time = scrim.autoclean_time + timedelta(hours=24)
+            return await Schedule.filter(event="autoclean", key=scrim_id).delete()
 
-        await Scrim.filter(pk=scrim.id).update(autoclean_time=next_autoclean_time)
-        await self.bot.reminders.create_timer(next_autoclean_time, "autoclean", scrim_id=scrim.id)
+        await Scrim.filter(pk=scrim.id).update(autoclean_time=timer.next_fire)
 
         if not scrim.toggle:  # scrim is disabled
             return
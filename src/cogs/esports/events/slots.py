@@ -8,7 +8,7 @@ if typing.TYPE_CHECKING:
 import discord
 
 from core import Cog
-from models import Scrim, ScrimsSlotManager, Timer
+from models import Schedule, Scrim, ScrimsSlotManager, Timer
 
 
 class SlotManagerEvents(Cog):
@@ -21,10 +21,9 @@ class SlotManagerEvents(Cog):
 
         scrim = await Scrim.get_or_none(pk=scrim_id)
         if not scrim:
-            return
+            return await Schedule.filter(event="scrim_match", key=scrim_id).delete()
 
-        if not scrim.match_time == timer.expires:
-            return
+        await Scrim.filter(pk=scrim.id).update(match_time=timer.next_fire)
 
         record = await ScrimsSlotManager.get_or_none(guild_id=scrim.guild_id, scrim_ids__contains=scrim.id)
         if record:
@@ -1,30 +1,28 @@
 from __future__ import annotations
 
 import asyncio
-import os
-from typing import TYPE_CHECKING, List
+import hashlib
+import time
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 from contextlib import suppress
-import hashlib
-import re
 
 import discord
 import humanize
-import pytesseract
-from PIL import Image
-import io
-import imagehash
 
 from constants import SSType
+from ocr import DownloadError, OCRClient, OCREngine, ScreenshotDownloader, extract_counts
 
 if TYPE_CHECKING:
     from core import Quotient
 
 from core import Cog, Context, QuotientRatelimiter
-from models import ImageResponse, SSVerify
+from models import ImageResponse, SSVerify, SSVerifyJob
 from utils import emote, plural
 
+from ..helpers import OCRCache, VerificationQueue
+
 
 class MemberLimits(defaultdict):
     def __missing__(self, key):
@@ -32,213 +30,63 @@ class MemberLimits(defaultdict):
         return r
 
 
-class GuildLimits(defaultdict):
+class GuildSlots(defaultdict):
+    """How many submissions of one guild may be in the OCR pool at once, so one busy server can't starve the rest."""
+
+    def __init__(self, per_guild: int):
+        super().__init__()
+        self.per_guild = per_guild
+
     def __missing__(self, key):
-        r = self[key] = QuotientRatelimiter(10, 60)
+        r = self[key] = asyncio.Semaphore(self.per_guild)
         return r
 
 
 class Ssverification(Cog):
+    MAX_QUEUED_PER_GUILD = 50
+
     def __init__(self, bot: Quotient):
         self.bot = bot
 
-        # Initialize Tesseract OCR
-        try:
-            tesseract_path = [
-                '/usr/bin/tesseract',
-                'usr/local/bin/tesseract',
-                'tesseract'
-            ]
-
-            tesseract_found =False
-            for path in tesseract_path:
-                if path == 'tesseract' or os.path.exists(path):
-                    pytesseract.pytesseract.tesseract_cmd = path
-                    try:
-                        pytesseract.get_tesseract_version()
-                        tesseract_found =True
-                        break
-                    except:
-                        continue
-            if not tesseract_found:
-                raise Esception('Tesseract not found in system')
-            
-        except Exception as e:
-            pass
+        # hashing + tesseract run in worker processes (see src/ocr), or in the ocr_api.py service if configured.
+        workers = getattr(self.bot.config, "OCR_WORKERS", None)
+        if url := getattr(self.bot.config, "OCR_API_URL", None):
+            self.engine = OCRClient(
+                self.bot.session, url, key=getattr(self.bot.config, "OCR_API_KEY", None), workers=workers
+            )
+        else:
+            self.engine = OCREngine(workers)
+        self.ocr_cache = OCRCache(self.bot)
+        self.downloader = ScreenshotDownloader()
+        self.bot.loop.create_task(self.ocr_cache.purge_expired())
 
         # Stats
         self.stats = {
             'total_verified': 0,
             'today_verified': 0,
-            'last_reset': datetime.utcnow().date()
+            'last_reset': datetime.utcnow().date(),
+            'timings': defaultdict(float),  # stage: total ms
+            'images': 0,
+            'cache_hit_rate': 0.0,  # % of screenshots answered by OCRCache
         }
 
         # Rate limiters
         self.__mratelimiter = MemberLimits(QuotientRatelimiter)
-        self.__gratelimiter = GuildLimits(QuotientRatelimiter)
-        self.__verify_lock = asyncio.Lock()
+        self.__guild_slots = GuildSlots(max(1, self.engine.workers // 2))
 
-    async def calculate_image_hashes(self, image_data: bytes) -> tuple[str, str]:
-        """Calculate hashes for duplicate detection"""
-        try:
-            def _calc():
-                image = Image.open(io.BytesIO(image_data))
-                dhash = str(imagehash.dhash(image))
-                phash = str(imagehash.phash(image))
-                ahash = str(imagehash.average_hash(image))
-                whash = str(imagehash.whash(image))
-                combined = f"{dhash}:{phash}:{ahash}:{whash}"
-                return dhash, combined
-            
-            dhash, combined = await asyncio.to_thread(_calc)
-            return dhash, combined
-        except Exception as e:
-            print(f"❌ Hash error: {e}")
-            fallback = hashlib.md5(image_data).hexdigest()[:16]
-            return fallback, fallback
+        # submissions wait here instead of being rejected when a server is busy.
+        self.queue = VerificationQueue(self.engine.workers, self.__process_job)
+        self.queue.start(self.bot.loop)
+        self.bot.loop.create_task(self.__resume_jobs(self.bot.current_time))
 
-    def calculate_hash_similarity(self, hash1: str, hash2: str) -> float:
-        """Calculate similarity between hashes"""
-        try:
-            h1_parts = hash1.split(':')
-            h2_parts = hash2.split(':')
-            
-            if len(h1_parts) != len(h2_parts):
-                return 0.0
-            
-            similarities = []
-            for h1, h2 in zip(h1_parts, h2_parts):
-                if len(h1) != len(h2):
-                    continue
-                differences = sum(c1 != c2 for c1, c2 in zip(h1, h2))
-                similarity = (1 - (differences / len(h1))) * 100
-                similarities.append(similarity)
-            
-            return sum(similarities) / len(similarities) if similarities else 0.0
-        except:
-            return 0.0
-
-    async def extract_text_with_tesseract(self, image_data: bytes) -> tuple[str, dict]:
-        """Extract text + device info"""
-        try:
-            def _extract():
-                image = Image.open(io.BytesIO(image_data))
-                width, height = image.size
-                aspect_ratio = width / height
-                
-                device_info = {
-                    'width': width,
-                    'height': height,
-                    'aspect_ratio': round(aspect_ratio, 2),
-                    'device_type': 'unknown',
-                    'platform': 'unknown'
-                }
-                
-                if aspect_ratio > 1.5:
-                    device_info['device_type'] = 'desktop'
-                    device_info['platform'] = 'web'
-                elif 0.4 < aspect_ratio < 0.6:
-                    device_info['device_type'] = 'mobile'
-                    device_info['platform'] = 'app'
-                elif 0.8 < aspect_ratio < 1.2:
-                    device_info['device_type'] = 'tablet'
-                    device_info['platform'] = 'app'
-                
-                mobile_res = [(1080, 1920), (1080, 2340), (1080, 2400), (1440, 3040), (720, 1280)]
-                for mw, mh in mobile_res:
-                    if (width == mw and height == mh) or (width == mh and height == mw):
-                        device_info['device_type'] = 'mobile'
-                        device_info['platform'] = 'app'
-                        break
-                
-                image = image.convert('L')
-                text = pytesseract.image_to_string(image, lang='eng', config='--psm 6 --oem 3')
-                return text.strip(), device_info
-            
-            text, device_info = await asyncio.to_thread(_extract)
-            if text:
-                print(f"📝 OCR: {len(text)} chars | {device_info['device_type']} ({device_info['width']}x{device_info['height']})")
-            return text, device_info
-        except Exception as e:
-            print(f"❌ OCR Error: {e}")
-            return "", {'device_type': 'unknown', 'platform': 'unknown', 'width': 0, 'height': 0}
+    def cog_unload(self):
+        self.queue.stop()
+        self.engine.close()
+        self.bot.loop.create_task(self.downloader.close())
 
     def extract_counts_from_text(self, text: str, ss_type: SSType) -> dict:
         """Extract follower/subscriber counts"""
-        counts = {
-            'followers': None, 'following': None, 'subscribers': None,
-            'views': None, 'likes': None, 'posts': None
-        }
-        
-        text_lower = text.lower()
-        
-        if ss_type == SSType.yt:
-            # Subscribers
-            patterns = [
-                r'(\d+(?:\.\d+)?)\s*[KkMmBb]?\s*subscriber',
-                r'subscriber[s]?\s*[:\-]?\s*(\d+(?:\.\d+)?)\s*[KkMmBb]?',
-            ]
-            for pattern in patterns:
-                if match := re.search(pattern, text_lower):
-                    counts['subscribers'] = self._parse_count(match.group(1))
-                    break
-            
-            # Views
-            patterns = [
-                r'(\d+(?:\.\d+)?)\s*[KkMmBb]?\s*views?',
-                r'views?\s*[:\-]?\s*(\d+(?:\.\d+)?)\s*[KkMmBb]?',
-            ]
-            for pattern in patterns:
-                if match := re.search(pattern, text_lower):
-                    counts['views'] = self._parse_count(match.group(1))
-                    break
-        
-        elif ss_type == SSType.insta:
-            # Followers
-            patterns = [
-                r'(\d+(?:\.\d+)?)\s*[KkMmBb]?\s*followers?',
-                r'followers?\s*[:\-]?\s*(\d+(?:\.\d+)?)\s*[KkMmBb]?',
-            ]
-            for pattern in patterns:
-                if match := re.search(pattern, text_lower):
-                    counts['followers'] = self._parse_count(match.group(1))
-                    break
-            
-            # Following
-            patterns = [
-                r'(\d+(?:\.\d+)?)\s*[KkMmBb]?\s*following',
-                r'following\s*[:\-]?\s*(\d+(?:\.\d+)?)\s*[KkMmBb]?',
-            ]
-            for pattern in patterns:
-                if match := re.search(pattern, text_lower):
-                    counts['following'] = self._parse_count(match.group(1))
-                    break
-            
-            # Posts
-            patterns = [
-                r'(\d+(?:\.\d+)?)\s*[KkMmBb]?\s*posts?',
-                r'posts?\s*[:\-]?\s*(\d+(?:\.\d+)?)\s*[KkMmBb]?',
-            ]
-            for pattern in patterns:
-                if match := re.search(pattern, text_lower):
-                    counts['posts'] = self._parse_count(match.group(1))
-                    break
-        
-        return counts
-
-    def _parse_count(self, count_str: str) -> int:
-        """Convert count string to integer"""
-        try:
-            count_str = count_str.replace(',', '').strip()
-            multipliers = {'k': 1000, 'm': 1000000, 'b': 1000000000}
-            
-            for suffix, mult in multipliers.items():
-                if count_str.lower().endswith(suffix):
-                    return int(float(count_str[:-1]) * mult)
-            
-            return int(float(count_str))
-        except:
-            return 0
+        return extract_counts(text, ss_type.name)
 
     async def check_count_increment(self, record: SSVerify, ctx: Context, new_counts: dict) -> tuple[bool, str]:
         """Check if counts increased"""
@@ -297,110 +145,144 @@ class Ssverification(Cog):
             print(f"❌ Count check error: {e}")
             return True, "✅ Count check skipped"
 
-    async def verify_screenshot_ocr(self, image_url: str, record: SSVerify, ctx: Context) -> ImageResponse:
+    async def verify_screenshot_ocr(
+        self, attachment: discord.Attachment, record: SSVerify, ctx: Context
+    ) -> ImageResponse:
         """OCR-only verification with ordered checks"""
-        try:
-            
-            # Download image
-            async with self.bot.session.get(image_url) as resp:
-                if resp.status != 200:
-                    return ImageResponse(
-                        url=image_url, 
-                        text="❌ Failed to download image", 
-                        dhash="0"*16, 
-                        phash="0"*16, 
-                        metadata={'error': 'download_failed'}
-                    )
-                image_data = await resp.read()
-            
-            # Step 1: Calculate hashes
-            hash_task = asyncio.create_task(self.calculate_image_hashes(image_data))
-            
-            # Step 2: Run OCR
-            text_task = asyncio.create_task(self.extract_text_with_tesseract(image_data))
-            
-            dhash, phash = await hash_task
-            ocr_text, device_info = await text_task
-            
-            # Validation order
-            result_text = ""
-            is_valid = False
-            validation_steps = []
-            
-            # Step 1: OCR Text Detection
-            if not ocr_text or len(ocr_text.strip()) < 10:
-                validation_steps.append("❌ No text detected in image")
-                result_text = self._build_result_text(False, validation_steps, device_info, {}, ocr_text)
-                return ImageResponse(
-                    url=image_url,
-                    text=result_text,
-                    dhash=dhash,
-                    phash=phash,
-                    metadata={'device_info': device_info, 'counts': {}, 'timestamp': datetime.utcnow().isoformat()}
-                )
-            
-            validation_steps.append(f"✅ Step 1: Text detected ({len(ocr_text)} characters)")
-            
-            # Step 3: Channel Name Check (for YT/Insta)
-            if record.ss_type in [SSType.yt, SSType.insta]:
-                channel_name = getattr(record, 'channel_name', None) or getattr(record, 'channel_url', '')
-                if channel_name:
-                    channel_valid = channel_name.lower() in ocr_text.lower()
-                    if not channel_valid:
-                        validation_steps.append(f"❌ Wrong SS! Verified Channel name is '{channel_name}' ")
-                        result_text = self._build_result_text(False, validation_steps, device_info, {}, ocr_text)
-                        return ImageResponse(
-                            url=image_url,
-                            text=result_text,
-                            dhash=dhash,
-                            phash=phash,
-                            metadata={'device_info': device_info, 'counts': {}, 'timestamp': datetime.utcnow().isoformat()}
-                        )
-                    validation_steps.append(f"✅ Step 3: Channel name verified")
-                else:
-                    validation_steps.append("⚠️ Step 3: No channel name to verify")
-            
-            # Step 4: Subscribe/Follow Button Check
-            action_valid, action_msg = self._check_action_button(ocr_text, record)
-            if not action_valid:
-                validation_steps.append(f"❌ Step 4: {action_msg}")
-                result_text = self._build_result_text(False, validation_steps, device_info, {}, ocr_text)
-                return ImageResponse(
-                    url=image_url,
-                    text=result_text,
-                    dhash=dhash,
-                    phash=phash,
-                    metadata={'device_info': device_info, 'counts': {}, 'timestamp': datetime.utcnow().isoformat()}
-                )
-            
-            validation_steps.append(f"✅ Step 4: {action_msg}")
-            
-            # REMOVED: Step 5 - Follower/Subscriber Count Check
-            # Count extraction still done for metadata but not validated
-            counts = self.extract_counts_from_text(ocr_text, record.ss_type)
-            
-            # All checks passed
-            is_valid = True
-            result_text = self._build_result_text(True, validation_steps, device_info, counts, ocr_text)
-            
+        return (await self.verify_screenshots_ocr([attachment], record, ctx))[0]
+
+    async def verify_screenshots_ocr(
+        self, attachments: List[discord.Attachment], record: SSVerify, ctx: Context
+    ) -> List[ImageResponse]:
+        """Same for all the screenshots of a submission, the ones that aren't cached are ocr'd as one batch"""
+        loaded = await asyncio.gather(*(self.__load_screenshot(a) for a in attachments), return_exceptions=True)
+
+        responses: List[Optional[ImageResponse]] = [None] * len(attachments)
+        misses = []  # (index, (result, sha256, bytes, timings)) of the screenshots never ocr'd before
+        for idx, (attachment, loaded_ss) in enumerate(zip(attachments, loaded)):
+            if isinstance(loaded_ss, BaseException):
+                responses[idx] = self._ocr_error(attachment.proxy_url, loaded_ss)
+            elif loaded_ss[0] is None:
+                misses.append((idx, loaded_ss))
+            else:
+                responses[idx] = self._ocr_response(attachment.proxy_url, loaded_ss[0], record, loaded_ss[3])
+
+        if misses:
+            try:
+                # decode, hash and ocr happen in the worker pool / ocr service
+                async with self.__guild_slots[ctx.guild.id]:
+                    results = await self.engine.process_batch([image_data for _, (_, _, image_data, _) in misses])
+            except Exception as e:
+                results = [e] * len(misses)
+
+            for (idx, (_, sha, _, timings)), result in zip(misses, results):
+                image_url = attachments[idx].proxy_url
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+
+                    timings.update(result['timings'])
+                    await self.ocr_cache.put(sha, result)
+                    responses[idx] = self._ocr_response(image_url, result, record, timings)
+                except Exception as e:
+                    responses[idx] = self._ocr_error(image_url, e, timings)
+
+        return responses
+
+    async def __load_screenshot(
+        self, attachment: discord.Attachment
+    ) -> tuple[Optional[dict], str, Optional[bytearray], dict]:
+        """(cached ocr result, sha256, downloaded bytes, timings) of an attachment"""
+        timings = {}  # stage: ms
+
+        if cached := self.ocr_cache.by_attachment(attachment.id):
+            sha, result = cached
+            return result, sha, None, timings
+
+        t = time.perf_counter()
+        image_data = await self.downloader.fetch(attachment)
+        timings['download'] = (time.perf_counter() - t) * 1000
+
+        # same bytes were ocr'd before (resubmission / shared ss), skip tesseract.
+        sha = hashlib.sha256(image_data).hexdigest()
+        return await self.ocr_cache.get(sha, attachment.id), sha, image_data, timings
+
+    def _ocr_error(self, image_url: str, e: BaseException, timings: Optional[dict] = None) -> ImageResponse:
+        if isinstance(e, DownloadError):
             return ImageResponse(
                 url=image_url,
-                text=result_text,
-                dhash=dhash,
-                phash=phash,
-                metadata={'device_info': device_info, 'counts': counts, 'timestamp': datetime.utcnow().isoformat()}
-            )
-            
-        except Exception as e:
-            print(f"❌ OCR Verification error: {e}")
-            return ImageResponse(
-                url=image_url, 
-                text=f"❌ Error: {e}", 
-                dhash="0"*16, 
-                phash="0"*16, 
-                metadata={'error': str(e)}
+                text=f"❌ {e}",
+                dhash="0"*16,
+                phash="0"*16,
+                metadata={'error': 'download_failed'}
             )
 
+        print(f"❌ OCR Verification error: {e}")
+        return ImageResponse(
+            url=image_url,
+            text=f"❌ Error: {e}",
+            dhash="0"*16,
+            phash="0"*16,
+            metadata={'error': str(e), 'timings': timings or {}}
+        )
+
+    def _ocr_response(self, image_url: str, result: dict, record: SSVerify, timings: dict) -> ImageResponse:
+        ocr_text, device_info = result['text'], result['device_info']
+
+        if ocr_text:
+            print(f"📝 OCR: {len(ocr_text)} chars | {device_info['device_type']} ({device_info['width']}x{device_info['height']})")
+
+        t = time.perf_counter()
+        result_text, counts = self._validate_ocr_text(ocr_text, device_info, record)
+        timings['validate'] = (time.perf_counter() - t) * 1000
+
+        return ImageResponse(
+            url=image_url,
+            text=result_text,
+            dhash=result['dhash'],
+            phash=result['phash'],
+            metadata={
+                'device_info': device_info,
+                'counts': counts,
+                'timings': timings,
+                'timestamp': datetime.utcnow().isoformat(),
+            }
+        )
+
+    def _validate_ocr_text(self, ocr_text: str, device_info: dict, record: SSVerify) -> tuple[str, dict]:
+        """Run the ordered checks on OCR text, returns (result text, counts)"""
+        validation_steps = []
+
+        # Step 1: OCR Text Detection
+        if not ocr_text or len(ocr_text.strip()) < 10:
+            validation_steps.append("❌ No text detected in image")
+            return self._build_result_text(False, validation_steps, device_info, {}, ocr_text), {}
+
+        validation_steps.append(f"✅ Step 1: Text detected ({len(ocr_text)} characters)")
+
+        # Step 3: Channel Name Check (for YT/Insta)
+        if record.ss_type in [SSType.yt, SSType.insta]:
+            channel_name = getattr(record, 'channel_name', None) or getattr(record, 'channel_url', '')
+            if channel_name:
+                if not channel_name.lower() in ocr_text.lower():
+                    validation_steps.append(f"❌ Wrong SS! Verified Channel name is '{channel_name}' ")
+                    return self._build_result_text(False, validation_steps, device_info, {}, ocr_text), {}
+                validation_steps.append(f"✅ Step 3: Channel name verified")
+            else:
+                validation_steps.append("⚠️ Step 3: No channel name to verify")
+
+        # Step 4: Subscribe/Follow Button Check
+        action_valid, action_msg = self._check_action_button(ocr_text, record)
+        if not action_valid:
+            validation_steps.append(f"❌ Step 4: {action_msg}")
+            return self._build_result_text(False, validation_steps, device_info, {}, ocr_text), {}
+
+        validation_steps.append(f"✅ Step 4: {action_msg}")
+
+        # Count extraction still done for metadata but not validated
+        counts = self.extract_counts_from_text(ocr_text, record.ss_type)
+        return self._build_result_text(True, validation_steps, device_info, counts, ocr_text), counts
+
     def _validate_platform(self, text: str, record: SSVerify) -> tuple[bool, str]:
         """Validate screenshot is from correct platform"""
         text_lower = text.lower()
@@ -532,10 +414,10 @@ class Ssverification(Cog):
             ))
             return False
 
-        elif retry := self.__gratelimiter[message.guild].is_ratelimited(message.guild):
+        elif self.queue.waiting(message.guild.id) >= self.MAX_QUEUED_PER_GUILD:
             await message.reply(embed=discord.Embed(
                 color=discord.Color.red(),
-                description=f"**Many submissions from this server. Retry after `{retry:.2f}` seconds.**"
+                description="**Too many submissions from this server are waiting. Retry in a minute.**"
             ))
             return False
         return True
@@ -573,82 +455,138 @@ class Ssverification(Cog):
                 _e.description = f"**Send `{record.required_ss}` screenshots only (you sent `{len(attachments)}`).**"
                 return await ctx.reply(embed=_e)
 
+            weight = 2.0 if await ctx.is_premium_guild() else 1.0
+            position = self.queue.position(message.guild.id, weight=weight, cost=len(attachments))
+
             _e.color = discord.Color.yellow()
-            _e.description = f"Processing your {plural(attachments):screenshot|screenshots}... ⏳"
+            _e.description = (
+                f"Your {plural(attachments):screenshot is|screenshots are} queued for verification, "
+                f"position `{position}`... ⏳"
+            )
             m: discord.Message = await message.reply(embed=_e)
 
-            start_at = self.bot.current_time
+            job = await SSVerifyJob.create(
+                guild_id=message.guild.id,
+                channel_id=message.channel.id,
+                message_id=message.id,
+                author_id=message.author.id,
+                pending_message_id=m.id,
+                weight=weight,
+                cost=len(attachments),
+            )
+            self.queue.put(job, job.guild_id, weight=job.weight, cost=job.cost)
 
-            # Process with Tesseract OCR only
-            async with self.__verify_lock:
-                _ocr = []
-                for attachment in attachments:
-                    result = await self.verify_screenshot_ocr(attachment.proxy_url, record, ctx)
-                    _ocr.append(result)
+    async def __resume_jobs(self, before: datetime):
+        """Submissions accepted before a restart go back in the queue, oldest first."""
+        async for job in SSVerifyJob.filter(created_at__lt=before).order_by("id"):
+            self.queue.put(job, job.guild_id, weight=job.weight, cost=job.cost)
 
-            complete_at = self.bot.current_time
+    async def __process_job(self, job: SSVerifyJob):
+        cancelled = False
+        try:
+            await self.bot.wait_until_ready()
 
-            embed = await self.__verify_screenshots(ctx, record, _ocr)
-            
-            # Update stats
-            self.stats['total_verified'] += 1
-            today = datetime.utcnow().date()
-            if today > self.stats['last_reset']:
-                self.stats['today_verified'] = 0
-                self.stats['last_reset'] = today
-            self.stats['today_verified'] += 1
-            
-            embed.set_footer(text=f"Time: {humanize.precisedelta(complete_at-start_at)} | Love from ScrimX❤️")
-            embed.set_author(
-                name=f"Submitted {await record.data.filter(author_id=ctx.author.id).count()}/{record.required_ss}",
-                icon_url=getattr(ctx.author.display_avatar, "url", None),
-            )
+            record = await SSVerify.get_or_none(channel_id=job.channel_id)
+            if not record or not (channel := self.bot.get_channel(job.channel_id)):
+                return
+
+            if not (message := self.bot.get_message(job.message_id)):
+                try:
+                    message = await channel.fetch_message(job.message_id)
+                except discord.HTTPException:  # submission was deleted while waiting
+                    return
+
+            m = channel.get_partial_message(job.pending_message_id) if job.pending_message_id else None
+            with suppress(discord.HTTPException):
+                await self.__verify_submission(message, record, m)
+
+        except asyncio.CancelledError:
+            # shutting down mid-verification, the row stays so __resume_jobs queues it again.
+            cancelled = True
+            raise
+
+        finally:
+            if not cancelled:
+                await job.delete()
+
+    async def __verify_submission(
+        self, message: discord.Message, record: SSVerify, m: Optional[discord.PartialMessage]
+    ):
+        ctx: Context = await self.bot.get_context(message)
+        _e = discord.Embed(color=discord.Color.yellow())
+
+        attachments = self.__valid_attachments(message)
+
+        if m is not None:
+            _e.description = f"Processing your {plural(attachments):screenshot|screenshots}... ⏳"
+            with suppress(discord.HTTPException):
+                await m.edit(embed=_e)
+
+        start_at = self.bot.current_time
+
+        # attachments of one submission are downloaded in parallel and ocr'd as one batch, GuildSlots keeps guilds fair.
+        _ocr = await self.verify_screenshots_ocr(attachments, record, ctx)
+
+        complete_at = self.bot.current_time
+
+        t = time.perf_counter()
+        embed = await self.__verify_screenshots(ctx, record, _ocr)
+        validate = (time.perf_counter() - t) * 1000
+
+        # Update stats
+        self.stats['total_verified'] += 1
+        today = datetime.utcnow().date()
+        if today > self.stats['last_reset']:
+            self.stats['today_verified'] = 0
+            self.stats['last_reset'] = today
+        self.stats['today_verified'] += 1
 
+        stages = defaultdict(float)
+        for _ in _ocr:
+            for stage, ms in _.metadata.get('timings', {}).items():
+                stages[stage] += ms
+        stages['validate'] += validate
+
+        self.stats['images'] += len(_ocr)
+        self.stats['cache_hit_rate'] = self.ocr_cache.hit_rate
+        for stage, ms in stages.items():
+            self.stats['timings'][stage] += ms
+
+        _stages = " ".join(f"{stage} {ms:.0f}ms" for stage, ms in stages.items())
+        embed.set_footer(
+            text=f"Time: {humanize.precisedelta(complete_at-start_at)} ({_stages}) | Love from ScrimX❤️"
+        )
+        embed.set_author(
+            name=f"Submitted {await record.data.filter(author_id=ctx.author.id).count()}/{record.required_ss}",
+            icon_url=getattr(ctx.author.display_avatar, "url", None),
+        )
+
+        if m is not None:
             with suppress(discord.HTTPException):
                 await m.delete()
 
-            await message.reply(embed=embed)
+        await message.reply(embed=embed)
 
-            if await record.is_user_verified(ctx.author.id):
-                await message.author.add_roles(discord.Object(id=record.role_id))
+        if await record.is_user_verified(ctx.author.id):
+            await message.author.add_roles(discord.Object(id=record.role_id))
 
-                if record.success_message:
-                    _e.title = "Screenshot Verification Complete"
-                    _e.url, _e.description = message.jump_url, record.success_message
-                    return await message.reply(embed=_e)
+            if record.success_message:
+                _e.title = "Screenshot Verification Complete"
+                _e.url, _e.description = message.jump_url, record.success_message
+                return await message.reply(embed=_e)
 
-                _e.description = f"{ctx.author.mention} Your screenshots are verified, move to next step."
-                await message.reply(embed=_e)
+            _e.description = f"{ctx.author.mention} Your screenshots are verified, move to next step."
+            await message.reply(embed=_e)
 
     async def __verify_screenshots(self, ctx: Context, record: SSVerify, _ocr: List[ImageResponse]) -> discord.Embed:
         _e = discord.Embed(color=self.bot.color, description="")
 
         for _ in _ocr:
-            # Enhanced duplicate detection
+            # near-duplicates, across every user of this channel (see SSVerify._match_for_duplicate)
             if not record.allow_same:
-                # Exact hash check
                 b, t = await record._match_for_duplicate(_.dhash, _.phash, ctx.author.id)
                 if b:
-                    _e.description += f"{record.emoji(False)} | {t}"
-                    continue
-                
-                # Similarity check for near-duplicates
-                existing_images = await record.data.filter(author_id=ctx.author.id).all()
-                is_similar = False
-                
-                for existing in existing_images:
-                    similarity = self.calculate_hash_similarity(_.phash, existing.phash)
-                    
-                    if similarity >= 95.0:
-                        _e.description += (
-                            f"{record.emoji(False)} | **Duplicate Image Detected!**\n"
-                            f"└─ {similarity:.1f}% similar to previous submission.\n"
-                        )
-                        is_similar = True
-                        print(f"⚠️ Similar image: {similarity:.1f}%")
-                        break
-                
-                if is_similar:
+                    _e.description += t
                     continue
 
             # Check if validation passed
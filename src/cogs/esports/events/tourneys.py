@@ -3,8 +3,6 @@ from __future__ import annotations
 import typing
 from contextlib import suppress
 
-from cogs.esports.helpers.tourney import get_tourney_from_channel
-
 if typing.TYPE_CHECKING:
     from core import Quotient
 
@@ -21,11 +19,12 @@ from models import MediaPartner, PartnerSlot, TGroupList, TMSlot, Tourney
 from utils import truncate_string
 
 from ..helpers import (
+    SlotCancellation,
     before_registrations,
     cannot_take_registration,
     check_tourney_requirements,
     get_tourney_slots,
-    update_confirmed_message,
+    resume_group_role_jobs,
 )
 
 
@@ -33,6 +32,7 @@ class TourneyEvents(Cog):
     def __init__(self, bot: Quotient):
         self.bot = bot
         self.__tourney_lock = asyncio.Lock()
+        self.bot.loop.create_task(resume_group_role_jobs(self.bot))
 
     async def __process_tourney_message(
         self, message: discord.Message, tourney: Tourney, *, check_duplicate=True, mp=False
@@ -191,15 +191,15 @@ class TourneyEvents(Cog):
         ):
             return
 
-        media_partner = await MediaPartner.get_or_none(pk=message.channel.id)
-
-        if not media_partner:
+        try:
+            tourney_id, partner_id, partner_guild_id = self.bot.cache.media_partners[message.channel.id]
+        except KeyError:
             return self.bot.cache.media_partner_channels.discard(message.channel.id)
 
-        tourney = await get_tourney_from_channel(message.guild.id, message.channel.id)  # type: ignore # line guarded
+        tourney = await Tourney.get_or_none(pk=tourney_id)
 
         if not tourney:
-            return self.bot.cache.media_partner_channels.discard(message.channel.id)
+            return self.bot.cache.remove_media_partner(message.channel.id)
 
         if tourney.started_at is None:
             return
@@ -207,8 +207,8 @@ class TourneyEvents(Cog):
         if tourney.is_ignorable(message.author):
             return
 
-        partner_tourney = await Tourney.get_or_none(pk=media_partner.tourney_id)
-        if not partner_tourney:
+        registered = self.bot.cache.partner_registrations.get(partner_id)
+        if registered is None:
             _e = discord.Embed(
                 color=discord.Color.red(),
                 description=(
@@ -219,14 +219,14 @@ class TourneyEvents(Cog):
             await message.add_reaction(tourney.cross_emoji)
             return await message.reply(embed=_e, delete_after=7)
 
-        if not message.author.id in get_tourney_slots(await partner_tourney.assigned_slots.all()):
+        if not message.author.id in registered:
             await message.add_reaction(tourney.cross_emoji)
 
             _e = discord.Embed(
                 color=discord.Color.red(),
                 description=(
                     f"{message.author.mention}, you can't register through here because you didn't register in our "
-                    f"Media-Partner tourney running in {partner_tourney.guild}\n\n"
+                    f"Media-Partner tourney running in {self.bot.get_guild(partner_guild_id)}\n\n"
                     f"Kindly register through {tourney.registration_channel.mention}."
                 ),
             )
@@ -240,39 +240,35 @@ class TourneyEvents(Cog):
         async with self.__tourney_lock:
             await self.__process_tourney_message(message, tourney, mp=True)
 
+    async def __registration_tourney_id(self, channel_id: int) -> typing.Optional[int]:
+        if channel_id in self.bot.cache.media_partner_channels:
+            if partner := self.bot.cache.media_partners.get(channel_id):
+                return partner[0]
+
+        elif channel_id in self.bot.cache.tourney_channels:
+            return await Tourney.filter(registration_channel_id=channel_id).first().values_list("id", flat=True)
+
     @Cog.listener()
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
         message_id = payload.message_id
         _del = await Tourney.filter(slotm_message_id=message_id).update(slotm_message_id=None, slotm_channel_id=None)
 
-        tourney = None
-        if not _del:
-            if payload.channel_id in self.bot.cache.media_partner_channels:
-                media_partner = await MediaPartner.get_or_none(pk=payload.channel_id)
-                if media_partner:
-                    tourney = await get_tourney_from_channel(payload.guild_id, payload.channel_id)
-            elif payload.channel_id in self.bot.cache.tourney_channels:
-                tourney = await Tourney.get_or_none(registration_channel_id=payload.channel_id)
-
-        if tourney:
-            slot = await tourney.assigned_slots.filter(message_id=payload.message_id).first()
-            if slot:
-                if slot.confirm_jump_url:
-                    self.bot.loop.create_task(update_confirmed_message(tourney, slot.confirm_jump_url))
-
-                if await tourney.assigned_slots.filter(leader_id=slot.leader_id).count() == 1:
-                    m = tourney.guild.get_member(slot.leader_id)
-                    if m:
-                        self.bot.loop.create_task(m.remove_roles(tourney.role))
-
-                await TMSlot.filter(pk=slot.pk).delete()
+        if not _del and (tourney_id := await self.__registration_tourney_id(payload.channel_id)):
+            SlotCancellation.enqueue(self.bot, tourney_id, (message_id,))
 
         await TGroupList.filter(message_id=message_id).delete()
 
+    @Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        if tourney_id := await self.__registration_tourney_id(payload.channel_id):
+            SlotCancellation.enqueue(self.bot, tourney_id, payload.message_ids)
+
     @Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.TextChannel):
         await Tourney.filter(slotm_channel_id=channel.id).update(slotm_channel_id=None, slotm_message_id=None)
-        await MediaPartner.filter(channel_id=channel.id).delete()
+        if channel.id in self.bot.cache.media_partner_channels:
+            await MediaPartner.filter(channel_id=channel.id).delete()
+            self.bot.cache.remove_media_partner(channel.id)
 
     @Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
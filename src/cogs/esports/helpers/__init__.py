@@ -1,3 +1,8 @@
+from .cancel import *
 from .converters import *
+from .export import *
+from .groups import *
+from .ocr_cache import *
+from .ssqueue import *
 from .tourney import *
 from .utils import *
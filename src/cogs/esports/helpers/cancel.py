@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import typing as T
+from collections import defaultdict
+from contextlib import suppress
+
+import discord
+
+from models import Tourney
+
+if T.TYPE_CHECKING:
+    from core import Quotient
+
+__all__ = ("SlotCancellation",)
+
+
+class SlotCancellation:
+    """
+    Cancels tourney slots whose registration messages were deleted.
+
+    Deletions are collected for a moment per tourney, so a mod purging spam ends up as one
+    db transaction (delete, leftover leaders, renumbering) and one set of discord edits.
+    """
+
+    COLLECT_FOR = 1.5  # seconds
+
+    engines: T.Dict[int, "SlotCancellation"] = {}  # tourney_id: engine
+
+    DELETE_QUERY = """
+    DELETE FROM PUBLIC."tm.register" AS SLOTS
+        USING PUBLIC."tm.tourney_tm.register" AS ASSIGNED_SLOT
+    WHERE ASSIGNED_SLOT.TMSLOT_ID = SLOTS.ID
+    AND ASSIGNED_SLOT."tm.tourney_id" = $1
+    AND SLOTS.MESSAGE_ID = ANY($2::BIGINT[])
+    RETURNING SLOTS.LEADER_ID, SLOTS.JUMP_URL, SLOTS.CONFIRM_JUMP_URL
+    """
+
+    LEADERS_QUERY = """
+    SELECT DISTINCT SLOTS.LEADER_ID
+        FROM PUBLIC."tm.tourney_tm.register" AS ASSIGNED_SLOT
+        INNER JOIN PUBLIC."tm.register" AS SLOTS ON SLOTS.ID = ASSIGNED_SLOT.TMSLOT_ID
+    WHERE ASSIGNED_SLOT."tm.tourney_id" = $1
+    AND SLOTS.LEADER_ID = ANY($2::BIGINT[])
+    """
+
+    RENUMBER_QUERY = """
+    UPDATE PUBLIC."tm.register" AS SLOTS
+        SET NUM = ORDERED.RN
+    FROM (
+        SELECT S.ID, ROW_NUMBER() OVER (ORDER BY S.NUM, S.ID) AS RN
+            FROM PUBLIC."tm.tourney_tm.register" AS ASSIGNED_SLOT
+            INNER JOIN PUBLIC."tm.register" AS S ON S.ID = ASSIGNED_SLOT.TMSLOT_ID
+        WHERE ASSIGNED_SLOT."tm.tourney_id" = $1
+    ) AS ORDERED
+    WHERE SLOTS.ID = ORDERED.ID AND SLOTS.NUM <> ORDERED.RN
+    """
+
+    COUNT_QUERY = """
+    SELECT COUNT(*) FROM PUBLIC."tm.tourney_tm.register" WHERE "tm.tourney_id" = $1
+    """
+
+    def __init__(self, bot: Quotient, tourney_id: int):
+        self.bot = bot
+        self.tourney_id = tourney_id
+
+        self.message_ids: T.Set[int] = set()
+        self.__task: T.Optional[asyncio.Task] = None
+
+    @classmethod
+    def enqueue(cls, bot: Quotient, tourney_id: int, message_ids: T.Iterable[int]):
+        try:
+            engine = cls.engines[tourney_id]
+        except KeyError:
+            engine = cls.engines[tourney_id] = cls(bot, tourney_id)
+
+        engine.message_ids.update(message_ids)
+
+        if engine.__task is None or engine.__task.done():
+            engine.__task = bot.loop.create_task(engine.__run())
+
+    async def __run(self):
+        await asyncio.sleep(self.COLLECT_FOR)
+
+        while self.message_ids:
+            message_ids, self.message_ids = self.message_ids, set()
+            await self.cancel(message_ids)
+
+        self.engines.pop(self.tourney_id, None)
+
+    async def cancel(self, message_ids: T.Iterable[int]):
+        tourney = await Tourney.get_or_none(pk=self.tourney_id)
+        if not tourney:
+            return
+
+        async with self.bot.db.acquire() as con:
+            async with con.transaction():
+                deleted = await con.fetch(self.DELETE_QUERY, tourney.id, list(message_ids))
+                if not deleted:
+                    return
+
+                leader_ids = list({r["leader_id"] for r in deleted})
+                remaining = {r["leader_id"] for r in await con.fetch(self.LEADERS_QUERY, tourney.id, leader_ids)}
+
+                if tourney.renumber_on_cancel:
+                    await con.execute(self.RENUMBER_QUERY, tourney.id)
+
+                total = await con.fetchval(self.COUNT_QUERY, tourney.id)
+
+        await self.bot.cache.refresh_partner_registrations(tourney.id)
+
+        # one edit per confirm message, batched confirm messages can hold many cancelled slots.
+        confirm_messages: T.Dict[str, T.List[str]] = defaultdict(list)
+        for r in deleted:
+            if r["confirm_jump_url"]:
+                confirm_messages[r["confirm_jump_url"]].append(r["jump_url"])
+
+        for link, jump_urls in confirm_messages.items():
+            self.bot.loop.create_task(tourney.update_confirmed_message(link, *jump_urls))
+
+        if (guild := tourney.guild) is not None:
+            for leader_id in leader_ids:
+                if leader_id not in remaining:
+                    with suppress(discord.HTTPException):
+                        await self.bot.http.remove_role(
+                            guild.id, leader_id, tourney.role_id, reason="Their tourney registration was cancelled."
+                        )
+
+        # only reopen if registrations were closed because the slots were full.
+        was_full = total + len(deleted) >= tourney.total_slots
+        if tourney.reopen_on_cancel and tourney.closed and was_full and total < tourney.total_slots:
+            with suppress(discord.HTTPException, AttributeError):
+                await tourney.toggle_registrations()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import typing as T
+from contextlib import suppress
+
+import discord
+
+from models import TMSlot, Tourney
+
+if T.TYPE_CHECKING:
+    from core import Quotient
+
+__all__ = ("ConfirmFeed",)
+
+
+class ConfirmFeed:
+    """
+    Posts tourney confirmations in batches of upto 10 embeds per message.
+
+    Slots are saved before they are queued here, so registrations are never gated by
+    the confirm channel's send ratelimit. `confirm_jump_url` of every slot in a batch is
+    set with one query once the batch message is sent.
+
+    Tourneys can share a confirm channel, a batch only ever holds slots of one tourney.
+    """
+
+    BATCH_SIZE = 10
+    FLUSH_AFTER = 2  # seconds
+    MAX_FAILURES = 5  # batches discord keeps refusing are dropped after this many tries
+
+    WEBHOOK_NAME = "ScrimX Confirm Feed"
+
+    feeds: T.Dict[int, "ConfirmFeed"] = {}  # confirm_channel_id: feed
+
+    def __init__(self, bot: Quotient, channel_id: int):
+        self.bot = bot
+        self.channel_id = channel_id
+
+        self.pending: T.List[T.Tuple[Tourney, TMSlot, discord.Embed, int]] = []
+
+        self.__lock = asyncio.Lock()
+        self.__task: T.Optional[asyncio.Task] = None
+        self.__webhook: T.Optional[discord.Webhook] = None
+        self.__failures = 0
+
+    @classmethod
+    def enqueue(cls, tourney: Tourney, slot: TMSlot, embed: discord.Embed, leader_id: int):
+        try:
+            feed = cls.feeds[tourney.confirm_channel_id]
+        except KeyError:
+            feed = cls.feeds[tourney.confirm_channel_id] = cls(tourney.bot, tourney.confirm_channel_id)
+
+        feed.pending.append((tourney, slot, embed, leader_id))
+
+        if len(feed.pending) >= cls.BATCH_SIZE:
+            feed.bot.loop.create_task(feed.flush())
+
+        else:
+            feed.__schedule()
+
+    def __schedule(self):
+        if self.__task is None or self.__task.done():
+            self.__task = self.bot.loop.create_task(self.__flush_later())
+
+    async def __flush_later(self):
+        await asyncio.sleep(self.FLUSH_AFTER)
+        while self.pending:
+            if not await self.flush():
+                # the batch is back in pending, give discord a moment.
+                await asyncio.sleep(self.FLUSH_AFTER * self.__failures)
+
+    def __take_batch(self) -> T.List[T.Tuple[Tourney, TMSlot, discord.Embed, int]]:
+        """Pops upto BATCH_SIZE entries of the first pending tourney, the rest keep their order."""
+        tourney_id = self.pending[0][0].id
+
+        batch, rest = [], []
+        for entry in self.pending:
+            (batch if entry[0].id == tourney_id and len(batch) < self.BATCH_SIZE else rest).append(entry)
+
+        self.pending = rest
+        return batch
+
+    async def flush(self) -> bool:
+        """Sends one batch, False if discord refused it and it was queued again."""
+        async with self.__lock:
+            if not self.pending:
+                return True
+
+            batch = self.__take_batch()
+            tourney = batch[0][0]
+            channel = tourney.confirm_channel
+            if channel is None:
+                return True
+
+            content = ", ".join(f"<@{leader_id}>" for _, _, _, leader_id in batch)
+            embeds = [embed for _, _, embed, _ in batch]
+
+            try:
+                m = None
+                if tourney.confirm_webhook and (webhook := await self.__get_webhook(channel)):
+                    with suppress(discord.NotFound):  # webhook was deleted, the channel gets this batch
+                        m = await webhook.send(
+                            content=content,
+                            embeds=embeds,
+                            username=channel.guild.name,
+                            avatar_url=getattr(channel.guild.icon, "url", None),
+                            allowed_mentions=discord.AllowedMentions(users=True),
+                            wait=True,
+                        )
+                    if m is None:
+                        self.__webhook = None
+
+                if m is None:
+                    m = await channel.send(
+                        content=content, embeds=embeds, allowed_mentions=discord.AllowedMentions(users=True)
+                    )
+
+            except discord.HTTPException:
+                self.__failures += 1
+                if self.__failures < self.MAX_FAILURES:
+                    self.pending[:0] = batch
+                    self.__schedule()
+                else:
+                    self.__failures = 0
+                return False
+
+            self.__failures = 0
+            await TMSlot.filter(pk__in=[slot.pk for _, slot, _, _ in batch]).update(confirm_jump_url=m.jump_url)
+            return True
+
+    async def __get_webhook(self, channel: discord.TextChannel) -> T.Optional[discord.Webhook]:
+        if self.__webhook is not None:
+            return self.__webhook
+
+        if not channel.permissions_for(channel.guild.me).manage_webhooks:
+            return None
+
+        self.__webhook = discord.utils.get(await channel.webhooks(), name=self.WEBHOOK_NAME)
+        if self.__webhook is None:
+            self.__webhook = await channel.create_webhook(
+                name=self.WEBHOOK_NAME, reason="Created to send tourney confirm messages."
+            )
+
+        return self.__webhook
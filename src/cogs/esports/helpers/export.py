@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import tempfile
+import typing as T
+
+import discord
+
+if T.TYPE_CHECKING:
+    from core import Quotient
+
+__all__ = ("export_registrations",)
+
+
+# (query for every leader/member id, query for the rows)
+_QUERIES = {
+    "tourney": (
+        """
+        SELECT DISTINCT UNNEST(SLOTS.MEMBERS || SLOTS.LEADER_ID)
+            FROM PUBLIC."tm.tourney_tm.register" AS ASSIGNED_SLOT
+            INNER JOIN PUBLIC."tm.register" AS SLOTS ON SLOTS.ID = ASSIGNED_SLOT.TMSLOT_ID
+        WHERE ASSIGNED_SLOT."tm.tourney_id" = $1
+        """,
+        """
+        SELECT SLOTS.NUM, SLOTS.TEAM_NAME, SLOTS.LEADER_ID, SLOTS.MEMBERS, SLOTS.JUMP_URL, SLOTS.CONFIRM_JUMP_URL
+            FROM PUBLIC."tm.tourney_tm.register" AS ASSIGNED_SLOT
+            INNER JOIN PUBLIC."tm.register" AS SLOTS ON SLOTS.ID = ASSIGNED_SLOT.TMSLOT_ID
+        WHERE ASSIGNED_SLOT."tm.tourney_id" = $1
+        ORDER BY SLOTS.NUM
+        """,
+    ),
+    "scrim": (
+        """
+        SELECT DISTINCT UNNEST(SLOTS.MEMBERS || SLOTS.USER_ID)
+            FROM PUBLIC."sm.scrims_sm.assigned_slots" AS ASSIGNED_SLOT
+            INNER JOIN PUBLIC."sm.assigned_slots" AS SLOTS ON SLOTS.ID = ASSIGNED_SLOT.ASSIGNEDSLOT_ID
+        WHERE ASSIGNED_SLOT."sm.scrims_id" = $1
+        """,
+        """
+        SELECT SLOTS.NUM, SLOTS.TEAM_NAME, SLOTS.USER_ID, SLOTS.MEMBERS, SLOTS.JUMP_URL, NULL
+            FROM PUBLIC."sm.scrims_sm.assigned_slots" AS ASSIGNED_SLOT
+            INNER JOIN PUBLIC."sm.assigned_slots" AS SLOTS ON SLOTS.ID = ASSIGNED_SLOT.ASSIGNEDSLOT_ID
+        WHERE ASSIGNED_SLOT."sm.scrims_id" = $1
+        ORDER BY SLOTS.NUM
+        """,
+    ),
+}
+
+_HEADER = ("Reg Posi", "Team Name", "Leader", "Leader ID", "Teammates", "Teammates in Server", "Jump URL", "Confirm URL")
+
+
+async def export_registrations(
+    bot: Quotient, guild: discord.Guild, kind: str, record_id: int, *, fmt: str = "csv"
+) -> discord.File:
+    """
+    Streams all registrations of a tourney / scrim into a csv (or ndjson) file.
+
+    Rows are read with a server-side cursor and written to a temporary file one by one,
+    so memory stays flat no matter how many teams registered. Member names are resolved
+    with one bulk lookup before the rows are streamed.
+    """
+    ids_query, rows_query = _QUERIES[kind]
+
+    ids = [r[0] for r in await bot.db.fetch(ids_query, record_id) if r[0] is not None]
+    names = {m.id: str(m) async for m in bot.resolve_member_ids(guild, ids)}
+
+    fp = tempfile.TemporaryFile()
+    text = io.TextIOWrapper(fp, encoding="utf-8", newline="")
+
+    writer = csv.writer(text)
+    if fmt == "csv":
+        writer.writerow(_HEADER)
+
+    async with bot.db.acquire() as con:
+        async with con.transaction():  # cursors only live inside a transaction
+            async for num, team_name, leader_id, members, jump_url, confirm_url in con.cursor(
+                rows_query, record_id, prefetch=500
+            ):
+                members = members or []
+                if fmt == "csv":
+                    writer.writerow(
+                        (
+                            num,
+                            team_name,
+                            names.get(leader_id, "Not in server"),
+                            f"'{leader_id}",
+                            " | ".join(f"{names.get(m, m)} ({m})" for m in members),
+                            sum(1 for m in members if m in names),
+                            jump_url,
+                            confirm_url,
+                        )
+                    )
+                else:
+                    row = {
+                        "num": num,
+                        "team_name": team_name,
+                        "leader": {"id": str(leader_id), "name": names.get(leader_id)},
+                        "members": [{"id": str(m), "name": names.get(m)} for m in members],
+                        "jump_url": jump_url,
+                        "confirm_jump_url": confirm_url,
+                    }
+                    text.write(json.dumps(row) + "\n")
+
+    text.flush()
+    text.detach()
+    fp.seek(0)
+
+    ext = "csv" if fmt == "csv" else "ndjson"
+    return discord.File(fp, filename=f"{kind}_data_{record_id}_{int(bot.current_time.timestamp())}.{ext}")
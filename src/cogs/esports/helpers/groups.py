@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing as T
+from collections import defaultdict
+from contextlib import suppress
+
+import discord
+from humanize import precisedelta
+
+from models import TGroupRoleJob, Tourney
+from utils import emote, split_list
+
+if T.TYPE_CHECKING:
+    from core import Quotient
+
+__all__ = ("GroupRoleJob", "build_group_role_plan", "resume_group_role_jobs")
+
+
+class GuildRoleBudget(defaultdict):
+    """Role edits are ratelimited per guild, so every guild gets its own concurrency budget."""
+
+    def __missing__(self, key):
+        r = self[key] = asyncio.Semaphore(GroupRoleJob.CONCURRENCY)
+        return r
+
+
+async def build_group_role_plan(
+    tourney: Tourney, size: int, roles: T.Dict[int, discord.Role]
+) -> T.Dict[str, T.List[int]]:
+    """
+    Computes {role_id: [leader_ids]} for every `group number -> role` pair upfront,
+    slots are fetched once instead of once per group.
+    """
+    groups = split_list(await tourney.assigned_slots.all().order_by("num"), size)
+
+    plan: T.Dict[str, T.List[int]] = {}
+    for group, role in roles.items():
+        if not 0 < group <= len(groups):
+            continue
+
+        leaders = plan.setdefault(str(role.id), [])
+        for slot in groups[group - 1]:
+            if slot.leader_id not in leaders:
+                leaders.append(slot.leader_id)
+
+    return plan
+
+
+class GroupRoleJob:
+    """
+    Gives (or strips) group roles for a persisted `TGroupRoleJob`.
+
+    Grants run concurrently within the guild's budget, progress is saved to db in batches
+    so that a restart can pick the job up from where it stopped.
+    """
+
+    CONCURRENCY = 5
+    EDIT_EVERY = 3  # seconds between progress embed edits
+    SAVE_EVERY = 25  # processed members between progress saves
+
+    budgets = GuildRoleBudget()
+    running: T.Dict[int, "GroupRoleJob"] = {}
+
+    def __init__(self, bot: Quotient, record: TGroupRoleJob):
+        self.bot = bot
+        self.record = record
+
+        self.failed = 0
+        self.message: T.Optional[discord.Message] = None
+
+        self.__last_edit = 0.0
+        self.__unsaved = 0
+        self.__started = time.perf_counter()
+
+    @classmethod
+    async def create(
+        cls,
+        bot: Quotient,
+        tourney: Tourney,
+        author: discord.Member,
+        channel: discord.TextChannel,
+        plan: T.Dict[str, T.List[int]],
+        *,
+        revoke: bool = False,
+    ) -> "GroupRoleJob":
+        record = await TGroupRoleJob.create(
+            guild_id=tourney.guild_id,
+            tourney_id=tourney.id,
+            author_id=author.id,
+            channel_id=channel.id,
+            revoke=revoke,
+            plan=plan,
+            done={},
+        )
+        return cls(bot, record)
+
+    @property
+    def guild(self) -> T.Optional[discord.Guild]:
+        return self.bot.get_guild(self.record.guild_id)
+
+    @property
+    def embed(self) -> discord.Embed:
+        _r = self.record
+        _e = discord.Embed(
+            color=self.bot.color,
+            title=("Giving Group Roles:", "Removing Group Roles:")[_r.revoke],
+        )
+
+        _e.description = ""
+        for role_id, member_ids in _r.plan.items():
+            done = len(_r.done.get(role_id, ()))
+            _emoji = emote.check if done == len(member_ids) else emote.loading
+            _e.description += f"{_emoji} <@&{role_id}> `{done}/{len(member_ids)}`\n"
+
+        _e.set_footer(text=f"Processed: {_r.processed}/{_r.total} | Failed: {self.failed}")
+        return _e
+
+    async def run(self):
+        if self.record.id in GroupRoleJob.running:
+            return
+
+        GroupRoleJob.running[self.record.id] = self
+        try:
+            await self.__run()
+        finally:
+            GroupRoleJob.running.pop(self.record.id, None)
+
+    async def __run(self):
+        guild = self.guild
+        if guild is None:
+            return await self.__complete()
+
+        await self.__update_progress(force=True)
+
+        budget = GroupRoleJob.budgets[guild.id]
+        reason = "Tourney group roles ({0})".format(("given", "removed")[self.record.revoke])
+
+        async def _process(role_id: int, member_id: int):
+            async with budget:
+                member = guild.get_member(member_id)
+                role = guild.get_role(role_id)
+
+                # member already has (or doesn't have) the role, no need to hit the api.
+                skip = member is not None and role is not None and (role in member.roles) is not self.record.revoke
+
+                if role is None:
+                    self.failed += 1
+
+                elif not skip:
+                    try:
+                        if self.record.revoke:
+                            await self.bot.http.remove_role(guild.id, member_id, role_id, reason=reason)
+                        else:
+                            await self.bot.http.add_role(guild.id, member_id, role_id, reason=reason)
+                    except discord.HTTPException:
+                        self.failed += 1
+
+            self.record.done.setdefault(str(role_id), []).append(member_id)
+            self.__unsaved += 1
+            await self.__update_progress()
+
+        await asyncio.gather(*(_process(role_id, member_id) for role_id, member_id in self.record.pending()))
+        await self.__complete()
+
+    async def __save(self):
+        self.__unsaved = 0
+        await TGroupRoleJob.filter(pk=self.record.pk).update(done=self.record.done)
+
+    async def __update_progress(self, *, force: bool = False):
+        if force or self.__unsaved >= self.SAVE_EVERY:
+            await self.__save()
+
+        now = time.perf_counter()
+        if not force and now - self.__last_edit < self.EDIT_EVERY:
+            return
+
+        self.__last_edit = now
+
+        with suppress(discord.HTTPException, AttributeError):
+            if self.message is None and self.record.message_id:
+                self.message = self.record.channel.get_partial_message(self.record.message_id)
+
+            if self.message is None:
+                self.message = await self.record.channel.send(embed=self.embed)
+                self.record.message_id = self.message.id
+                return await TGroupRoleJob.filter(pk=self.record.pk).update(message_id=self.message.id)
+
+            await self.message.edit(embed=self.embed)
+
+    async def __complete(self):
+        await self.__save()
+        await TGroupRoleJob.filter(pk=self.record.pk).update(completed_at=self.bot.current_time)
+
+        _e = self.embed
+        _e.description += f"{emote.check} Done! (Time taken: `{precisedelta(time.perf_counter() - self.__started)}`)\n"
+
+        with suppress(discord.HTTPException, AttributeError):
+            if self.message is not None:
+                await self.message.edit(embed=_e)
+
+
+async def resume_group_role_jobs(bot: Quotient):
+    """Restarts every role distribution job that was interrupted by a restart."""
+    await bot.wait_until_ready()
+
+    async for record in TGroupRoleJob.filter(completed_at__isnull=True):
+        bot.loop.create_task(GroupRoleJob(bot, record).run())
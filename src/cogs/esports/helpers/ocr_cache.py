@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import typing as T
+from datetime import timedelta
+
+from lru import LRU
+
+from models import OCRResult
+
+if T.TYPE_CHECKING:
+    from core import Quotient
+
+__all__ = ("OCRCache",)
+
+
+class OCRCache:
+    """
+    Content addressed cache of OCR results.
+
+    Recently seen screenshots are kept in memory, older ones in the `ss_ocr_cache` table until TTL runs out.
+    A resubmitted (or shared) screenshot with the same bytes never reaches tesseract again.
+    """
+
+    TTL = timedelta(days=7)
+    MEMORY_SIZE = 2048
+
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+
+        self.memory: T.Dict[str, dict] = LRU(self.MEMORY_SIZE)  # sha256: result
+        self.attachments: T.Dict[int, str] = LRU(self.MEMORY_SIZE)  # attachment_id: sha256
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total * 100 if total else 0.0
+
+    def by_attachment(self, attachment_id: int) -> T.Optional[T.Tuple[str, dict]]:
+        """Result of an attachment we've already downloaded, lets us skip the download as well."""
+        if (sha := self.attachments.get(attachment_id)) and (result := self.memory.get(sha)):
+            self.hits += 1
+            return sha, result
+
+    async def get(self, sha256: str, attachment_id: T.Optional[int] = None) -> T.Optional[dict]:
+        if attachment_id:
+            self.attachments[attachment_id] = sha256
+
+        if (result := self.memory.get(sha256)) is None:
+            record = await OCRResult.get_or_none(sha256=sha256, created_at__gte=self.bot.current_time - self.TTL)
+            if record:
+                result = self.memory[sha256] = {
+                    "text": record.text,
+                    "device_info": record.device_info,
+                    "dhash": record.dhash,
+                    "phash": record.phash,
+                }
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return result
+
+    async def put(self, sha256: str, result: dict):
+        # failed decodes / ocr errors aren't worth remembering.
+        if "error" in result["device_info"]:
+            return
+
+        self.memory[sha256] = {k: result[k] for k in ("text", "device_info", "dhash", "phash")}
+        await OCRResult.update_or_create(
+            {
+                "text": result["text"],
+                "device_info": result["device_info"],
+                "dhash": result["dhash"],
+                "phash": result["phash"],
+                "created_at": self.bot.current_time,
+            },
+            sha256=sha256,
+        )
+
+    async def purge_expired(self):
+        await OCRResult.filter(created_at__lt=self.bot.current_time - self.TTL).delete()
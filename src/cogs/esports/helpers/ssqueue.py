@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import typing as T
+from collections import defaultdict
+
+__all__ = ("VerificationQueue",)
+
+
+class VerificationQueue:
+    """
+    Weighted fair queue for screenshot verification jobs.
+
+    Each job gets a virtual finish time of `max(now, guild's last finish) + cost / weight`
+    and jobs run in finish time order, so a guild flooding the queue only delays itself while
+    a guild sending its first submission goes near the front. At most `capacity` jobs run at once.
+    """
+
+    def __init__(self, capacity: int, handler: T.Callable[[T.Any], T.Awaitable[T.Any]]):
+        self.capacity = capacity
+        self.handler = handler
+
+        self.__heap: T.List[tuple] = []  # (finish, seq, start, guild_id, job)
+        self.__last_finish: T.Dict[int, float] = {}
+        self.__waiting: T.Dict[int, int] = defaultdict(int)  # guild_id: waiting jobs
+
+        self.__vtime = 0.0
+        self.__seq = itertools.count()
+        self.__slots = asyncio.Semaphore(capacity)
+        self.__ready = asyncio.Event()
+        self.__task: T.Optional[asyncio.Task] = None
+
+        self.running = 0
+
+    def __len__(self):
+        return len(self.__heap)
+
+    def waiting(self, guild_id: int) -> int:
+        return self.__waiting[guild_id]
+
+    def __tags(self, guild_id: int, weight: float, cost: float) -> T.Tuple[float, float]:
+        start = max(self.__vtime, self.__last_finish.get(guild_id, 0.0))
+        return start, start + cost / weight
+
+    def position(self, guild_id: int, *, weight: float = 1.0, cost: float = 1.0) -> int:
+        """1 based position a job put now would get."""
+        _, finish = self.__tags(guild_id, weight, cost)
+        return sum(1 for entry in self.__heap if entry[0] <= finish) + 1
+
+    def put(self, job: T.Any, guild_id: int, *, weight: float = 1.0, cost: float = 1.0):
+        start, finish = self.__tags(guild_id, weight, cost)
+        self.__last_finish[guild_id] = finish
+        self.__waiting[guild_id] += 1
+
+        heapq.heappush(self.__heap, (finish, next(self.__seq), start, guild_id, job))
+        self.__ready.set()
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        if self.__task is None or self.__task.done():
+            self.__task = loop.create_task(self.__dispatch())
+
+    def stop(self):
+        if self.__task is not None:
+            self.__task.cancel()
+
+    async def __dispatch(self):
+        while True:
+            await self.__slots.acquire()
+
+            while not self.__heap:
+                self.__ready.clear()
+                await self.__ready.wait()
+
+            _, _, start, guild_id, job = heapq.heappop(self.__heap)
+            self.__vtime = start
+
+            if (waiting := self.__waiting[guild_id] - 1) > 0:
+                self.__waiting[guild_id] = waiting
+            else:
+                self.__waiting.pop(guild_id, None)
+                if self.__last_finish.get(guild_id, 0.0) <= self.__vtime:
+                    self.__last_finish.pop(guild_id, None)
+
+            self.running += 1
+            asyncio.create_task(self.__run(job))
+
+    async def __run(self, job: T.Any):
+        try:
+            await self.handler(job)
+        except Exception as e:
+            print(f"❌ Verification job error: {e}")
+        finally:
+            self.running -= 1
+            self.__slots.release()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import re
-from contextlib import suppress
 from typing import Iterable, List, Optional
 
 import discord
@@ -96,22 +95,8 @@ async def t_ask_embed(ctx, value, description: str):
     await ctx.send(embed=embed, embed_perms=True)
 
 
-async def update_confirmed_message(tourney: Tourney, link: str):
-    _ids = [int(i) for i in link.split("/")[5:]]
-
-    message = None
-
-    with suppress(discord.HTTPException, IndexError):
-        message = await tourney.guild.get_channel(_ids[0]).fetch_message(_ids[1])
-
-        if message:
-            e = message.embeds[0]
-
-            e.description = "~~" + e.description.strip() + "~~"
-            e.title = "Cancelled Slot"
-            e.color = discord.Color.red()
-
-            await message.edit(embed=e)
+async def update_confirmed_message(tourney: Tourney, link: str, *jump_urls: str):
+    await tourney.update_confirmed_message(link, *jump_urls)
 
 
 async def get_tourney_from_channel(guild_id: int, channel_id: int) -> Optional[Tourney]:
@@ -510,10 +510,12 @@ class AutocleanMenu(menus.Menu):
         clean_time = await inputs.time_input(self.ctx, self.check, delete_after=True)
         await inputs.safe_delete(msg)
 
-        await self.bot.get_cog("Reminders").create_timer(
+        await self.bot.get_cog("Reminders").set_schedule(
             clean_time,
             "autoclean",
+            self.scrim.id,
             scrim_id=self.scrim.id,
+            guild_id=self.scrim.guild_id,
         )
         await Scrim.filter(pk=self.scrim.id).update(autoclean_time=clean_time)
         await self.refresh()
@@ -728,10 +730,12 @@ class ConfigEditMenu(menus.Menu):
         open_time = await inputs.time_input(self.ctx, self.check, delete_after=True)
         await inputs.safe_delete(msg)
 
-        await self.bot.get_cog("Reminders").create_timer(
+        await self.bot.get_cog("Reminders").set_schedule(
             open_time,
             "scrim_open",
+            self.scrim.id,
             scrim_id=self.scrim.id,
+            guild_id=self.scrim.guild_id,
         )
 
         await self.update_scrim(open_time=open_time)
@@ -209,7 +209,13 @@ class ScrimsSlash(commands.GroupCog, name="scrims"):
         await scrim.reserved_slots.add(slot)
         if expires and user_id:
             await scrim.bot.reminders.create_timer(
-                expires, "scrim_reserve", scrim_id=scrim.id, user_id=user_id, team_name=team_name, num=num
+                expires,
+                "scrim_reserve",
+                scrim_id=scrim.id,
+                user_id=user_id,
+                team_name=team_name,
+                num=num,
+                guild_id=scrim.guild_id,
             )
 
     async def parse_datetime(self, interaction: discord.Interaction, time: str) -> datetime:
@@ -347,8 +353,12 @@ class ScrimsSlash(commands.GroupCog, name="scrims"):
                 ephemeral=True,
             )
         await scrim.save()
-        await self.bot.reminders.create_timer(scrim.open_time, "scrim_open", scrim_id=scrim.id)
-        await self.bot.reminders.create_timer(scrim.autoclean_time, "autoclean", scrim_id=scrim.id)
+        await self.bot.reminders.set_schedule(
+            scrim.open_time, "scrim_open", scrim.id, scrim_id=scrim.id, guild_id=scrim.guild_id
+        )
+        await self.bot.reminders.set_schedule(
+            scrim.autoclean_time, "autoclean", scrim.id, scrim_id=scrim.id, guild_id=scrim.guild_id
+        )
 
         e = discord.Embed(
             color=discord.Color.green(),
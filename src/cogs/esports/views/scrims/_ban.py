@@ -112,7 +112,7 @@ class Ban(ScrimsButton):
                 while self.view.bot.current_time > expires:
                     expires = expires + timedelta(hours=24)
 
-        count = 0
+        count, timers = 0, []
         for user_id in user_ids:
             if await self.view.record.banned_teams.filter(user_id=user_id).exists():
                 continue
@@ -124,16 +124,24 @@ class Ban(ScrimsButton):
                 await banlog.log_ban(user_id, interaction.user, [self.view.record], modal.m_reason.value, expires)
 
             if expires:
-                await self.view.bot.reminders.create_timer(
-                    expires,
-                    "scrim_ban",
-                    scrims=[self.view.record.id],
-                    user_id=user_id,
-                    mod=interaction.user.id,
-                    reason=modal.m_reason.value,
+                timers.append(
+                    (
+                        expires,
+                        "scrim_ban",
+                        {
+                            "scrims": [self.view.record.id],
+                            "user_id": user_id,
+                            "mod": interaction.user.id,
+                            "reason": modal.m_reason.value,
+                        },
+                        self.view.record.guild_id,
+                    )
                 )
             count += 1
 
+        if timers:
+            await self.view.bot.reminders.create_timers_bulk(timers)
+
         await self.view.ctx.success(f"Successfuly banned `{plural(count):user|users}` from {self.view.record}.", 6)
         return await self.view.refresh_view()
 
@@ -446,10 +446,20 @@ class SaveScrim(ScrimsButton):
 
         await self.view.record.save()
 
-        await self.ctx.bot.reminders.create_timer(self.view.record.open_time, "scrim_open", scrim_id=self.view.record.id)
+        await self.ctx.bot.reminders.set_schedule(
+            self.view.record.open_time,
+            "scrim_open",
+            self.view.record.id,
+            scrim_id=self.view.record.id,
+            guild_id=self.view.record.guild_id,
+        )
 
-        await self.ctx.bot.reminders.create_timer(
-            self.view.record.autoclean_time, "autoclean", scrim_id=self.view.record.id
+        await self.ctx.bot.reminders.set_schedule(
+            self.view.record.autoclean_time,
+            "autoclean",
+            self.view.record.id,
+            scrim_id=self.view.record.id,
+            guild_id=self.view.record.guild_id,
         )
 
         self.view.stop()
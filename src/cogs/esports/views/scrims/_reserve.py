@@ -133,7 +133,13 @@ class NewReserve(ScrimsButton):
             await self.view.record.reserved_slots.add(slot)
             if expire and owner_id:
                 await self.ctx.bot.reminders.create_timer(
-                    expire, "scrim_reserve", scrim_id=self.view.record.id, user_id=owner_id, team_name=team_name, num=num
+                    expire,
+                    "scrim_reserve",
+                    scrim_id=self.view.record.id,
+                    user_id=owner_id,
+                    team_name=team_name,
+                    num=num,
+                    guild_id=self.view.record.guild_id,
                 )
 
         await self.view.refresh_view()
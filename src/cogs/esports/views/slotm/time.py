@@ -63,7 +63,9 @@ class MatchTimeEditor(discord.ui.Button):
 
                 scrim = await Scrim.get_or_none(guild_id=self.ctx.guild.id, registration_channel_id=_c.id)
                 if scrim:
-                    await self.ctx.bot.reminders.create_timer(parsed, "scrim_match", scrim_id=scrim.id)
+                    await self.ctx.bot.reminders.set_schedule(
+                        parsed, "scrim_match", scrim.id, scrim_id=scrim.id, guild_id=scrim.guild_id
+                    )
                     await Scrim.filter(pk=scrim.pk).update(match_time=parsed)
 
         await interaction.followup.send(f"{emote.check} Done, click Match-Time button to see changes.", ephemeral=True)
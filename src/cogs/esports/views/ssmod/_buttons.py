@@ -245,5 +245,6 @@ class SaveButton(discord.ui.Button):
 
         await self.view.record.save()
         self.ctx.bot.cache.ssverify_channels.add(self.view.record.channel_id)
+        self.ctx.bot.cache.publish("ssverify_changed", self.view.record.channel_id)
         await self.view.on_timeout()
         await self.ctx.success(f"Successfully set ssverification in {self.view.record.channel.mention}.", 3)
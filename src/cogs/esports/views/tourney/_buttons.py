@@ -307,6 +307,72 @@ class DuplicateTags(TourneyButton):
         await self.view.refresh_view()
 
 
+class ConfirmFeedMode(TourneyButton):
+    def __init__(self, ctx: Context, letter: str):
+        super().__init__(emoji=ri(letter))
+
+        self.ctx = ctx
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+
+        # Off -> Batched -> Batched (Webhook) -> Off
+        record = self.view.record
+        if not record.confirm_feed:
+            record.confirm_feed, record.confirm_webhook = True, False
+
+        elif not record.confirm_webhook:
+            record.confirm_webhook = True
+
+        else:
+            record.confirm_feed, record.confirm_webhook = False, False
+
+        await self.ctx.success(
+            "Confirm messages will now be sent "
+            + (
+                "**one per registration**.",
+                "**in batches of upto 10 registrations**.",
+                "**in batches of upto 10 registrations through a webhook**.",
+            )[record.confirm_feed + record.confirm_webhook],
+            3,
+        )
+        await self.view.refresh_view()
+
+
+class RenumberOnCancel(TourneyButton):
+    def __init__(self, ctx: Context, letter: str):
+        super().__init__(emoji=ri(letter))
+
+        self.ctx = ctx
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+
+        self.view.record.renumber_on_cancel = not self.view.record.renumber_on_cancel
+        await self.ctx.success(
+            f"Slots **{'will' if self.view.record.renumber_on_cancel else 'will not'}** be renumbered when a registration is cancelled.",
+            3,
+        )
+        await self.view.refresh_view()
+
+
+class ReopenOnCancel(TourneyButton):
+    def __init__(self, ctx: Context, letter: str):
+        super().__init__(emoji=ri(letter))
+
+        self.ctx = ctx
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+
+        self.view.record.reopen_on_cancel = not self.view.record.reopen_on_cancel
+        await self.ctx.success(
+            f"Registrations **{'will' if self.view.record.reopen_on_cancel else 'will not'}** reopen automatically when a slot is cancelled after the tourney got full.",
+            3,
+        )
+        await self.view.refresh_view()
+
+
 class DuplicateTeamName(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
         super().__init__(emoji=ri(letter))
@@ -14,6 +14,7 @@ from ._base import TourneyView
 from ._buttons import (
     AutodeleteRejected,
     ConfirmChannel,
+    ConfirmFeedMode,
     DeleteTourney,
     DiscardButton,
     DuplicateTags,
@@ -22,6 +23,8 @@ from ._buttons import (
     MultiReg,
     OpenRole,
     RegChannel,
+    RenumberOnCancel,
+    ReopenOnCancel,
     SetEmojis,
     SetGroupSize,
     SetMentions,
@@ -94,6 +97,11 @@ class TourneyEditor(TourneyView):
             f"Duplicate / Fake Tags {self.bot.config.PRIME_EMOJI}": ("`Not allowed!`", "`Allowed`")[
                 tourney.allow_duplicate_tags
             ],
+            "Confirm Messages": ("`One per slot`", "`Batched`", "`Batched (Webhook)`")[
+                tourney.confirm_feed + tourney.confirm_webhook
+            ],
+            "Renumber on Cancel": ("`No!`", "`Yes!`")[tourney.renumber_on_cancel],
+            "Reopen on Cancel": ("`No!`", "`Yes!`")[tourney.reopen_on_cancel],
         }
 
         for idx, (name, value) in enumerate(fields.items()):
@@ -136,5 +144,8 @@ class TourneyEditor(TourneyView):
         self.add_item(SetGroupSize(ctx, "o"))
         self.add_item(MinLines(ctx, "p"))
         self.add_item(DuplicateTags(ctx, "q"))
+        self.add_item(ConfirmFeedMode(ctx, "r"))
+        self.add_item(RenumberOnCancel(ctx, "s"))
+        self.add_item(ReopenOnCancel(ctx, "t"))
         self.add_item(DeleteTourney(ctx))
         self.add_item(DiscardButton(ctx))
@@ -1,20 +1,17 @@
 from __future__ import annotations
 
-from datetime import datetime
 from typing import TYPE_CHECKING, List
 
 from models import Guild, Tourney
 
+from ...helpers.groups import GroupRoleJob, build_group_role_plan
 from ...views.base import EsportsBaseView
 
 if TYPE_CHECKING:
     from core import Quotient
 
-import asyncio
-
 import discord
 from discord.ext import commands
-from humanize import precisedelta
 
 import config
 from core import Context
@@ -38,6 +35,7 @@ class TourneyGroupManager(EsportsBaseView):
             f"**Group Size: `{size}`**\n\n"
             "• Click `Publish` to send group embeds in a channel.\n"
             "• Click `Give Roles` to provide group roles to team leaders.\n"
+            "• Click `Remove Roles` to take group roles back from everyone.\n"
         )
 
         return e
@@ -119,64 +117,71 @@ class TourneyGroupManager(EsportsBaseView):
                     delete_after=10,
                 )
 
-        _e = discord.Embed(
-            color=self.bot.color,
-            title="Giving Group Roles:",
-            description=f"{emote.check} Starting the role distribution!\n",
-        )
-
-        m: discord.Message = await self.ctx.send(embed=_e)
-
-        _t = datetime.now()
-
+        roles = {}
         for _group in _split:
             group, role = _group.strip().strip(",").split(",")
             group = int(group)
 
             try:
                 role = await QuoRole().convert(self.ctx, role := role.strip())
-                _e.description += f"{emote.check} {role.mention} Found...\n"
-                await m.edit(embed=_e)
-
                 if not role < self.ctx.guild.me.top_role:
-                    _e.description += f"{emote.error} Skipping {role.mention}, because it is above my highest role ({self.ctx.guild.me.top_role.mention}).\n"
-                    await m.edit(embed=_e)
+                    await self.error_embed(
+                        f"Skipping {role.mention}, because it is above my highest role ({self.ctx.guild.me.top_role.mention}).",
+                        delete_after=5,
+                    )
                     continue
 
             except commands.RoleNotFound:
-                _e.description += f"{emote.xmark} {role} Not Found, Creating new role..\n"
                 role = await self.ctx.guild.create_role(name=role, reason=f"Created by {self.ctx.author} for grouping")
 
-            _e.description += f"{emote.check} {role.mention} Assigning to team leaders of Group {group}\n"
-            await m.edit(embed=_e)
+            roles[group] = role
+
+        plan = await build_group_role_plan(self.tourney, self.size, roles)
+        if not any(plan.values()):
+            return await self.error_embed("All of the given groups are empty.")
 
-            actual_group = await self.tourney.get_group(group, self.size)
+        job = await GroupRoleJob.create(self.bot, self.tourney, self.ctx.author, self.ctx.channel, plan)
+        await job.run()
 
+    @discord.ui.button(custom_id="remove_group_roles", label="Remove Roles")
+    async def remove_group_roles(self, interaction: discord.Interaction, button: discord.Button):
+        await interaction.response.defer(ephemeral=True)
+
+        if not self.ctx.guild.me.guild_permissions.manage_roles:
+            return await self.error_embed(
+                "Kindly give me `manage_roles` permission and move my role above your group roles."
+            )
+
+        m = await self.ask_embed(
+            "Mention the group roles (or write their names, one per line) that you want to remove from everyone.\n\n"
+            "**Example:**```@group_role\nGroup role\n@3rd_group```"
+        )
+
+        _roleinfo = await inputs.string_input(self.ctx, self.check, delete_after=True)
+        await self.ctx.safe_delete(m)
+
+        if (_roleinfo := _roleinfo.strip()) == "cancel":
+            return
+
+        plan = {}
+        for _role in _roleinfo.split("\n"):
             try:
-                counter = 0
-                for _slot in actual_group:
-                    member = self.ctx.guild.get_member(_slot.leader_id)
-                    if member:
-                        counter += 1
-                        if not role in member.roles:
-                            self.bot.loop.create_task(
-                                member.add_roles(role, reason=f"Given by {self.ctx.author} for tourney grouping")
-                            )
-
-                _e.description += f"{emote.check} {counter} people are given {role.mention}\n"
-                await m.edit(embed=_e)
-                counter = 0
-
-            except TypeError:
-                _e.description += f"{emote.xmark} Group {group} is empty.\n"
-                await m.edit(embed=_e)
-                continue
-
-            await asyncio.sleep(0.6)
-
-        _e.description += f"{emote.check} Done! (Time taken: `{precisedelta(datetime.now()-_t)}`)\n"
-        await m.edit(embed=_e)
-        await self.ctx.safe_delete(m, 10)
+                role = await QuoRole().convert(self.ctx, _role.strip())
+            except commands.RoleNotFound:
+                return await self.error_embed(f"Role `{_role.strip()}` not found.", delete_after=5)
+
+            if not role < self.ctx.guild.me.top_role:
+                return await self.error_embed(
+                    f"{role.mention} is above my highest role ({self.ctx.guild.me.top_role.mention}).", delete_after=5
+                )
+
+            plan[str(role.id)] = [member.id for member in role.members]
+
+        if not any(plan.values()):
+            return await self.error_embed("Nobody has these roles.")
+
+        job = await GroupRoleJob.create(self.bot, self.tourney, self.ctx.author, self.ctx.channel, plan, revoke=True)
+        await job.run()
 
 
 class GroupListView(EsportsBaseView):
@@ -241,6 +241,7 @@ class TourneyManager(EsportsBaseView):
 
             await slot.save()
             await tourney.assigned_slots.add(slot)
+            self.bot.cache.add_partner_registration(tourney.id, slot.leader_id, slot.members)
 
             await leader.add_roles(tourney.role)
 
@@ -110,7 +110,7 @@ class TourneySlotManager(discord.ui.View):
                 return await interaction.followup.send(embed=self.red_embed("Slot is already deleted."), ephemeral=True)
 
             if slot.confirm_jump_url:
-                self.bot.loop.create_task(update_confirmed_message(self.tourney, slot.confirm_jump_url))
+                self.bot.loop.create_task(update_confirmed_message(self.tourney, slot.confirm_jump_url, slot.jump_url))
 
             if len(_slots) == 1:
                 member = interaction.guild.get_member(slot.leader_id)
@@ -118,6 +118,7 @@ class TourneySlotManager(discord.ui.View):
                     self.bot.loop.create_task(member.remove_roles(self.tourney.role))
 
             await TMSlot.filter(pk=slot.id).delete()
+            await self.bot.cache.refresh_partner_registrations(self.tourney.id)
             return await interaction.followup.send(f"{emote.check} | Your slot was removed.", ephemeral=True)
 
     @discord.ui.button(style=discord.ButtonStyle.green, custom_id="tourney-slot-info", label="My Groups")
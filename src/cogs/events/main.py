@@ -11,7 +11,6 @@ from contextlib import suppress
 
 import discord
 
-import config
 from constants import random_greeting
 from core import Cog, Context, cooldown
 from models import Guild
@@ -33,11 +32,7 @@ class MainEvents(Cog, name="Main Events"):
     async def on_guild_join(self, guild: discord.Guild) -> None:
         with suppress(AttributeError):
             g, b = await Guild.get_or_create(guild_id=guild.id)
-            self.bot.cache.guild_data[guild.id] = {
-                "prefix": g.prefix,
-                "color": g.embed_color or self.bot.color,
-                "footer": g.embed_footer or config.FOOTER,
-            }
+            self.bot.cache.set_guild_settings(guild.id, g.prefix, g.embed_color, g.embed_footer)
             self.bot.loop.create_task(guild.chunk())
 
     @Cog.listener()
@@ -54,7 +49,7 @@ class MainEvents(Cog, name="Main Events"):
 
     @Cog.listener()
     async def on_mention(self, ctx: Context) -> None:
-        prefix: str = self.bot.cache.guild_data[ctx.guild.id].get("prefix", "N")
+        prefix: str = self.bot.cache.guild_prefix(ctx.guild.id)
         await ctx.send(
             f"{random_greeting()} You seem lost. Are you?\n"
             f"Current prefix for this server is: `{prefix}`.\n\nUse it like: `{prefix}help`"
@@ -654,9 +654,6 @@ class PremiumCog(Cog, name="Premium"):
         """
         await Guild.filter(guild_id=ctx.guild.id).update(welcome_channel=channel.id)
         
-        if ctx.guild.id in self.bot.cache.guild_data:
-            self.bot.cache.guild_data[ctx.guild.id]["welcome_channel"] = channel.id
-        
         embed = discord.Embed(
             color=discord.Color.green(),
             description=f"{emote.check} Welcome channel set to {channel.mention}\n\nNew members will be welcomed there automatically!"
@@ -695,9 +692,6 @@ class PremiumCog(Cog, name="Premium"):
             if msg.content.lower() == 'reset':
                 await Guild.filter(guild_id=ctx.guild.id).update(welcome_banner=None)
                 
-                if ctx.guild.id in self.bot.cache.guild_data:
-                    self.bot.cache.guild_data[ctx.guild.id]["welcome_banner"] = None
-                
                 return await ctx.success(f"{emote.check} Welcome banner reset to default!")
             
             banner_url = None
@@ -718,9 +712,6 @@ class PremiumCog(Cog, name="Premium"):
             
             await Guild.filter(guild_id=ctx.guild.id).update(welcome_banner=banner_url)
             
-            if ctx.guild.id in self.bot.cache.guild_data:
-                self.bot.cache.guild_data[ctx.guild.id]["welcome_banner"] = banner_url
-            
             preview_embed = discord.Embed(
                 color=discord.Color.green(),
                 description=f"{emote.check} Custom welcome banner set successfully!\n\nPreview:"
@@ -737,9 +728,6 @@ class PremiumCog(Cog, name="Premium"):
         """Disable welcome system for the server."""
         await Guild.filter(guild_id=ctx.guild.id).update(welcome_channel=None)
         
-        if ctx.guild.id in self.bot.cache.guild_data:
-            self.bot.cache.guild_data[ctx.guild.id]["welcome_channel"] = None
-        
         await ctx.success(f"{emote.check} Welcome system has been disabled!")
 
     @welcome.command(name="status")
@@ -953,20 +941,24 @@ class PremiumCog(Cog, name="Premium"):
         await self.bot.wait_until_ready()
         await asyncio.sleep(900)
         
+        timers = []
         async for user in User.filter(is_premium=True, premium_expire_time__lte=datetime.now(tz=IST) + timedelta(days=4)):
             _u = await self.bot.getch(self.bot.get_user, self.bot.fetch_user, user.pk)
             if _u:
                 if not await self.ensure_reminders(user.pk, user.premium_expire_time):
-                    await self.bot.reminders.create_timer(user.premium_expire_time, "user_premium", user_id=user.pk)
+                    timers.append((user.premium_expire_time, "user_premium", {"user_id": user.pk}))
                 await remind_user_to_pay(_u, user)
 
         async for guild in Guild.filter(is_premium=True, premium_end_time__lte=datetime.now(IST) + timedelta(days=4)):
             _g = self.bot.get_guild(guild.pk)
             if not await self.ensure_reminders(guild.pk, guild.premium_end_time):
-                await self.bot.reminders.create_timer(guild.premium_end_time, "guild_premium", guild_id=guild.pk)
+                timers.append((guild.premium_end_time, "guild_premium", {"guild_id": guild.pk}))
             if _g:
                 await remind_guild_to_pay(_g, guild)
 
+        if timers:
+            await self.bot.reminders.create_timers_bulk(timers)
+
     async def ensure_reminders(self, _id: int, _time: datetime) -> bool:
         return await Timer.filter(
             Q(event="guild_premium", extra={"args": [], "kwargs": {"guild_id": _id}})
@@ -986,7 +978,7 @@ class PremiumCog(Cog, name="Premium"):
             return
 
         _perks = "\n".join(await extra_guild_perks(guild_id))
-        await deactivate_premium(guild_id)
+        await deactivate_premium(self.bot, guild_id)
 
         if (_ch := _g.private_ch) and _ch.permissions_for(_ch.guild.me).embed_links:
             _e = discord.Embed(
@@ -3,6 +3,9 @@ from __future__ import annotations
 import typing
 from contextlib import suppress
 
+if typing.TYPE_CHECKING:
+    from core import Quotient
+
 import discord
 
 import config
@@ -12,8 +15,9 @@ from utils import discord_timestamp, plural
 from .views import PremiumView
 
 
-async def deactivate_premium(guild_id: int):
+async def deactivate_premium(bot: Quotient, guild_id: int):
     await Guild.filter(guild_id=guild_id).update(embed_color=config.COLOR, embed_footer=config.FOOTER, is_premium=False)
+    await bot.cache.changed("guild_settings_changed", guild_id)
 
     _s: typing.List[Scrim] = (await Scrim.filter(guild_id=guild_id).order_by("id"))[3:]
     await Scrim.filter(id__in=(s.pk for s in _s)).delete()
@@ -27,6 +31,16 @@ async def deactivate_premium(guild_id: int):
     _ez: typing.List[EasyTag] = (await EasyTag.filter(guild_id=guild_id).order_by("id"))[1:]
     await EasyTag.filter(id__in=(e.pk for e in _ez)).delete()
 
+    # deleted in bulk, so the cache (ours and the other processes') is updated here.
+    for s in _s:
+        await bot.cache.changed("scrim_changed", s.pk, channel_id=s.registration_channel_id)
+    for t in _t:
+        await bot.cache.changed("tourney_changed", t.pk, channel_id=t.registration_channel_id)
+    for t in _tc:
+        await bot.cache.changed("tagcheck_changed", t.channel_id)
+    for e in _ez:
+        await bot.cache.changed("easytag_changed", e.channel_id)
+
     await Tourney.filter(guild_id=guild_id).update(emojis={})
 
     ssverify = await SSVerify.filter(guild_id=guild_id)
@@ -186,14 +186,15 @@ class Quomisc(Cog, name="quomisc"):
         """Change your server's prefix"""
 
         if not new_prefix:
-            prefix = self.bot.cache.guild_data[ctx.guild.id].get("prefix", "x")
+            prefix = self.bot.cache.guild_prefix(ctx.guild.id)
             return await ctx.simple(f"Prefix for this server is `{prefix}`")
 
         if len(new_prefix) > 5:
             return await ctx.error(f"Prefix cannot contain more than 5 characters.")
 
-        self.bot.cache.guild_data[ctx.guild.id]["prefix"] = new_prefix
+        self.bot.cache.update_guild_settings(ctx.guild.id, prefix=new_prefix)
         await Guild.filter(guild_id=ctx.guild.id).update(prefix=new_prefix)
+        self.bot.cache.publish("guild_settings_changed", ctx.guild.id)
         await ctx.success(f"Updated server prefix to: `{new_prefix}`")
 
     @commands.command()
@@ -203,8 +204,9 @@ class Quomisc(Cog, name="quomisc"):
         """Change color of ScrimX's embeds"""
         color = int(str(new_color).replace("#", ""), 16)  # The hex value of a color.
 
-        self.bot.cache.guild_data[ctx.guild.id]["color"] = color
+        self.bot.cache.update_guild_settings(ctx.guild.id, color=color)
         await Guild.filter(guild_id=ctx.guild.id).update(embed_color=color)
+        self.bot.cache.publish("guild_settings_changed", ctx.guild.id)
         await ctx.success(f"Updated server color.")
     @commands.command()
     async def credits(self, ctx: Context):
@@ -270,8 +272,9 @@ class Quomisc(Cog, name="quomisc"):
         if len(new_footer) > 50:
             return await ctx.success(f"Footer cannot contain more than 50 characters.")
 
-        self.bot.cache.guild_data[ctx.guild.id]["footer"] = new_footer
+        self.bot.cache.update_guild_settings(ctx.guild.id, footer=new_footer)
         await Guild.filter(guild_id=ctx.guild.id).update(embed_footer=new_footer)
+        self.bot.cache.publish("guild_settings_changed", ctx.guild.id)
         await ctx.send(f"Updated server footer.")
 
 async def setup(bot: Quotient) -> None:
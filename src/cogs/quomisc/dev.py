@@ -45,6 +45,7 @@ class Dev(Cog):
 
         await BlockList.create(block_id=block_id, block_id_type=block_id_type, reason=reason)
         self.bot.cache.blocked_ids.add(block_id)
+        self.bot.cache.publish("blocklist_changed", block_id)
         await ctx.success(f"{item} has been blocked.")
 
     @bl.command(name="remove")
@@ -58,6 +59,7 @@ class Dev(Cog):
 
         await record.delete()
         self.bot.cache.blocked_ids.remove(block_id)
+        self.bot.cache.publish("blocklist_changed", block_id)
         await ctx.success(f"{item} has been unblocked.")
 
     @commands.command(hidden=True)
@@ -6,76 +6,289 @@ if typing.TYPE_CHECKING:
     from core import Quotient
 
 import asyncio
-from datetime import datetime, timedelta
+import itertools
+import json
+import time
+from datetime import datetime
 
 import asyncpg
 import discord
 
 from core import Cog
-from models import Timer
+from models import Schedule, Timer
 from utils import IST
 
+from .cluster import BULK_INSERT_TIMERS, CLAIM_TIMERS, NOTIFY_CHANNEL, ShardAffinity
+from .journal import TimerJournal
+from .wheel import TimingWheel
+
 
 class Reminders(Cog):
     """Reminders to do something."""
 
+    PRELOAD_WINDOW = 600  # seconds of upcoming timers held in the wheel
+    PRELOAD_MARGIN = 60  # load the next window this early
+    DISPATCH_CONCURRENCY = 50  # timer listeners running at once
+    BULK_INSERT_CHUNK = 10000  # rows per insert in create_timers_bulk
+    HOUSEKEEPING_INTERVAL = 6 * 60 * 60
+
+    CLAIM_QUERY = CLAIM_TIMERS
+
+    # moves each due schedule to its first occurrence after now, returning the time it fired for.
+    CLAIM_SCHEDULES_QUERY = """
+    UPDATE schedule s SET next_fire = s.next_fire + MAKE_INTERVAL(
+        secs => s.period * (FLOOR(EXTRACT(EPOCH FROM $2::TIMESTAMPTZ - s.next_fire) / s.period) + 1)
+    )
+    FROM (
+        SELECT id, next_fire FROM schedule WHERE id = ANY($1::BIGINT[]) AND next_fire <= $2 FOR UPDATE SKIP LOCKED
+    ) due
+    WHERE s.id = due.id
+    RETURNING s.*, due.next_fire AS fired
+    """
+
+    BULK_INSERT_QUERY = BULK_INSERT_TIMERS
+
+    UPSERT_SCHEDULE_QUERY = """
+    INSERT INTO schedule (event, key, period, next_fire, extra, guild_id) VALUES ($1, $2, $3, $4, $5::JSONB, $6)
+    ON CONFLICT (event, key) DO UPDATE
+        SET period = EXCLUDED.period, next_fire = EXCLUDED.next_fire, extra = EXCLUDED.extra, guild_id = EXCLUDED.guild_id
+    RETURNING id
+    """
+
     def __init__(self, bot: Quotient):
         self.bot = bot
-        self._have_data = asyncio.Event()
-        self._current_timer = None
+
+        self.wheel = TimingWheel()
+        self._scheduled: typing.Set[typing.Any] = set()  # timer ids and (schedule id, fire time) in the wheel
+        self._loaded_until = 0.0  # timestamp up to which db timers are in the wheel
+
+        # memory tier: short timers never touch the db, they get negative ids in the same wheel.
+        self.short_threshold: float = getattr(bot.config, "SHORT_TIMER_THRESHOLD", 120)
+        self._memory: typing.Dict[int, Timer] = {}
+        self._memory_ids = itertools.count(-1, -1)
+
+        self.journal: typing.Optional[TimerJournal] = None
+        if path := getattr(bot.config, "TIMER_JOURNAL", None):
+            self.journal = TimerJournal(path)
+            self.__replay_journal()
+
+        # clustered mode: with only some shards in this process, only their timers are loaded and claimed.
+        self.affinity: typing.Optional[ShardAffinity] = None
+        if bot.shard_ids is not None and bot.shard_count:
+            self.affinity = ShardAffinity(bot.shard_ids, bot.shard_count)
+
+        self._listener: typing.Optional[asyncpg.Connection] = None
+
+        self._dispatch_sem = asyncio.Semaphore(self.DISPATCH_CONCURRENCY)
         self._task = bot.loop.create_task(self.dispatch_timers())
+        self._housekeeping = bot.loop.create_task(self.housekeeping())
 
     def cog_unload(self):
         self._task.cancel()
+        self._housekeeping.cancel()
+        if self.journal:
+            self.journal.close()
+
+        if self._listener is not None:
+            self.bot.loop.create_task(self.bot.db.release(self._listener))
+
+    def __replay_journal(self):
+        for entry in self.journal.load():
+            self._add_memory_timer(
+                Timer(
+                    expires=datetime.fromtimestamp(entry["expires"], tz=IST),
+                    created=datetime.fromtimestamp(entry["created"], tz=IST),
+                    event=entry["event"],
+                    extra=entry["extra"],
+                ),
+                journal=False,
+            )
+
+        # the old ids are gone, rewrite the file with the new ones.
+        self.journal.compact()
+
+    def _add_memory_timer(self, timer: Timer, *, journal: bool = True) -> bool:
+        timer.id = next(self._memory_ids)
+        if not self.wheel.add(timer.expires.timestamp(), timer.id):
+            return False
 
-    async def get_active_timer(self, *, days=7):
-        return await Timer.filter(expires__lte=datetime.now(tz=IST) + timedelta(days=days)).order_by("expires").first()
+        self._memory[timer.id] = timer
 
-    async def wait_for_active_timers(self, *, days=7):
-        timer = await self.get_active_timer(days=days)
-        if timer is not None:
-            self._have_data.set()
-            return timer
+        if self.journal:
+            entry = {
+                "id": timer.id,
+                "expires": timer.expires.timestamp(),
+                "created": timer.created.timestamp(),
+                "event": timer.event,
+                "extra": timer.extra,
+            }
+            if journal:
+                self.journal.add(entry)
+            else:
+                self.journal.pending[timer.id] = entry
 
-        self._have_data.clear()
-        self._current_timer = None
-        await self._have_data.wait()
-        return await self.get_active_timer(days=days)
+        return True
 
-    async def call_timer(self, timer: Timer):
-        # delete the timer
-        deleted = await Timer.filter(pk=timer.id, expires=timer.expires).delete()
+    def _schedule(self, timer_id: int, expires: datetime):
+        if timer_id not in self._scheduled:
+            self._scheduled.add(timer_id)
+            self.wheel.add(expires.timestamp(), timer_id)
 
-        if deleted == 0:  # Probably a task is already deleted or its expire time changed.
+    def _schedule_recurring(self, schedule_id: int, next_fire: datetime):
+        # keyed by fire time too, a schedule moved while in the wheel just leaves a stale item that claims nothing.
+        if (item := (schedule_id, next_fire.timestamp())) not in self._scheduled:
+            self._scheduled.add(item)
+            self.wheel.add(item[1], item)
+
+    async def listen(self):
+        """Other processes NOTIFY us about timers they created for our shards, instead of us polling for them."""
+        con = await self.bot.db.acquire()
+        await con.add_listener(NOTIFY_CHANNEL, self._on_notify)
+        con.add_termination_listener(self._on_listener_lost)
+        self._listener = con
+
+    def _on_listener_lost(self, con: asyncpg.Connection):
+        # anything notified meanwhile is missed, reload the window once listening again.
+        self._listener = None
+        self._loaded_until = 0.0
+
+    def _on_notify(self, con: asyncpg.Connection, pid: int, channel: str, payload: str):
+        if not (data := self.affinity.parse(payload)) or data["expires"] > self._loaded_until:
             return
 
-        # dispatch the event
-        event_name = f"{timer.event}_timer_complete"
-        self.bot.dispatch(event_name, timer)
+        when = datetime.fromtimestamp(data["expires"], tz=IST)
+        if data["kind"] == "schedule":
+            self._schedule_recurring(data["id"], when)
+        else:
+            self._schedule(data["id"], when)
+
+    def _owned(self, guild_id: typing.Optional[int]) -> bool:
+        return self.affinity is None or self.affinity.owns(guild_id)
+
+    async def _notify_owner(self, kind: str, row_id: int, when: datetime, guild_id: typing.Optional[int]):
+        # the owner picks anything later up with its next preload.
+        if when.timestamp() <= time.time() + self.PRELOAD_WINDOW:
+            payload = ShardAffinity.notification(kind, row_id, when.timestamp(), guild_id)
+            await self.bot.db.execute("SELECT pg_notify($1, $2)", NOTIFY_CHANNEL, payload)
+
+    def _guild_of(self, kwargs: dict) -> typing.Optional[int]:
+        """The guild a timer is for, from its kwargs."""
+        if guild_id := kwargs.get("guild_id"):
+            return guild_id
+
+        if (channel_id := kwargs.get("channel_id")) and (channel := self.bot.get_channel(channel_id)):
+            return getattr(channel.guild, "id", None)
+
+        return None
+
+    async def preload(self):
+        """Puts every timer expiring in the next window (and any overdue one) in the wheel, in one query."""
+        # moved forward before the query, so timers created meanwhile go straight into the wheel.
+        start, self._loaded_until = self._loaded_until, time.time() + self.PRELOAD_WINDOW
+
+        args = [datetime.fromtimestamp(start, tz=IST), datetime.fromtimestamp(self._loaded_until, tz=IST)]
+        owned = ""
+        if self.affinity:
+            owned = f" AND {self.affinity.condition(3)}"
+            args.extend(self.affinity.args)
 
-    async def dispatch_timers(self):
         try:
-            while not self.bot.is_closed():
-                timer = self._current_timer = await self.wait_for_active_timers(days=40)
+            timers = await self.bot.db.fetch(
+                f"SELECT id, expires FROM timer WHERE expires > $1 AND expires <= $2{owned}", *args
+            )
+            schedules = await self.bot.db.fetch(
+                f"SELECT id, next_fire FROM schedule WHERE next_fire > $1 AND next_fire <= $2{owned}", *args
+            )
+        except Exception:
+            self._loaded_until = start
+            raise
 
-                now = datetime.now(tz=IST)
+        for record in timers:
+            self._schedule(record["id"], record["expires"])
 
-                # print(now, timer.expires)
+        for record in schedules:
+            self._schedule_recurring(record["id"], record["next_fire"])
 
-                if timer.expires >= now:
-                    to_sleep = (timer.expires - now).total_seconds()
-                    # print(to_sleep)
-                    await asyncio.sleep(to_sleep)
+    async def claim(self, timer_ids: typing.List[int]):
+        """Deletes the due timers in one go, only rows we actually deleted get dispatched."""
+        for record in await self.bot.db.fetch(self.CLAIM_QUERY, timer_ids):
+            self.call_timer(Timer._init_from_db(**record))
 
-                await self.call_timer(timer)
-        except (OSError, discord.ConnectionClosed, asyncpg.PostgresConnectionError):
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
+    async def claim_schedules(self, schedule_ids: typing.List[int]):
+        """
+        Advances the due schedules in place and dispatches one timer per schedule. Occurrences missed
+        while nobody claimed them are coalesced into it, its `expires` is the earliest of them.
+        """
+        for record in await self.bot.db.fetch(self.CLAIM_SCHEDULES_QUERY, schedule_ids, datetime.now(tz=IST)):
+            schedule = Schedule._init_from_db(**{k: v for k, v in record.items() if k != "fired"})
 
-    async def short_timer_optimisation(self, seconds, timer: Timer):
-        await asyncio.sleep(seconds)
+            timer = Timer(
+                expires=record["fired"],
+                created=record["fired"],
+                event=schedule.event,
+                extra={**schedule.extra, "next_fire": schedule.next_fire},
+            )
+            self.call_timer(timer)
+
+            if schedule.next_fire.timestamp() <= self._loaded_until:
+                self._schedule_recurring(schedule.id, schedule.next_fire)
+
+    def call_timer(self, timer: Timer):
         event_name = f"{timer.event}_timer_complete"
-        self.bot.dispatch(event_name, timer)
+        method = f"on_{event_name}"
+
+        # same listeners bot.dispatch would call, but with a cap on how many run at once.
+        listeners = list(self.bot.extra_events.get(method, ()))
+        if (coro := getattr(self.bot, method, None)) is not None:
+            listeners.append(coro)
+
+        for listener in listeners:
+            self.bot.loop.create_task(self._run_listener(listener, method, timer))
+
+    async def _run_listener(self, listener, method: str, timer: Timer):
+        async with self._dispatch_sem:
+            try:
+                await listener(timer)
+            except Exception:
+                await self.bot.on_error(method, timer)
+
+    async def dispatch_timers(self):
+        while not self.bot.is_closed():
+            try:
+                if self.affinity and self._listener is None:
+                    await self.listen()
+
+                now = time.time()
+                if now + self.PRELOAD_MARGIN >= self._loaded_until:
+                    await self.preload()
+
+                due = self.wheel.advance(now)
+                self._scheduled.difference_update(due)
+
+                timer_ids, schedule_ids = [], []
+                for item in due:
+                    if isinstance(item, tuple):
+                        schedule_ids.append(item[0])
+
+                    elif item < 0:
+                        self.call_timer(self._memory.pop(item))
+                        if self.journal:
+                            self.journal.done(item)
+
+                    else:
+                        timer_ids.append(item)
+
+                if timer_ids:
+                    await self.claim(timer_ids)
+
+                if schedule_ids:
+                    await self.claim_schedules(schedule_ids)
+
+            except (OSError, discord.ConnectionClosed, asyncpg.PostgresConnectionError):
+                # claimed ids may be lost, the next preload reloads everything that's due.
+                self._loaded_until = 0.0
+
+            await asyncio.sleep(self.wheel.tick - time.time() % self.wheel.tick)
 
     async def create_timer(self, *args, **kwargs):
         when, event, *args = args
@@ -85,26 +298,107 @@ class Reminders(Cog):
         except KeyError:
             now = datetime.now(tz=IST)
 
-        delta = (when - now).total_seconds()
-
+        guild_id = self._guild_of(kwargs)
         timer = await Timer.create(
             expires=when,
             created=now,
             event=event,
             extra={"kwargs": kwargs, "args": args},
+            guild_id=guild_id,
         )
 
-        # only set the data check if it can be waited on
-        if delta <= (86400 * 40):  # 40 days
-            self._have_data.set()
+        await self._track(timer.id, when, guild_id)
+        return timer
 
-        # check if this timer is earlier than our currently run timer
-        if self._current_timer and when < self._current_timer.expires:
-            # cancel the task and re-run it
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
+    async def _track(self, timer_id: int, when: datetime, guild_id: typing.Optional[int]):
+        if not self._owned(guild_id):
+            await self._notify_owner("timer", timer_id, when, guild_id)
 
-        return timer
+        # already inside the loaded window, the next preload won't see it.
+        elif when.timestamp() <= self._loaded_until:
+            self._schedule(timer_id, when)
+
+    async def create_timers_bulk(self, timers: typing.Iterable[typing.Tuple]) -> typing.List[int]:
+        """
+        Creates many timers with one INSERT per `BULK_INSERT_CHUNK` of them. Takes (when, event, kwargs)
+        or (when, event, kwargs, guild_id) tuples and returns the new timer ids, the guild of a timer
+        without one is looked up from its kwargs like create_timer does.
+        """
+        now, ids = datetime.now(tz=IST), []
+        timers = [(t[0], t[1], t[2], t[3] if len(t) > 3 else self._guild_of(t[2])) for t in timers]
+
+        for chunk in discord.utils.as_chunks(timers, self.BULK_INSERT_CHUNK):
+            records = await self.bot.db.fetch(
+                self.BULK_INSERT_QUERY,
+                [when for when, _, _, _ in chunk],
+                [now] * len(chunk),
+                [event for _, event, _, _ in chunk],
+                [json.dumps({"kwargs": kwargs, "args": []}) for _, _, kwargs, _ in chunk],
+                [guild_id for _, _, _, guild_id in chunk],
+            )
+
+            for record in records:
+                await self._track(record["id"], record["expires"], record["guild_id"])
+                ids.append(record["id"])
+
+        return ids
+
+    async def housekeeping(self):
+        """Deletes timers and schedules whose scrim or guild is gone, they'd fire for nothing."""
+        await self.bot.wait_until_ready()
+
+        while not self.bot.is_closed():
+            if self._owned(None):  # one process is enough
+                try:
+                    deleted = await Timer.delete_orphans(self.bot.db)
+                    deleted += await Schedule.delete_orphans(self.bot.db)
+                except Exception as e:
+                    print(f"timer housekeeping error: {e}")
+                else:
+                    if deleted:
+                        print(f"[Reminders] deleted {deleted} orphaned timers")
+
+            await asyncio.sleep(self.HOUSEKEEPING_INTERVAL)
+
+    async def create_tiered_timer(self, *args, **kwargs):
+        """
+        Same as create_timer, but a timer expiring within `short_threshold` seconds is kept in memory only
+        (and in the journal, if configured), it can't be looked up or cancelled through the timer table.
+        """
+        when, event, *args = args
+        now = kwargs.pop("created", None) or datetime.now(tz=IST)
+
+        if (when - now).total_seconds() < self.short_threshold:
+            timer = Timer(expires=when, created=now, event=event, extra={"kwargs": kwargs, "args": args})
+            if self._add_memory_timer(timer):
+                return timer
+
+        return await self.create_timer(when, event, *args, created=now, **kwargs)
+
+    async def set_schedule(
+        self,
+        when: datetime,
+        event: str,
+        key: int,
+        *,
+        guild_id: typing.Optional[int] = None,
+        period: int = 24 * 60 * 60,
+        **kwargs,
+    ):
+        """
+        Makes `event` fire at `when` and every `period` seconds after it, replacing the
+        existing schedule for (event, key) if there is one.
+        """
+        extra = json.dumps({"kwargs": kwargs, "args": []})
+        schedule_id = await self.bot.db.fetchval(self.UPSERT_SCHEDULE_QUERY, event, key, period, when, extra, guild_id)
+
+        if not self._owned(guild_id):
+            await self._notify_owner("schedule", schedule_id, when, guild_id)
+
+        elif when.timestamp() <= self._loaded_until:
+            self._schedule_recurring(schedule_id, when)
+
+        return schedule_id
 
 
 async def setup(bot: Quotient):
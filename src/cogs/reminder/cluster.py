@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+import typing as T
+
+__all__ = ("NOTIFY_CHANNEL", "CLAIM_TIMERS", "BULK_INSERT_TIMERS", "ShardAffinity")
+
+NOTIFY_CHANNEL = "scrimx_timers"
+
+# rows another process is claiming right now are skipped instead of waited on.
+CLAIM_TIMERS = """
+DELETE FROM timer WHERE id IN (SELECT id FROM timer WHERE id = ANY($1::BIGINT[]) FOR UPDATE SKIP LOCKED)
+RETURNING *
+"""
+
+# one statement for a whole chunk of timers, the returned guild_id tells who to notify.
+BULK_INSERT_TIMERS = """
+INSERT INTO timer (expires, created, event, extra, guild_id)
+    SELECT * FROM UNNEST($1::TIMESTAMPTZ[], $2::TIMESTAMPTZ[], $3::TEXT[], $4::JSONB[], $5::BIGINT[])
+RETURNING id, expires, guild_id
+"""
+
+
+class ShardAffinity:
+    """
+    Which timer rows belong to this process when the bot runs as several processes.
+
+    A row belongs to the process running the shard of its `guild_id`, rows without a guild
+    are handled by whichever process runs shard 0.
+    """
+
+    def __init__(self, shard_ids: T.Iterable[int], shard_count: int):
+        self.shard_ids = sorted(shard_ids)
+        self.shard_count = shard_count
+
+    def owns(self, guild_id: T.Optional[int]) -> bool:
+        if guild_id is None:
+            return 0 in self.shard_ids
+
+        return (guild_id >> 22) % self.shard_count in self.shard_ids
+
+    def condition(self, first: int) -> str:
+        """SQL filter for owned rows, its two parameters ($first, $first + 1) are `args`."""
+        shards, count = f"${first}::INT[]", f"${first + 1}::INT"
+        return f"((guild_id IS NULL AND 0 = ANY({shards})) OR (guild_id >> 22) % {count} = ANY({shards}))"
+
+    @property
+    def args(self) -> T.Tuple[T.List[int], int]:
+        return self.shard_ids, self.shard_count
+
+    @staticmethod
+    def notification(kind: str, row_id: int, expires: float, guild_id: T.Optional[int]) -> str:
+        return json.dumps({"kind": kind, "id": row_id, "expires": expires, "guild_id": guild_id})
+
+    def parse(self, payload: str) -> T.Optional[dict]:
+        """The notification if it's for a row this process owns."""
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            return None
+
+        return data if self.owns(data.get("guild_id")) else None
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import os
+import typing as T
+
+__all__ = ("TimerJournal",)
+
+
+class TimerJournal:
+    """
+    Append only file of the memory tier timers, so a crash doesn't lose them.
+
+    Every timer is written as one json line when created and a `{"done": id}` line when it fires,
+    the file is rewritten with only the pending timers on start up and once enough done lines pile up.
+    """
+
+    COMPACT_AFTER = 1000  # done lines before the file is rewritten
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pending: T.Dict[int, dict] = {}
+
+        self.__file: T.Optional[T.TextIO] = None
+        self.__done = 0
+
+    def load(self) -> T.List[dict]:
+        """Timers that were written but never marked done."""
+        entries: T.Dict[int, dict] = {}
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:  # half written line from a crash
+                        continue
+
+                    if "done" in entry:
+                        entries.pop(entry["done"], None)
+                    else:
+                        entries[entry["id"]] = entry
+
+        except FileNotFoundError:
+            pass
+
+        return list(entries.values())
+
+    def add(self, entry: dict):
+        self.pending[entry["id"]] = entry
+        self.__write(entry)
+
+    def done(self, timer_id: int):
+        if self.pending.pop(timer_id, None) is None:
+            return
+
+        self.__write({"done": timer_id})
+        self.__done += 1
+        if self.__done >= self.COMPACT_AFTER:
+            self.compact()
+
+    def compact(self):
+        """Atomically replaces the file with just the pending timers."""
+        self.close()
+
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in self.pending.values())
+        os.replace(tmp, self.path)
+
+        self.__done = 0
+
+    def close(self):
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def __write(self, entry: dict):
+        if self.__file is None:
+            self.__file = open(self.path, "a", encoding="utf-8")
+
+        self.__file.write(json.dumps(entry) + "\n")
+        self.__file.flush()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import math
+import time
+import typing as T
+
+__all__ = ("TimingWheel",)
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel.
+
+    Level 0 has one bucket per tick, every higher level has buckets as wide as the whole level
+    below it (1s -> 1m -> 1h with the defaults, covering 24 hours). Adding is O(1), and when the
+    wheel reaches the start of a higher level bucket its items cascade down a level, so every
+    item is touched at most once per level instead of being compared on every tick.
+    """
+
+    def __init__(self, tick: float = 1.0, sizes: T.Sequence[int] = (60, 60, 24), start: T.Optional[float] = None):
+        self.tick = tick
+        self.sizes = tuple(sizes)
+
+        # ticks covered by one bucket of each level: 1, 60, 3600 ...
+        self.widths = [math.prod(self.sizes[:level]) for level in range(len(self.sizes))]
+        self.buckets: T.List[T.Dict[int, list]] = [{} for _ in self.sizes]
+
+        # next tick to be processed, anything added before it fires on the next advance.
+        self.current = int((time.time() if start is None else start) // tick)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, when: float, item: T.Any) -> bool:
+        """Schedules item at unix timestamp `when`, returns False if it's beyond the horizon."""
+        # rounded up, an item never fires before its time.
+        if not self.__insert(max(math.ceil(when / self.tick), self.current), item):
+            return False
+
+        self.size += 1
+        return True
+
+    def __insert(self, tick: int, item: T.Any) -> bool:
+        for level, (width, size) in enumerate(zip(self.widths, self.sizes)):
+            if tick // width - self.current // width < size:
+                self.buckets[level].setdefault(tick // width, []).append((tick, item))
+                return True
+
+        return False
+
+    def advance(self, now: float) -> T.List[T.Any]:
+        """Moves the wheel up to `now` and returns every item that became due."""
+        due, target = [], int(now // self.tick)
+        while self.current <= target:
+            for level in range(len(self.sizes) - 1, 0, -1):
+                width = self.widths[level]
+                if self.current % width == 0 and (bucket := self.buckets[level].pop(self.current // width, None)):
+                    for tick, item in bucket:
+                        self.__insert(tick, item)
+
+            if bucket := self.buckets[0].pop(self.current, None):
+                due.extend(item for _, item in bucket)
+
+            self.current += 1
+
+        self.size -= len(due)
+        return due
@@ -70,6 +70,7 @@ class Utility(Cog, name="utility"):
             ctx.channel.id,
             when.arg,
             message_id=ctx.message.id,
+            guild_id=ctx.guild.id,
         )
 
         await ctx.send(f"Alright **{ctx.author}**, I'll remind you {discord_timestamp(expire)}: {when.arg}")
@@ -623,6 +624,8 @@ class Utility(Cog, name="utility"):
 
         await AutoPurge.create(guild_id=ctx.guild.id, channel_id=channel.id, delete_after=seconds)
         self.bot.cache.autopurge_channels.add(channel.id)
+        self.bot.cache.publish("autopurge_changed", channel.id)
+        self.bot.dispatch("autopurge_changed", channel.id)
         await ctx.success(f"**{channel}** added to autopurge channels.")
 
     @autopurge.command(name="list")
@@ -648,6 +651,8 @@ class Utility(Cog, name="utility"):
 
         self.bot.cache.autopurge_channels.discard(channel.id)
         await AutoPurge.filter(channel_id=channel.id, guild_id=ctx.guild.id).delete()
+        self.bot.cache.publish("autopurge_changed", channel.id)
+        self.bot.dispatch("autopurge_changed", channel.id)
         await ctx.success(f"**{channel}** removed from autopurge channels.")
 
 
@@ -5,6 +5,11 @@ import typing
 if typing.TYPE_CHECKING:
     from core import Quotient
 
+import asyncio
+import json
+import os
+import time
+from collections import defaultdict, deque
 from contextlib import suppress
 from datetime import datetime, timedelta
 
@@ -16,9 +21,131 @@ from models import AutoPurge, Snipe, Timer
 
 
 class AutoPurgeEvents(Cog):
+    SWEEP_INTERVAL = 5  # seconds between sweeps
+    SNAPSHOT_INTERVAL = 60  # seconds between snapshots of the pending ids
+    BULK_DELETE_MAX_AGE = timedelta(days=13, hours=23)  # discord refuses to bulk delete older messages
+
     def __init__(self, bot: Quotient):
         self.bot = bot
+
+        # channel_id: ids of messages waiting to be purged, oldest first. A snowflake
+        # carries its own creation time, so the id is all that needs to be kept.
+        self.pending: typing.Dict[int, typing.Deque[int]] = defaultdict(deque)
+        self.delete_after: typing.Dict[int, int] = {}  # channel_id: AutoPurge.delete_after
+        self.pinned: typing.Set[int] = set()  # pending message ids that got pinned
+
+        self.snapshot_path = getattr(bot.config, "AUTOPURGE_SNAPSHOT", None)
+        self.load_snapshot()
+
         self.bot.loop.create_task(self.delete_older_snipes())
+        self._task = self.bot.loop.create_task(self.sweep_loop())
+
+    def cog_unload(self):
+        self._task.cancel()
+        self.write_snapshot()
+
+    def load_snapshot(self):
+        if not self.snapshot_path:
+            return
+
+        with suppress(FileNotFoundError, ValueError):
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                for channel_id, message_ids in json.load(f).items():
+                    self.pending[int(channel_id)].extend(message_ids)
+
+    def write_snapshot(self):
+        if not self.snapshot_path:
+            return
+
+        tmp = f"{self.snapshot_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({channel_id: list(ids) for channel_id, ids in self.pending.items()}, f)
+        os.replace(tmp, self.snapshot_path)
+
+    async def get_delete_after(self, channel_id: int) -> typing.Optional[int]:
+        if channel_id not in self.delete_after:
+            record = await AutoPurge.get_or_none(channel_id=channel_id)
+            if not record:
+                self.bot.cache.autopurge_channels.discard(channel_id)
+                return None
+
+            self.delete_after[channel_id] = record.delete_after
+
+        return self.delete_after[channel_id]
+
+    def is_pinned(self, message_id: int) -> bool:
+        if message_id in self.pinned:
+            return True
+
+        message = self.bot.get_message(message_id)
+        return message is not None and message.pinned
+
+    async def sweep_loop(self):
+        await self.bot.wait_until_ready()
+
+        last_snapshot = time.monotonic()
+        while not self.bot.is_closed():
+            try:
+                await self.sweep()
+            except Exception as e:
+                print(f"autopurge sweep error: {e}")
+
+            if time.monotonic() - last_snapshot >= self.SNAPSHOT_INTERVAL:
+                last_snapshot = time.monotonic()
+                self.write_snapshot()
+
+            await asyncio.sleep(self.SWEEP_INTERVAL)
+
+    async def sweep(self):
+        """Collects every expired id of every channel and purges them."""
+        now = datetime.now(tz=IST)
+
+        # channels that stopped being autopurge channels, with or without pending ids.
+        for channel_id in self.delete_after.keys() - self.bot.cache.autopurge_channels:
+            del self.delete_after[channel_id]
+
+        for channel_id in list(self.pending):
+            if channel_id not in self.bot.cache.autopurge_channels:
+                self.forget(channel_id)
+                continue
+
+            if (delete_after := await self.get_delete_after(channel_id)) is None:
+                self.forget(channel_id)
+                continue
+
+            ids, expired = self.pending[channel_id], []
+            cutoff = discord.utils.time_snowflake(now - timedelta(seconds=delete_after), high=True)
+            while ids and ids[0] <= cutoff:
+                expired.append(ids.popleft())
+
+            if not ids:
+                del self.pending[channel_id]
+
+            if expired:
+                await self.purge(channel_id, expired, now)
+
+    def forget(self, channel_id: int):
+        self.pending.pop(channel_id, None)
+        self.delete_after.pop(channel_id, None)
+
+    async def purge(self, channel_id: int, message_ids: typing.List[int], now: datetime):
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            return self.forget(channel_id)
+
+        to_delete = [_id for _id in message_ids if not self.is_pinned(_id)]
+        self.pinned.difference_update(message_ids)
+
+        oldest = discord.utils.time_snowflake(now - self.BULK_DELETE_MAX_AGE)
+        bulk = [discord.Object(_id) for _id in to_delete if _id > oldest]
+
+        for chunk in discord.utils.as_chunks(bulk, 100):
+            with suppress(discord.NotFound, discord.Forbidden, discord.HTTPException):
+                await channel.delete_messages(chunk, reason="autopurge")
+
+        for _id in (_id for _id in to_delete if _id <= oldest):  # only after long downtime
+            with suppress(discord.NotFound, discord.Forbidden, discord.HTTPException):
+                await channel.get_partial_message(_id).delete()
 
     async def delete_older_snipes(self):  # we delete snipes that are older than 10 days
         await self.bot.wait_until_ready()
@@ -53,19 +180,28 @@ class AutoPurgeEvents(Cog):
         if not message.guild or not message.channel.id in self.bot.cache.autopurge_channels:
             return
 
-        record = await AutoPurge.get_or_none(channel_id=message.channel.id)
-        if not record:
-            return self.bot.cache.autopurge_channels.discard(message.channel.id)
+        if await self.get_delete_after(message.channel.id) is None:
+            return
 
-        await self.bot.reminders.create_timer(
-            datetime.now(tz=IST) + timedelta(seconds=record.delete_after),
-            "autopurge",
-            message_id=message.id,
-            channel_id=message.channel.id,
-        )
+        self.pending[message.channel.id].append(message.id)
+
+    @Cog.listener()
+    async def on_autopurge_changed(self, channel_id: int):
+        # set, removed or set again with another time, read it again on the next message.
+        self.delete_after.pop(channel_id, None)
+
+    @Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        if payload.channel_id not in self.pending or "pinned" not in payload.data:
+            return
+
+        if payload.data["pinned"]:
+            self.pinned.add(payload.message_id)
+        else:
+            self.pinned.discard(payload.message_id)
 
     @Cog.listener()
-    async def on_autopurge_timer_complete(self, timer: Timer):
+    async def on_autopurge_timer_complete(self, timer: Timer):  # timers created before the sweeper
         message_id, channel_id = timer.kwargs["message_id"], timer.kwargs["channel_id"]
 
         check = await AutoPurge.get_or_none(channel_id=channel_id)
@@ -87,3 +223,4 @@ class AutoPurgeEvents(Cog):
         if channel.id in self.bot.cache.autopurge_channels:
             await AutoPurge.filter(channel_id=channel.id).delete()
             self.bot.cache.autopurge_channels.discard(channel.id)
+            self.forget(channel.id)
@@ -21,7 +21,7 @@ from tortoise import Tortoise
 
 import config as cfg
 import constants as csts
-from models import Guild, Timer
+from models import Guild, Schedule, SSData, Timer, Tourney
 
 from .cache import CacheManager
 from .Context import Context
@@ -56,6 +56,8 @@ class Nothing(commands.AutoShardedBot):
             allowed_mentions=AllowedMentions(everyone=False, roles=False, replied_user=True, users=True),
             activity=discord.Activity(type=discord.ActivityType.listening, name="xsetup | xhelp"),
             proxy=getattr(cfg, "PROXY_URI", None),
+            shard_ids=getattr(cfg, "SHARD_IDS", None),
+            shard_count=getattr(cfg, "SHARD_COUNT", None),
             **kwargs,
         )
 
@@ -136,9 +138,21 @@ class Nothing(commands.AutoShardedBot):
         self.session = aiohttp.ClientSession(loop=self.loop)
         await Tortoise.init(cfg.TORTOISE)
         await Tortoise.generate_schemas(safe=True)
+        await SSData.upgrade_hash_columns(self.db)
+        await Timer.upgrade_table(self.db)
+        await Tourney.upgrade_table(self.db)
+        await Schedule.migrate_timers(self.db)
 
         self.cache = CacheManager(self)
-        await self.cache.fill_temp_cache()
+        if (snapshot := getattr(cfg, "CACHE_SNAPSHOT", None)) and self.cache.load_snapshot(snapshot):
+            # warm start, reconciled with the db in the background.
+            self.loop.create_task(self.cache.fill_temp_cache())
+        else:
+            await self.cache.fill_temp_cache()
+
+        if getattr(cfg, "CACHE_BUS", False):
+            # other processes (shard clusters, dashboard workers) share cache changes with us.
+            await self.cache.bus.listen(self.db)
 
         # Initializing Models (Assigning Bot attribute to all models)
         for mname, model in Tortoise.apps.get("models").items():
@@ -154,27 +168,19 @@ class Nothing(commands.AutoShardedBot):
         if not message.guild:
             return commands.when_mentioned_or(cfg.PREFIX)(self, message)
 
-        prefix = None
-        guild = self.cache.guild_data.get(message.guild.id)
-        if guild:
-            prefix = guild.get("prefix")
-
-        else:
-            self.cache.guild_data[message.guild.id] = {
-                "prefix": cfg.PREFIX, 
-                "color": self.color,
-                "footer": cfg.FOOTER,
-            }
-
-        prefix = prefix or cfg.PREFIX
-        print(f"Final prefix being used: {prefix}")  # Debug
-
-    # simple way to support mention + prefix
-        return commands.when_mentioned_or(prefix)(self, message)
+        # the mention or prefix the message starts with, discord.py only has to check that one.
+        matcher = self.cache.prefix_matcher(message.guild.id)
+        return matcher(message.content) or matcher.prefix
 
     async def close(self) -> None:
         await super().close()
 
+        if hasattr(self, "cache"):
+            await self.cache.bus.close()
+
+            if snapshot := getattr(cfg, "CACHE_SNAPSHOT", None):
+                self.cache.write_snapshot(snapshot)
+
         if hasattr(self, "session"):
             await self.session.close()
 
@@ -186,6 +192,10 @@ class Nothing(commands.AutoShardedBot):
 
     async def process_commands(self, message: discord.Message):
         if message.content and message.guild is not None:
+            # most messages aren't commands, skip building a Context for them.
+            if not self.cache.prefix_matcher(message.guild.id)(message.content):
+                return
+
             ctx = await self.get_context(message, cls=Context)
 
             if ctx.command is None:
@@ -216,7 +226,7 @@ class Nothing(commands.AutoShardedBot):
 
     async def wait_and_delete(self, message: discord.Message, delay: int = 10):
         """Waits for `delay` seconds and deletes the message"""
-        return await self.reminders.create_timer(
+        return await self.reminders.create_tiered_timer(
             self.current_time + timedelta(seconds=delay),
             "msg_delete",
             message_id=message.id,
@@ -236,8 +246,8 @@ class Nothing(commands.AutoShardedBot):
 
     def embed(self, ctx: Context, **kwargs: Any) -> discord.Embed:
         """This is how we deliver features like custom footer and custom color :)"""
-        embed_color = self.cache.guild_data[ctx.guild.id]["color"]
-        embed_footer = self.cache.guild_data[ctx.guild.id]["footer"]
+        embed_color = self.cache.guild_color(ctx.guild.id)
+        embed_footer = self.cache.guild_footer(ctx.guild.id)
 
         if embed_footer.strip().lower() == "none":
             embed_footer = None
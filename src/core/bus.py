@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import traceback
+import typing as T
+import uuid
+
+if T.TYPE_CHECKING:
+    import asyncpg
+
+__all__ = ("CACHE_CHANNEL", "CACHE_EVENTS", "CacheBus")
+
+CACHE_CHANNEL = "scrimx_cache"
+
+# event: what its id is. Extra keyword arguments are listed after it.
+CACHE_EVENTS = {
+    "guild_settings_changed": "guild id",
+    "scrim_changed": "scrim id, channel_id (the old registration channel)",
+    "tourney_changed": "tourney id, channel_id (the old registration channel)",
+    "ssverify_changed": "channel id",
+    "ss_hash_added": "ssdata id, channel_id",
+    "tagcheck_changed": "channel id",
+    "easytag_changed": "channel id",
+    "autopurge_changed": "channel id",
+    "blocklist_changed": "user or guild id",
+    "channel_deleted": "channel id",
+}
+
+
+class CacheBus:
+    """
+    Keeps the caches of several bot processes in sync with postgres LISTEN / NOTIFY.
+
+    A process that changed something publishes an event saying what, every other process awaits
+    the target's method of the same name (`CacheManager.scrim_changed(id)` ...), which reads it back
+    from the db. Events only carry ids, so one arriving late or twice can't put stale data in a cache.
+    """
+
+    RECONNECT_DELAY = 5
+
+    def __init__(self, target):
+        self.target = target
+        self.origin = uuid.uuid4().hex  # our own events are skipped, the publisher changed its cache already
+
+        self._pool: T.Optional[asyncpg.Pool] = None
+        self._listener: T.Optional[asyncpg.Connection] = None
+        self._reconnect: T.Optional[asyncio.Task] = None
+
+        # applied one at a time in the order they arrived: handlers read the row back, and two of them
+        # racing for the same row could finish out of order and leave the older read in the cache.
+        self._events: asyncio.Queue[T.Tuple[str, int, dict]] = asyncio.Queue()
+        self._consumer: T.Optional[asyncio.Task] = None
+        # cleared while catching up after a reconnect, events wait in the queue until the full fill is done.
+        self._caught_up = asyncio.Event()
+        self._caught_up.set()
+
+    @property
+    def listening(self) -> bool:
+        return self._listener is not None
+
+    async def listen(self, pool: asyncpg.Pool):
+        self._pool = pool
+
+        con = await pool.acquire()
+        await con.add_listener(CACHE_CHANNEL, self._on_notify)
+        con.add_termination_listener(self._on_listener_lost)
+        self._listener = con
+
+        if self._consumer is None:
+            self._consumer = asyncio.get_running_loop().create_task(self.__consume())
+
+    async def close(self):
+        for task in (self._reconnect, self._consumer):
+            if task is not None:
+                task.cancel()
+        self._consumer = None
+
+        if (con := self._listener) is not None:
+            self._listener = None
+            if not con.is_closed():
+                await con.remove_listener(CACHE_CHANNEL, self._on_notify)
+            await self._pool.release(con)
+
+        self._pool = None
+
+    def publish(self, event: str, id: int, **extra) -> T.Optional[asyncio.Task]:
+        """Tells the other processes, a no-op unless `listen` was called."""
+        if event not in CACHE_EVENTS:
+            raise ValueError(f"Unknown cache event: {event}")
+
+        if self._pool is None:
+            return None
+
+        if not self._caught_up.is_set():
+            # a fill in progress could overwrite our own change with what it read before it.
+            self._events.put_nowait((event, id, extra))
+
+        payload = json.dumps({"event": event, "id": id, "origin": self.origin, **extra})
+        notify = self._pool.execute("SELECT pg_notify($1, $2)", CACHE_CHANNEL, payload)
+        return asyncio.get_running_loop().create_task(notify)
+
+    def _on_notify(self, con: asyncpg.Connection, pid: int, channel: str, payload: str):
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            return
+
+        if data.pop("origin", None) == self.origin or data.get("event") not in CACHE_EVENTS:
+            return
+
+        self._events.put_nowait((data.pop("event"), data.pop("id"), data))
+
+    async def __consume(self):
+        while True:
+            event, id, extra = await self._events.get()
+            await self._caught_up.wait()
+            try:
+                await getattr(self.target, event)(id, **extra)
+            except Exception:
+                traceback.print_exc()
+
+    def _on_listener_lost(self, con: asyncpg.Connection):
+        self._listener = None
+        if self._pool is not None and self._reconnect is None:
+            self._reconnect = asyncio.get_running_loop().create_task(self.__reconnect())
+
+    async def __reconnect(self):
+        self._caught_up.clear()
+        try:
+            while self._listener is None:
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                try:
+                    await self.listen(self._pool)
+                except Exception as e:  # db still down, try again
+                    print(f"[cache bus] listening again failed: {e!r}")
+
+            # whatever was published meanwhile is missed, the full fill catches up. Events arriving
+            # during it are applied after, so the rows they name are read again past the fill's snapshot.
+            await self.target.fill_temp_cache()
+        finally:
+            self._reconnect = None
+            self._caught_up.set()
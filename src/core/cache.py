@@ -1,69 +1,295 @@
 from __future__ import annotations
 
+import asyncio
+import os
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import msgpack
 
 import config
 from constants import IST
-from models import AutoPurge, BlockList, EasyTag, Guild, Scrim, SSVerify, TagCheck, Tourney
+from models import AutoPurge, BlockList, EasyTag, Guild, Scrim, SSData, SSHash, SSVerify, TagCheck, Tourney
+from ocr import BKTree, hash_to_int
+
+from .bus import CacheBus
+from .prefix import PrefixMatcher
+from .settings import GuildSettings
 
 
 class CacheManager:
+    SNAPSHOT_VERSION = 2
+
+    # plain id sets, snapshotted as they are.
+    ID_SETS = (
+        "eztagchannels",
+        "tagcheck",
+        "scrim_channels",
+        "tourney_channels",
+        "autopurge_channels",
+        "media_partner_channels",
+        "ssverify_channels",
+        "blocked_ids",
+    )
+
     def __init__(self, bot):
         if TYPE_CHECKING:
             from .Bot import Quotient
 
         self.bot: Quotient = bot
 
-        self.guild_data = {}
+        self.default_settings = GuildSettings(config.PREFIX, config.COLOR, config.FOOTER)
+        self.guild_data: Dict[int, GuildSettings] = {}  # only guilds with non default settings are kept
+        self.prefix_matchers: Dict[int, PrefixMatcher] = {}  # guilds sharing a prefix share the matcher
+        self.__matchers_by_prefix: Dict[str, PrefixMatcher] = {}
         self.eztagchannels = set()
         self.tagcheck = set()
         self.scrim_channels = set()
         self.tourney_channels = set()
         self.autopurge_channels = set()
         self.media_partner_channels = set()
+        self.media_partners = {}  # channel_id: (tourney_id, partner_tourney_id, partner_guild_id)
+        self.partner_registrations = {}  # partner_tourney_id: {leader & member ids}
         self.ssverify_channels = set()
+        self.ss_hashes = {}  # ssverify channel_id: BKTree of dhash -> SSHash
+        self.__ss_hash_adds: List[List[Tuple[int, SSData]]] = []  # add_ss_hash calls seen by each running fill
 
         self.blocked_ids = set()
 
+        self.bus = CacheBus(self)
+
     async def fill_temp_cache(self):
-        async for record in Guild.all():
-            self.guild_data[record.guild_id] = {
-                "prefix": record.prefix,
-                "color": record.embed_color or config.COLOR,
-                "footer": record.embed_footer or config.FOOTER,
-            }
+        """
+        All queries run at once and only select the columns we keep. Each one replaces its part of the
+        cache when done, so this also reconciles a cache loaded from a snapshot.
+        """
+        await asyncio.gather(
+            self.fill_guild_data(),
+            self.__fill_ids(self.eztagchannels, EasyTag.all().values_list("channel_id", flat=True)),
+            self.__fill_ids(self.tagcheck, TagCheck.all().values_list("channel_id", flat=True)),
+            self.__fill_ids(
+                self.scrim_channels,
+                Scrim.filter(opened_at__lte=datetime.now(tz=IST)).values_list("registration_channel_id", flat=True),
+            ),
+            self.__fill_ids(
+                self.tourney_channels,
+                Tourney.filter(started_at__not_isnull=True).values_list("registration_channel_id", flat=True),
+            ),
+            self.__fill_ids(self.autopurge_channels, AutoPurge.all().values_list("channel_id", flat=True)),
+            self.fill_media_partners(),
+            self.__fill_ids(self.ssverify_channels, SSVerify.all().values_list("channel_id", flat=True)),
+            self.fill_ss_hashes(),
+            self.__fill_ids(self.blocked_ids, BlockList.all().values_list("block_id", flat=True)),
+        )
+
+    @staticmethod
+    async def __fill_ids(target: set, query):
+        ids = await query
+        target.clear()
+        target.update(ids)
+
+    async def fill_guild_data(self):
+        records = await Guild.all().values_list("guild_id", "prefix", "embed_color", "embed_footer")
+
+        self.guild_data.clear()
+        self.prefix_matchers.clear()
+        for guild_id, prefix, color, footer in records:
+            self.set_guild_settings(guild_id, prefix, color, footer)
+
+    def load_snapshot(self, path: str) -> bool:
+        """Fills the cache from a snapshot written by `write_snapshot`, returns False if there's no usable one."""
+        try:
+            with open(path, "rb") as f:
+                data = msgpack.unpackb(f.read(), strict_map_key=False)
+
+            if data.get("version") != self.SNAPSHOT_VERSION:
+                return False
+
+            for guild_id, (prefix, color, footer) in data["guild_data"].items():
+                self.set_guild_settings(guild_id, prefix, color, footer)
+            for name in self.ID_SETS:
+                getattr(self, name).update(data[name])
+
+            self.media_partners.update({k: tuple(v) for k, v in data["media_partners"].items()})
+            self.partner_registrations.update({k: set(v) for k, v in data["partner_registrations"].items()})
+
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        return True
+
+    def write_snapshot(self, path: str):
+        """ss_hashes is left out, it's the largest part and screenshot checks fall back to the db until it's filled."""
+        data = {
+            "version": self.SNAPSHOT_VERSION,
+            "guild_data": {k: (v.prefix, v.color, v.footer) for k, v in self.guild_data.items()},
+            "media_partners": self.media_partners,
+            "partner_registrations": {k: list(v) for k, v in self.partner_registrations.items()},
+            **{name: list(getattr(self, name)) for name in self.ID_SETS},
+        }
+
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(msgpack.packb(data))
+        os.replace(tmp, path)
+
+    async def fill_media_partners(self):
+        query = """
+        SELECT PARTNER.CHANNEL_ID, LINK."tm.tourney_id", PARTNER.TOURNEY_ID, PARTNER_TOURNEY.GUILD_ID
+            FROM PUBLIC."tm.media_partners" AS PARTNER
+            INNER JOIN PUBLIC."tm.tourney_tm.media_partners" AS LINK ON LINK.MEDIAPARTNER_ID = PARTNER.CHANNEL_ID
+            LEFT JOIN PUBLIC."tm.tourney" AS PARTNER_TOURNEY ON PARTNER_TOURNEY.ID = PARTNER.TOURNEY_ID
+        """
+        records = await self.bot.db.fetch(query)
+
+        self.media_partner_channels.clear()
+        self.media_partners.clear()
+        for channel_id, tourney_id, partner_id, partner_guild_id in records:
+            self.media_partner_channels.add(channel_id)
+            self.media_partners[channel_id] = (tourney_id, partner_id, partner_guild_id)
+
+        partners = {v[1] for v in self.media_partners.values()}
+        for tourney_id in self.partner_registrations.keys() - partners:
+            del self.partner_registrations[tourney_id]
+
+        await self.fill_partner_registrations(*partners)
+
+    async def fill_partner_registrations(self, *tourney_ids: int):
+        """Loads leader and member ids of every team registered in the given (partner) tourneys."""
+        query = """
+        SELECT TOURNEY.ID, SLOTS.LEADER_ID, SLOTS.MEMBERS
+            FROM PUBLIC."tm.tourney" AS TOURNEY
+            LEFT JOIN PUBLIC."tm.tourney_tm.register" AS ASSIGNED_SLOT ON ASSIGNED_SLOT."tm.tourney_id" = TOURNEY.ID
+            LEFT JOIN PUBLIC."tm.register" AS SLOTS ON SLOTS.ID = ASSIGNED_SLOT.TMSLOT_ID
+        WHERE TOURNEY.ID = ANY($1::BIGINT[])
+        """
+        _data = {}
+        for tourney_id, leader_id, members in await self.bot.db.fetch(query, list(tourney_ids)):
+            ids = _data.setdefault(tourney_id, set())
+            if leader_id is not None:
+                ids.add(leader_id)
+                ids.update(members or ())
+
+        for tourney_id in tourney_ids:
+            if tourney_id in _data:
+                self.partner_registrations[tourney_id] = _data[tourney_id]
+            else:  # partner tourney was deleted.
+                self.partner_registrations.pop(tourney_id, None)
+
+    async def add_media_partner(self, channel_id: int, tourney_id: int, partner: Tourney):
+        self.media_partner_channels.add(channel_id)
+        self.media_partners[channel_id] = (tourney_id, partner.id, partner.guild_id)
+        await self.fill_partner_registrations(partner.id)
+
+    def remove_media_partner(self, channel_id: int):
+        self.media_partner_channels.discard(channel_id)
+        _, partner_id, _ = self.media_partners.pop(channel_id, (None, None, None))
+
+        if not any(partner_id == v[1] for v in self.media_partners.values()):
+            self.partner_registrations.pop(partner_id, None)
+
+    def add_partner_registration(self, tourney_id: int, leader_id: int, members=()):
+        """Keeps the eligibility index updated when a partner tourney registers a team."""
+        if (ids := self.partner_registrations.get(tourney_id)) is not None:
+            ids.add(leader_id)
+            ids.update(members)
+
+    async def refresh_partner_registrations(self, tourney_id: int):
+        """Slots of a partner tourney were removed, a leader may still have other slots so we refill."""
+        if tourney_id in self.partner_registrations:
+            await self.fill_partner_registrations(tourney_id)
+
+    async def fill_ss_hashes(self):
+        query = """
+        SELECT INFO.CHANNEL_ID, DATA.ID, DATA.AUTHOR_ID, DATA.CHANNEL_ID, DATA.MESSAGE_ID, DATA.DHASH, DATA.PHASH
+            FROM PUBLIC."ss_info" AS INFO
+            INNER JOIN PUBLIC."ss_info_ss_data" AS LINK ON LINK.SS_INFO_ID = INFO.ID
+            INNER JOIN PUBLIC."ss_data" AS DATA ON DATA.ID = LINK.SSDATA_ID
+        """
+        # built aside and swapped in, an add_ss_hash while the query runs must not make a channel look indexed.
+        # Those adds are recorded and replayed into the new index, the query may not have seen their rows.
+        adds = []
+        self.__ss_hash_adds.append(adds)
+        try:
+            records = await self.bot.db.fetch(query)
+        finally:
+            self.__ss_hash_adds.remove(adds)
 
-        async for record in EasyTag.all():
-            self.eztagchannels.add(record.channel_id)
+        ss_hashes = {}
+        for ss_channel_id, _id, author_id, channel_id, message_id, dhash, phash in records:
+            if (dhash := hash_to_int(dhash)) is None:
+                continue
 
-        async for record in TagCheck.all():
-            self.tagcheck.add(record.channel_id)
+            tree = ss_hashes.setdefault(ss_channel_id, BKTree())
+            tree.add(dhash, SSHash(_id, author_id, channel_id, message_id, hash_to_int(phash)))
 
-        async for record in Scrim.filter(opened_at__lte=datetime.now(tz=IST)).all():
-            self.scrim_channels.add(record.registration_channel_id)
+        fetched = {r[1] for r in records}
+        for ss_channel_id, data in adds:
+            if data.id not in fetched:
+                self.__add_ss_hash(ss_hashes, ss_channel_id, data)
 
-        async for record in Tourney.filter(started_at__not_isnull=True):
-            self.tourney_channels.add(record.registration_channel_id)
+        self.ss_hashes = ss_hashes
 
-        async for record in AutoPurge.all():
-            self.autopurge_channels.add(record.channel_id)
+    def add_ss_hash(self, ss_channel_id: int, data: SSData):
+        for adds in self.__ss_hash_adds:
+            adds.append((ss_channel_id, data))
 
-        async for record in Tourney.all():
-            async for partner in record.media_partners.all():
-                self.media_partner_channels.add(partner.channel_id)
+        # a channel the running fill is still indexing only gets it from the replay.
+        if ss_channel_id in self.ss_hashes or not self.__ss_hash_adds:
+            self.__add_ss_hash(self.ss_hashes, ss_channel_id, data)
 
-        async for record in SSVerify.all():
-            self.ssverify_channels.add(record.channel_id)
+    @staticmethod
+    def __add_ss_hash(ss_hashes: dict, ss_channel_id: int, data: SSData):
+        if (dhash := hash_to_int(data.dhash)) is None:
+            return
 
-        async for record in BlockList.all():
-            self.blocked_ids.add(record.block_id)
+        tree = ss_hashes.setdefault(ss_channel_id, BKTree())
+        tree.add(dhash, SSHash(data.id, data.author_id, data.channel_id, data.message_id, hash_to_int(data.phash)))
 
-    def guild_color(self, guild_id: int):
-        return self.guild_data.get(guild_id, {}).get("color", config.COLOR)
+    def guild_settings(self, guild_id: int) -> GuildSettings:
+        return self.guild_data.get(guild_id, self.default_settings)
 
-    def guild_footer(self, guild_id: int):
-        return self.guild_data.get(guild_id, {}).get("footer", config.FOOTER)
+    def guild_prefix(self, guild_id: int) -> str:
+        return self.guild_data.get(guild_id, self.default_settings).prefix
+
+    def guild_color(self, guild_id: int) -> int:
+        return self.guild_data.get(guild_id, self.default_settings).color
+
+    def guild_footer(self, guild_id: int) -> str:
+        return self.guild_data.get(guild_id, self.default_settings).footer
+
+    def set_guild_settings(
+        self,
+        guild_id: int,
+        prefix: Optional[str] = None,
+        color: Optional[int] = None,
+        footer: Optional[str] = None,
+    ):
+        """Caches a guild's settings, empty values fall back to the defaults."""
+        settings = GuildSettings(prefix or config.PREFIX, color or config.COLOR, footer or config.FOOTER)
+        self.prefix_matchers.pop(guild_id, None)
+
+        if settings == self.default_settings:
+            self.guild_data.pop(guild_id, None)
+        else:
+            self.guild_data[guild_id] = settings
+
+    def prefix_matcher(self, guild_id: int) -> PrefixMatcher:
+        try:
+            return self.prefix_matchers[guild_id]
+        except KeyError:
+            prefix = self.guild_prefix(guild_id)
+
+        if (matcher := self.__matchers_by_prefix.get(prefix)) is None:
+            matcher = self.__matchers_by_prefix[prefix] = PrefixMatcher(self.bot.user.id, prefix)
+
+        self.prefix_matchers[guild_id] = matcher
+        return matcher
+
+    def update_guild_settings(self, guild_id: int, **changes):
+        """Changes some of a guild's cached settings, takes prefix, color and footer."""
+        settings = self.guild_settings(guild_id).replace(**changes)
+        self.set_guild_settings(guild_id, settings.prefix, settings.color, settings.footer)
 
     async def update_guild_cache(self, guild_id: int, *, set_default=False) -> None:
         if set_default:
@@ -72,11 +298,75 @@ class CacheManager:
             )
 
         _g = await Guild.get(pk=guild_id)
-        self.guild_data[guild_id] = {
-            "prefix": _g.prefix,
-            "color": _g.embed_color or config.COLOR,
-            "footer": _g.embed_footer or config.FOOTER,
-        }
+        self.set_guild_settings(guild_id, _g.prefix, _g.embed_color, _g.embed_footer)
+
+    def publish(self, event: str, id: int, **extra):
+        """Tells the other bot processes what we changed, see `core.bus`."""
+        self.bus.publish(event, id, **extra)
+
+    async def changed(self, event: str, id: int, **extra):
+        """For changes made straight in the db, reloads them here and in the other processes."""
+        await getattr(self, event)(id, **extra)
+        self.publish(event, id, **extra)
+
+    # handlers of the bus events, each reads what changed back from the db.
+
+    async def guild_settings_changed(self, guild_id: int):
+        await self.update_guild_cache(guild_id)
+
+    async def scrim_changed(self, scrim_id: int, channel_id: Optional[int] = None):
+        self.scrim_channels.discard(channel_id)
+
+        scrim = await Scrim.get_or_none(pk=scrim_id)
+        if scrim and scrim.opened_at and scrim.opened_at <= datetime.now(tz=IST):
+            self.scrim_channels.add(scrim.registration_channel_id)
+
+    async def tourney_changed(self, tourney_id: int, channel_id: Optional[int] = None):
+        self.tourney_channels.discard(channel_id)
+
+        tourney = await Tourney.get_or_none(pk=tourney_id)
+        if tourney and tourney.started_at:
+            self.tourney_channels.add(tourney.registration_channel_id)
+
+        await self.refresh_partner_registrations(tourney_id)
+
+    async def ssverify_changed(self, channel_id: int):
+        if not await self.__sync_id(self.ssverify_channels, channel_id, SSVerify.filter(channel_id=channel_id)):
+            self.ss_hashes.pop(channel_id, None)
+
+    async def ss_hash_added(self, data_id: int, channel_id: int):
+        # channels without an index yet fall back to the db anyway, unless a fill is about to index them.
+        if (channel_id in self.ss_hashes or self.__ss_hash_adds) and (data := await SSData.get_or_none(pk=data_id)):
+            self.add_ss_hash(channel_id, data)
+
+    async def tagcheck_changed(self, channel_id: int):
+        await self.__sync_id(self.tagcheck, channel_id, TagCheck.filter(channel_id=channel_id))
+
+    async def easytag_changed(self, channel_id: int):
+        await self.__sync_id(self.eztagchannels, channel_id, EasyTag.filter(channel_id=channel_id))
+
+    async def autopurge_changed(self, channel_id: int):
+        await self.__sync_id(self.autopurge_channels, channel_id, AutoPurge.filter(channel_id=channel_id))
+        self.bot.dispatch("autopurge_changed", channel_id)  # its delete_after may have changed too
+
+    async def blocklist_changed(self, block_id: int):
+        await self.__sync_id(self.blocked_ids, block_id, BlockList.filter(block_id=block_id))
+
+    async def channel_deleted(self, channel_id: int):
+        for name in self.ID_SETS:
+            getattr(self, name).discard(channel_id)
+
+        self.remove_media_partner(channel_id)
+        self.ss_hashes.pop(channel_id, None)
+
+    @staticmethod
+    async def __sync_id(target: set, _id: int, query) -> bool:
+        if exists := await query.exists():
+            target.add(_id)
+        else:
+            target.discard(_id)
+
+        return exists
 
     # @staticmethod
     # @cached(ttl=10, serializer=JsonSerializer())
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import re
+import typing as T
+
+__all__ = ("PrefixMatcher",)
+
+
+class PrefixMatcher:
+    """
+    Finds the prefix a message starts with, the bot's mention or a guild prefix.
+
+    Same rules as `commands.when_mentioned_or(prefix)` (a mention needs the space after it,
+    the prefix is case sensitive), but as one compiled pattern built once per prefix instead
+    of a fresh closure and list on every message.
+    """
+
+    __slots__ = ("prefix", "_match")
+
+    def __init__(self, bot_id: int, prefix: str):
+        self.prefix = prefix
+        self._match = re.compile(rf"<@!?{bot_id}> |{re.escape(prefix)}").match
+
+    def __call__(self, content: str) -> T.Optional[str]:
+        """The prefix `content` starts with, as it's written in the message."""
+        if m := self._match(content):
+            return m.group()
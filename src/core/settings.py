@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+
+__all__ = ("GuildSettings",)
+
+
+class GuildSettings:
+    """
+    Prefix, embed color and footer of a guild, read on every message.
+
+    Slotted and immutable, so guilds with the default settings (most of them) can all share one
+    instance. Changing a setting means putting a new instance in the cache, see `replace`.
+    """
+
+    __slots__ = ("prefix", "color", "footer")
+
+    prefix: str
+    color: int
+    footer: str
+
+    def __init__(self, prefix: str, color: int, footer: str):
+        # interned, the same prefix / footer read from many rows is kept once.
+        object.__setattr__(self, "prefix", sys.intern(prefix))
+        object.__setattr__(self, "color", color)
+        object.__setattr__(self, "footer", sys.intern(footer))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GuildSettings is immutable, use replace()")
+
+    def __eq__(self, other):
+        if not isinstance(other, GuildSettings):
+            return NotImplemented
+
+        return (self.prefix, self.color, self.footer) == (other.prefix, other.color, other.footer)
+
+    def __hash__(self):
+        return hash((self.prefix, self.color, self.footer))
+
+    def __repr__(self):
+        return f"<GuildSettings prefix={self.prefix!r} color={self.color} footer={self.footer!r}>"
+
+    def replace(self, **changes) -> GuildSettings:
+        return GuildSettings(
+            changes.get("prefix", self.prefix), changes.get("color", self.color), changes.get("footer", self.footer)
+        )
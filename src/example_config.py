@@ -29,3 +29,27 @@ DEVS = ()
 SHARD_LOG = ""
 ERROR_LOG = ""
 PUBLIC_LOG = ""
+
+# OCR worker processes for screenshot verification (defaults to cpu count)
+OCR_WORKERS = None
+
+# ocr_api.py service, screenshots are OCR'd in-process when not set
+OCR_API_URL = None  # "http://127.0.0.1:8090"
+OCR_API_KEY = None
+
+# timers expiring sooner than this many seconds (like message deletes) are kept in memory only
+SHORT_TIMER_THRESHOLD = 120
+TIMER_JOURNAL = None  # "data/timers.journal", lets in-memory timers survive a restart
+
+# messages waiting for autopurge are snapshotted here, so a restart doesn't leave them behind
+AUTOPURGE_SNAPSHOT = None  # "data/autopurge.json"
+
+# run only some of the shards in this process, timers are then split between processes by guild
+SHARD_COUNT = None
+SHARD_IDS = None  # [int(i) for i in os.environ["SHARD_IDS"].split(",")]
+
+# the in-memory cache is written here on shutdown and loaded on the next boot, instead of waiting for the db
+CACHE_SNAPSHOT = None  # "data/cache.msgpack"
+
+# when more than one process uses the db (shard clusters, a dashboard worker), they keep their caches in sync
+CACHE_BUS = False
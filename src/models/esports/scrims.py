@@ -267,8 +267,6 @@ class Scrim(BaseDbModel):
         await ScrimsSlotReminder.filter(pk__in=(i.pk for i in reminders)).delete()
 
     async def ensure_match_timer(self):
-        from models import Timer
-
         from .slotm import ScrimsSlotManager
 
         if not self.match_time:
@@ -281,9 +279,7 @@ class Scrim(BaseDbModel):
         if self.match_time != _time:
             await Scrim.filter(pk=self.pk).update(match_time=_time)
 
-        check = await Timer.filter(event="scrim_match", expires=_time, extra={"args": [], "kwargs": {"scrim_id": self.pk}}).exists()
-        if not check:
-            await self.bot.reminders.create_timer(_time, "scrim_match", scrim_id=self.pk)
+        await self.bot.reminders.set_schedule(_time, "scrim_match", self.pk, scrim_id=self.pk, guild_id=self.guild_id)
 
         await ScrimsSlotManager.refresh_guild_message(self.guild_id, self.pk)
 
@@ -313,6 +309,7 @@ class Scrim(BaseDbModel):
             to_ban = [_ for _ in slot.members]
             scrims = await Scrim.filter(guild_id=self.guild_id).order_by("open_time")
 
+        timers = []
         for _ in to_ban:
             for scrim in scrims:
                 if _ in await scrim.banned_user_ids():
@@ -325,15 +322,18 @@ class Scrim(BaseDbModel):
                 await banlog.log_ban(_, mod, scrims, reason.arg, reason.dt)
 
             if reason.dt:
-                await self.bot.reminders.create_timer(
-                    reason.dt,
-                    "scrim_ban",
-                    scrims=[scrim.id for scrim in scrims],
-                    user_id=_,
-                    mod=mod.id,
-                    reason=reason.arg,
+                timers.append(
+                    (
+                        reason.dt,
+                        "scrim_ban",
+                        {"scrims": [scrim.id for scrim in scrims], "user_id": _, "mod": mod.id, "reason": reason.arg},
+                        self.guild_id,
+                    )
                 )
 
+        if timers:
+            await self.bot.reminders.create_timers_bulk(timers)
+
         return f"Banned {utils.plural(to_ban):player|players} from {utils.plural(scrims):scrim|scrims}."
 
     async def create_slotlist_img(self):
@@ -473,6 +473,8 @@ class Scrim(BaseDbModel):
             await note.pin()
 
     async def full_delete(self):
+        from models.misc.Schedule import RECURRING_TIMERS, Schedule
+
         from .slotm import ScrimsSlotManager
 
         _id = self.pk
@@ -487,7 +489,9 @@ class Scrim(BaseDbModel):
         await ScrimsSlotReminder.filter(pk__in=[_.pk for _ in _r]).delete()
         _re = await self.reserved_slots.all()
         await ReservedSlot.filter(pk__in=[_.pk for _ in _re]).delete()
+        await Schedule.filter(key=_id, event__in=RECURRING_TIMERS).delete()
         await self.delete()
+        self.bot.cache.publish("scrim_changed", _id, channel_id=self.registration_channel_id)
 
     async def confirm_all_scrims(self, ctx: Context, **kwargs):
         if not await Scrim.scrim_count(ctx.guild.id) > 1:
@@ -604,6 +608,7 @@ class Scrim(BaseDbModel):
         )
 
         self.bot.cache.scrim_channels.add(registration_channel.id)
+        self.bot.cache.publish("scrim_changed", self.id)
 
         await toggle_channel(registration_channel, open_role, True)
         self.bot.dispatch("scrim_log", EsportsLog.open, self)
@@ -1,6 +1,6 @@
-from typing import Tuple
+import typing as T
+from typing import NamedTuple, Optional, Tuple
 
-import imagehash
 from pydantic import BaseModel, HttpUrl
 from tortoise import fields
 
@@ -9,20 +9,39 @@ from constants import SSType
 from core import Context
 from models import BaseDbModel
 from models.helpers import *
+from ocr import hash_to_int, to_signed
 from utils import emote
 
+DUPLICATE_DISTANCE = 7  # max dhash (and phash for other users' ss) hamming distance of a reused screenshot
+HASH_BANDS = 8  # 8 bit bands of the dhash, with <= 7 differing bits at least one band matches exactly
+
 
 class ImageResponse(BaseModel):
     url: HttpUrl
     dhash: str
     phash: str
     text: str
+    metadata: dict = {}
 
     @property
     def lower_text(self):
         return self.text.lower().replace(" ", "").replace("\n", "")
 
 
+class SSHash(NamedTuple):
+    """What the in-memory hash index keeps for every SSData row."""
+
+    id: int
+    author_id: int
+    channel_id: int
+    message_id: int
+    phash: Optional[int]
+
+    @property
+    def jump_url(self):
+        return "https://discord.com/channels/{}/" + f"{self.channel_id}/{self.message_id}"
+
+
 class SSData(BaseDbModel):
     class Meta:
         table = "ss_data"
@@ -31,10 +50,67 @@ class SSData(BaseDbModel):
     author_id = fields.BigIntField()
     channel_id = fields.BigIntField()
     message_id = fields.BigIntField()
-    dhash = fields.CharField(max_length=1024, null=True)
-    phash = fields.CharField(max_length=1024, null=True)
+    dhash = fields.BigIntField(null=True)  # 64 bit hashes, stored signed
+    phash = fields.BigIntField(null=True)
     submitted_at = fields.DatetimeField(auto_now=True)
 
+    UPGRADE_QUERY = """
+    DO $$
+    BEGIN
+        IF (SELECT DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_NAME = 'ss_data' AND COLUMN_NAME = 'dhash') <> 'bigint' THEN
+
+            ALTER TABLE PUBLIC."ss_data"
+                ALTER COLUMN DHASH TYPE BIGINT USING (
+                    CASE WHEN DHASH ~* '^[0-9a-f]{1,16}$' THEN ('x' || LPAD(DHASH, 16, '0'))::BIT(64)::BIGINT END
+                ),
+                ALTER COLUMN PHASH TYPE BIGINT USING (
+                    CASE WHEN SPLIT_PART(PHASH, ':', CASE WHEN PHASH LIKE '%:%' THEN 2 ELSE 1 END) ~* '^[0-9a-f]{1,16}$'
+                    THEN ('x' || LPAD(SPLIT_PART(PHASH, ':', CASE WHEN PHASH LIKE '%:%' THEN 2 ELSE 1 END), 16, '0'))::BIT(64)::BIGINT
+                    END
+                );
+        END IF;
+    END $$;
+    """
+
+    @classmethod
+    async def upgrade_hash_columns(cls, db):
+        """
+        Hex text hashes -> BIGINT (backfilled in place) + one expression index per 8 bit band of dhash.
+        Safe to run on every startup.
+        """
+        await db.execute(cls.UPGRADE_QUERY)
+        for band in range(HASH_BANDS):
+            await db.execute(
+                f'CREATE INDEX IF NOT EXISTS "ss_data_dhash_band_{band}" ON PUBLIC."ss_data" (((DHASH >> {band * 8}) & 255))'
+            )
+
+    @classmethod
+    async def similar(
+        cls, ssverify_id: int, dhash: int, distance: int = DUPLICATE_DISTANCE
+    ) -> T.List[T.Tuple[int, "SSData"]]:
+        """
+        Rows of an ssverify within hamming `distance` of dhash, closest first.
+
+        The band conditions pick candidates through the band indexes, bit_count does the exact filter.
+        """
+        dhash = to_signed(hash_to_int(dhash))
+        bands = " OR ".join(
+            f"((DATA.DHASH >> {b * 8}) & 255) = (($2::BIGINT >> {b * 8}) & 255)" for b in range(HASH_BANDS)
+        )
+
+        query = f"""
+        SELECT DATA.*, BIT_COUNT((DATA.DHASH # $2::BIGINT)::BIT(64)) AS DISTANCE
+            FROM PUBLIC."ss_info_ss_data" AS LINK
+            INNER JOIN PUBLIC."ss_data" AS DATA ON DATA.ID = LINK.SSDATA_ID
+        WHERE LINK.SS_INFO_ID = $1
+        AND ({bands})
+        AND BIT_COUNT((DATA.DHASH # $2::BIGINT)::BIT(64)) <= $3
+        ORDER BY DISTANCE
+        """
+        records = await cls.bot.db.fetch(query, ssverify_id, dhash, distance)
+        return [(r["distance"], cls._init_from_db(**{k: v for k, v in r.items() if k != "distance"})) for r in records]
+
     @property
     def author(self):
         return self.bot.get_user(self.author_id)
@@ -97,10 +173,12 @@ class SSVerify(BaseDbModel):
 
     async def full_delete(self):
         self.bot.cache.ssverify_channels.discard(self.channel_id)
+        self.bot.cache.ss_hashes.pop(self.channel_id, None)
         data = await self.data.all()
 
         await SSData.filter(pk__in=[d.id for d in data]).delete()
         await self.delete()
+        self.bot.cache.publish("ssverify_changed", self.channel_id)
 
     @property
     def filtered_keywords(self):
@@ -115,25 +193,40 @@ class SSVerify(BaseDbModel):
             author_id=ctx.author.id,
             channel_id=ctx.channel.id,
             message_id=ctx.message.id,
-            dhash=img.dhash,
-            phash=img.phash,
+            dhash=to_signed(hash_to_int(img.dhash)),
+            phash=to_signed(hash_to_int(img.phash, 1)),
         )
         await self.data.add(data)
+        self.bot.cache.add_ss_hash(self.channel_id, data)
+        self.bot.cache.publish("ss_hash_added", data.id, channel_id=self.channel_id)
 
     async def _match_for_duplicate(self, dhash: str, phash: str, author_id: int) -> Tuple[bool, str]:
-        _dhash = imagehash.hex_to_hash(dhash)
-        async for record in self.data.filter(author_id=author_id).order_by("submitted_at"):
-            if _dhash - imagehash.hex_to_hash(record.dhash) <= 7:
+        _dhash, _phash = hash_to_int(dhash), hash_to_int(phash, 1)
+        if _dhash is None:
+            return False, False
+
+        if (tree := self.bot.cache.ss_hashes.get(self.channel_id)) is not None:
+            matches = tree.search(_dhash, DUPLICATE_DISTANCE)
+        else:  # index not built for this channel, ask postgres.
+            matches = await SSData.similar(self.id, _dhash)
+
+        for _, record in matches:
+            if record.author_id == author_id:
                 return (
                     True,
                     f"{self.emoji(False)} | You've already submitted this screenshot [here]({record.jump_url.format(self.guild_id)}).\n",
                 )
 
-        if r := await self.data.filter(dhash=dhash, phash=phash).first():
-            return (
-                True,
-                f"{self.emoji(False)} | <@{r.author_id}>, already submitted the [same ss]({r.jump_url.format(self.guild_id)}).\n",
-            )
+        # someone else's ss, phash has to agree as well.
+        for _, record in matches:
+            if _phash is None or (phash := hash_to_int(record.phash)) is None:
+                continue
+
+            if (_phash ^ phash).bit_count() <= DUPLICATE_DISTANCE:
+                return (
+                    True,
+                    f"{self.emoji(False)} | <@{record.author_id}>, already submitted the [same ss]({record.jump_url.format(self.guild_id)}).\n",
+                )
 
         return False, False
 
@@ -189,3 +282,34 @@ class SSVerify(BaseDbModel):
 
         await self._add_to_data(ctx, image)
         return f"{self.emoji(True)} | Verified successfully.\n"
+
+
+class OCRResult(BaseDbModel):
+    """OCR output of a screenshot, keyed by the sha256 of its bytes."""
+
+    class Meta:
+        table = "ss_ocr_cache"
+
+    sha256 = fields.CharField(max_length=64, pk=True)
+    text = fields.TextField(default="")
+    device_info = fields.JSONField(default=dict)
+    dhash = fields.CharField(max_length=16)
+    phash = fields.CharField(max_length=16)
+    created_at = fields.DatetimeField(auto_now_add=True, index=True)
+
+
+class SSVerifyJob(BaseDbModel):
+    """A submission waiting in the verification queue, kept until it's processed so restarts don't lose it."""
+
+    class Meta:
+        table = "ss_verify_jobs"
+
+    id = fields.IntField(pk=True)
+    guild_id = fields.BigIntField()
+    channel_id = fields.BigIntField()
+    message_id = fields.BigIntField()
+    author_id = fields.BigIntField()
+    pending_message_id = fields.BigIntField(null=True)
+    weight = fields.FloatField(default=1.0)
+    cost = fields.IntField(default=1)
+    created_at = fields.DatetimeField(auto_now_add=True)
@@ -55,12 +55,32 @@ class Tourney(BaseDbModel):
     required_lines = fields.SmallIntField(default=0)
     allow_duplicate_tags = fields.BooleanField(default=True)
 
+    confirm_feed = fields.BooleanField(default=False)  # batch confirm messages
+    confirm_webhook = fields.BooleanField(default=False)  # send batched confirm messages through a webhook
+
+    renumber_on_cancel = fields.BooleanField(default=False)
+    reopen_on_cancel = fields.BooleanField(default=False)
+
     assigned_slots: fields.ManyToManyRelation["TMSlot"] = fields.ManyToManyField("models.TMSlot")
     media_partners: fields.ManyToManyRelation["MediaPartner"] = fields.ManyToManyField("models.MediaPartner")
 
+    # columns added after the table was first created, generate_schemas doesn't add them to an existing table.
+    UPGRADE_QUERY = """
+    ALTER TABLE PUBLIC."tm.tourney"
+        ADD COLUMN IF NOT EXISTS CONFIRM_FEED BOOLEAN NOT NULL DEFAULT FALSE,
+        ADD COLUMN IF NOT EXISTS CONFIRM_WEBHOOK BOOLEAN NOT NULL DEFAULT FALSE,
+        ADD COLUMN IF NOT EXISTS RENUMBER_ON_CANCEL BOOLEAN NOT NULL DEFAULT FALSE,
+        ADD COLUMN IF NOT EXISTS REOPEN_ON_CANCEL BOOLEAN NOT NULL DEFAULT FALSE;
+    """
+
     def __str__(self):
         return f"{getattr(self.registration_channel,'mention','deleted-channel')} [ID: `{self.id}`]"
 
+    @classmethod
+    async def upgrade_table(cls, db):
+        """Adds the columns newer than the table, safe to run on every startup."""
+        await db.execute(cls.UPGRADE_QUERY)
+
     @classmethod
     async def convert(cls, ctx, argument: str):
         try:
@@ -155,6 +175,18 @@ class Tourney(BaseDbModel):
         if len(message.mentions) > 0:
             _e.description += f"Team: {', '.join([str(m) for m in message.mentions])}"
 
+        if self.confirm_feed:
+            from cogs.esports.helpers.confirm import ConfirmFeed
+
+            await slot.save()
+            await self.assigned_slots.add(slot)
+            self.bot.cache.add_partner_registration(self.id, slot.leader_id, slot.members)
+            self.bot.cache.publish("tourney_changed", self.id)
+
+            if self.confirm_channel:
+                ConfirmFeed.enqueue(self, slot, _e, message.author.id)
+            return
+
         if _chan := self.confirm_channel:
             m = await _chan.send(
                 content=message.author.mention, embed=_e, allowed_mentions=discord.AllowedMentions(users=True)
@@ -164,6 +196,8 @@ class Tourney(BaseDbModel):
 
             await slot.save()
             await self.assigned_slots.add(slot)
+            self.bot.cache.add_partner_registration(self.id, slot.leader_id, slot.members)
+            self.bot.cache.publish("tourney_changed", self.id)
 
     async def finalize_slot(self, ctx: Context, slot: "TMSlot"):
         """
@@ -240,9 +274,11 @@ class Tourney(BaseDbModel):
             await self.logschan.send(embed=embed, file=await self.get_csv())
 
         self.bot.cache.tourney_channels.discard(self.registration_channel_id)
+        self.bot.cache.partner_registrations.pop(self.id, None)
         _data = await self.assigned_slots.all()
         await TMSlot.filter(pk__in=[_.id for _ in _data]).delete()
         await self.delete()
+        self.bot.cache.publish("tourney_changed", self.id, channel_id=self.registration_channel_id)
 
         if self.slotm_channel_id:
             with suppress(discord.HTTPException, AttributeError):
@@ -333,6 +369,7 @@ class Tourney(BaseDbModel):
 
         await Tourney.filter(pk=self.id).update(started_at=self.bot.current_time, closed_at=None)
         self.bot.cache.tourney_channels.add(self.registration_channel_id)
+        self.bot.cache.publish("tourney_changed", self.id)
 
         _e = discord.Embed(color=self.bot.color)
 
@@ -390,29 +427,46 @@ class Tourney(BaseDbModel):
 
     async def remove_slot(self, slot: "TMSlot"):
         if slot.confirm_jump_url:
-            self.bot.loop.create_task(self.update_confirmed_message(slot.confirm_jump_url))
+            self.bot.loop.create_task(self.update_confirmed_message(slot.confirm_jump_url, slot.jump_url))
 
         await slot.delete()
+        await self.bot.cache.refresh_partner_registrations(self.id)
+        self.bot.cache.publish("tourney_changed", self.id)
 
         if not await self.assigned_slots.filter(leader_id=slot.leader_id).exists():
             m = self.guild.get_member(slot.leader_id)
             if m:
                 await m.remove_roles(discord.Object(id=self.role_id))
 
-    async def update_confirmed_message(self, link: str):
+    async def update_confirmed_message(self, link: str, *jump_urls: str):
+        """
+        Strikes through the confirm embeds of slots.
+
+        Batched confirm messages carry upto 10 embeds, `jump_urls` (registration message links)
+        are used to find the ones that belong to the cancelled slots.
+        """
         _ids = [int(i) for i in link.split("/")[5:]]
 
-        with suppress(discord.HTTPException, IndexError):
-            message = await self.guild.get_channel(_ids[0]).fetch_message(_ids[1])
+        with suppress(discord.HTTPException, IndexError, AttributeError):
+            channel = self.guild.get_channel(_ids[0])
+            message = await channel.fetch_message(_ids[1])
 
             if message:
-                e = message.embeds[0]
+                embeds = message.embeds
+                cancelled = embeds[:1]
+                if jump_urls and len(embeds) > 1:
+                    cancelled = [e for e in embeds if any(url in (e.description or "") for url in jump_urls)]
 
-                e.description = "~~" + e.description.strip() + "~~"
-                e.title = "Cancelled Slot"
-                e.color = discord.Color.red()
+                for e in cancelled:
+                    e.description = "~~" + e.description.strip() + "~~"
+                    e.title = "Cancelled Slot"
+                    e.color = discord.Color.red()
 
-                await message.edit(embed=e)
+                if message.webhook_id:
+                    webhook = discord.utils.get(await channel.webhooks(), id=message.webhook_id)
+                    return await webhook.edit_message(message.id, embeds=embeds)
+
+                await message.edit(embeds=embeds)
 
     async def make_changes(self, **kwargs):
         return await Tourney.filter(pk=self.id).update(**kwargs)
@@ -501,3 +555,42 @@ class TGroupList(BaseDbModel):
     def jump_url(self):
         if c := self.channel:
             return f"https://discord.com/channels/{c.guild.id}/{self.channel_id}/{self.pk}"
+
+
+class TGroupRoleJob(BaseDbModel):
+    class Meta:
+        table = "tm.group_role_jobs"
+
+    id = fields.IntField(pk=True)
+    guild_id = fields.BigIntField()
+    tourney_id = fields.IntField()
+    author_id = fields.BigIntField()
+    channel_id = fields.BigIntField()
+    message_id = fields.BigIntField(null=True)
+    revoke = fields.BooleanField(default=False)
+
+    plan = fields.JSONField(default=dict)  # {role_id: [member_ids]}
+    done = fields.JSONField(default=dict)  # {role_id: [member_ids]} already processed
+
+    created_at = fields.DatetimeField(auto_now_add=True)
+    completed_at = fields.DatetimeField(null=True)
+
+    @property
+    def channel(self) -> Optional[discord.TextChannel]:
+        return self.bot.get_channel(self.channel_id)
+
+    @property
+    def total(self) -> int:
+        return sum(len(v) for v in self.plan.values())
+
+    @property
+    def processed(self) -> int:
+        return sum(len(v) for v in self.done.values())
+
+    def pending(self):
+        """Yields `(role_id, member_id)` pairs that are yet to be processed."""
+        for role_id, member_ids in self.plan.items():
+            done = set(self.done.get(role_id, ()))
+            for member_id in member_ids:
+                if member_id not in done:
+                    yield int(role_id), member_id
@@ -0,0 +1,59 @@
+from tortoise import fields, models
+
+__all__ = ("Schedule",)
+
+DAY = 24 * 60 * 60
+
+RECURRING_TIMERS = ("scrim_open", "autoclean", "scrim_match")
+
+
+class Schedule(models.Model):
+    """
+    A timer that repeats every `period` seconds. Firing moves `next_fire` forward in place,
+    so there is only ever one row per (event, key).
+    """
+
+    class Meta:
+        table = "schedule"
+        unique_together = ("event", "key")
+
+    id = fields.BigIntField(pk=True)
+    event = fields.TextField()
+    key = fields.BigIntField()  # what the schedule is for, the scrim id
+    period = fields.IntField(default=DAY)
+    next_fire = fields.DatetimeField(index=True)
+    extra = fields.JSONField(default=dict)
+    guild_id = fields.BigIntField(null=True)
+
+    # the daily scrim timers used to be re-inserted into the timer table every time they fired.
+    MIGRATE_QUERY = """
+    INSERT INTO schedule (event, key, period, next_fire, extra, guild_id)
+        SELECT DISTINCT ON (event, (extra->'kwargs'->>'scrim_id')::BIGINT)
+            event, (extra->'kwargs'->>'scrim_id')::BIGINT, $2::INT, expires, extra, sc.guild_id
+        FROM timer LEFT JOIN "sm.scrims" sc ON sc.id = (extra->'kwargs'->>'scrim_id')::BIGINT
+        WHERE event = ANY($1::TEXT[])
+        ORDER BY event, (extra->'kwargs'->>'scrim_id')::BIGINT, expires DESC
+    ON CONFLICT (event, key) DO NOTHING
+    """
+
+    @classmethod
+    async def delete_orphans(cls, db) -> int:
+        """Deletes schedules of deleted scrims, returns how many."""
+        status = await db.execute(
+            """DELETE FROM schedule s WHERE s.event = ANY($1::TEXT[])
+            AND NOT EXISTS (SELECT 1 FROM "sm.scrims" sc WHERE sc.id = s.key)""",
+            RECURRING_TIMERS,
+        )
+        return int(status.split()[-1])
+
+    @property
+    def kwargs(self):
+        return self.extra.get("kwargs", {})
+
+    @classmethod
+    async def migrate_timers(cls, db):
+        """Moves the recurring scrim timers out of the timer table, safe to run on every startup."""
+        async with db.acquire() as con:
+            async with con.transaction():
+                await con.execute(cls.MIGRATE_QUERY, RECURRING_TIMERS, DAY)
+                await con.execute("DELETE FROM timer WHERE event = ANY($1::TEXT[])", RECURRING_TIMERS)
@@ -7,6 +7,69 @@ class Timer(models.Model):
     created = fields.DatetimeField(auto_now=True)
     event = fields.TextField()
     extra = fields.JSONField(default=dict)
+    guild_id = fields.BigIntField(null=True)  # decides which process runs the timer when clustered
+
+    # timers made without a guild_id get it from their guild_id kwarg or their scrim. The backfill runs
+    # on every startup, rows written before scrim timers carried their guild are fixed too.
+    UPGRADE_QUERY = """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_NAME = 'timer' AND COLUMN_NAME = 'guild_id') THEN
+
+            ALTER TABLE PUBLIC."timer" ADD COLUMN GUILD_ID BIGINT;
+        END IF;
+
+        UPDATE PUBLIC."timer" SET GUILD_ID = (EXTRA->'kwargs'->>'guild_id')::BIGINT
+            WHERE GUILD_ID IS NULL AND EXTRA->'kwargs' ? 'guild_id';
+
+        UPDATE PUBLIC."timer" T SET GUILD_ID = S.GUILD_ID FROM PUBLIC."sm.scrims" S
+            WHERE T.GUILD_ID IS NULL AND T.EVENT = 'scrim_reserve' AND S.ID = (T.EXTRA->'kwargs'->>'scrim_id')::BIGINT;
+
+        UPDATE PUBLIC."timer" T SET GUILD_ID = S.GUILD_ID FROM PUBLIC."sm.scrims" S
+            WHERE T.GUILD_ID IS NULL AND T.EVENT = 'scrim_ban' AND S.ID = (T.EXTRA->'kwargs'->'scrims'->>0)::BIGINT;
+
+        IF NOT EXISTS (SELECT 1 FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_NAME = 'schedule' AND COLUMN_NAME = 'guild_id') THEN
+
+            ALTER TABLE PUBLIC."schedule" ADD COLUMN GUILD_ID BIGINT;
+            UPDATE PUBLIC."schedule" S SET GUILD_ID = SC.GUILD_ID FROM PUBLIC."sm.scrims" SC WHERE SC.ID = S.KEY;
+        END IF;
+    END $$;
+    """
+
+    # events that are looked up or cleaned up by event, the rest only ever go by expires.
+    INDEXED_EVENTS = ("scrim_ban", "scrim_reserve", "guild_premium", "user_premium", "lockdown")
+
+    ORPHANS_QUERY = """
+    DELETE FROM PUBLIC."timer" T WHERE
+        (T.EVENT = 'scrim_reserve' AND NOT EXISTS (
+            SELECT 1 FROM PUBLIC."sm.scrims" S WHERE S.ID = (T.EXTRA->'kwargs'->>'scrim_id')::BIGINT
+        ))
+        OR (T.EVENT = 'scrim_ban' AND NOT EXISTS (
+            SELECT 1 FROM PUBLIC."sm.scrims" S
+            WHERE S.ID IN (SELECT JSONB_ARRAY_ELEMENTS_TEXT(T.EXTRA->'kwargs'->'scrims')::BIGINT)
+        ))
+        -- only timers that belong to the guild's own rows, reminders and lockdowns outlive a missing guild_data.
+        OR (T.EVENT IN ('scrim_ban', 'scrim_reserve', 'guild_premium') AND T.GUILD_ID IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM PUBLIC."guild_data" G WHERE G.GUILD_ID = T.GUILD_ID
+        ))
+    """
+
+    @classmethod
+    async def upgrade_table(cls, db):
+        """Adds the guild_id column to timer and schedule and the partial event index, safe to run on every startup."""
+        await db.execute(cls.UPGRADE_QUERY)
+
+        events = ", ".join(f"'{event}'" for event in cls.INDEXED_EVENTS)
+        await db.execute(
+            f'CREATE INDEX IF NOT EXISTS "timer_event_expires" ON PUBLIC."timer" (EVENT, EXPIRES) WHERE EVENT IN ({events})'
+        )
+
+    @classmethod
+    async def delete_orphans(cls, db) -> int:
+        """Deletes timers whose scrim or guild no longer exists, returns how many."""
+        return int((await db.execute(cls.ORPHANS_QUERY)).split()[-1])
 
     @property
     def kwargs(self):
@@ -15,3 +78,8 @@ class Timer(models.Model):
     @property
     def args(self):
         return self.extra.get("args", ())
+
+    @property
+    def next_fire(self):
+        """When the Schedule that fired this timer fires next, None for one-off timers."""
+        return self.extra.get("next_fire")
@@ -6,6 +6,7 @@ from .Commands import *
 from .guild import *  # noqa: F401, F403
 from .Lockdown import *
 from .premium import *
+from .Schedule import *
 from .Snipe import *
 from .Tag import *
 from .Timer import *
@@ -0,0 +1,5 @@
+from .engine import *
+from .index import *
+from .client import *
+from .download import *
+from .counts import *
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import typing as T
+
+import aiohttp
+
+from .engine import OCREngine
+
+__all__ = ("OCRClient",)
+
+
+class OCRClient:
+    """
+    Sends OCR work to the service in `ocr_api.py` (localhost or another box).
+
+    Same interface as OCREngine, if the service can't be reached the work falls back to
+    an in-process pool that is only started the first time it's needed.
+    """
+
+    TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+    def __init__(
+        self, session: aiohttp.ClientSession, url: str, *, key: T.Optional[str] = None, workers: T.Optional[int] = None
+    ):
+        self.session = session
+        self.url = url.rstrip("/")
+        self.headers = {"x-api-key": key} if key else {}
+
+        self.workers = workers or OCREngine.default_workers()
+        self.pending = 0
+
+        self.__fallback: T.Optional[OCREngine] = None
+
+    @property
+    def fallback(self) -> OCREngine:
+        if self.__fallback is None:
+            self.__fallback = OCREngine(self.workers)
+        return self.__fallback
+
+    async def process_batch(self, images: T.Sequence[bytes]) -> T.List[dict]:
+        """
+        One request for all the images. 4xx responses are raised, a wrong or missing key
+        would otherwise hide behind the fallback forever.
+        """
+        form = aiohttp.FormData()
+        for idx, data in enumerate(images):
+            form.add_field("files", data, filename=f"{idx}.png", content_type="application/octet-stream")
+
+        self.pending += len(images)
+        try:
+            async with self.session.post(
+                f"{self.url}/ocr/batch", data=form, headers=self.headers, timeout=self.TIMEOUT
+            ) as resp:
+                resp.raise_for_status()
+                return (await resp.json())["results"]
+
+        except aiohttp.ClientResponseError as e:
+            if e.status < 500:
+                print(f"❌ OCR service refused the request: {e.status} {e.message}")
+                raise
+
+        except (aiohttp.ClientError, TimeoutError):
+            pass
+
+        finally:
+            self.pending -= len(images)
+
+        return await self.fallback.process_batch(images)
+
+    async def health(self) -> T.Optional[dict]:
+        try:
+            async with self.session.get(f"{self.url}/health", headers=self.headers, timeout=self.TIMEOUT) as resp:
+                return await resp.json()
+        except (aiohttp.ClientError, TimeoutError):
+            return None
+
+    def close(self):
+        if self.__fallback is not None:
+            self.__fallback.close()
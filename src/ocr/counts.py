@@ -0,0 +1,100 @@
+"""
+Follower / subscriber counts out of OCR text.
+
+One compiled regex per screenshot type finds every count in a single pass, numbers are read
+with their K/M/B (and lakh/crore) suffix and any locale digit grouping (1,234 / 1.234 / 12,34,567).
+"""
+
+from __future__ import annotations
+
+import re
+import typing as T
+
+__all__ = ("COUNT_FIELDS", "extract_counts", "parse_count")
+
+
+COUNT_FIELDS = ("followers", "following", "subscribers", "views", "likes", "posts")
+
+# labels per SSType name, order matters where one label is a prefix of another.
+LABELS: T.Dict[str, T.Dict[str, str]] = {
+    "yt": {
+        "subscribers": r"subscribers?|subs\b",
+        "views": r"views?\b",
+        "likes": r"likes?\b",
+    },
+    "insta": {
+        "followers": r"followers?\b",
+        "following": r"following\b",
+        "posts": r"posts?\b",
+        "likes": r"likes?\b",
+    },
+}
+
+SUFFIXES = {
+    "k": 1_000,
+    "m": 1_000_000,
+    "b": 1_000_000_000,
+    "lakh": 100_000,
+    "lac": 100_000,
+    "cr": 10_000_000,
+    "crore": 10_000_000,
+}
+
+_SEP = r"[,.'\u00a0\u202f]"
+_NUMBER = rf"(?<![\d.,])(\d{{1,3}}(?:{_SEP}\d{{2,3}})+|\d+(?:[.,]\d+)?)"
+_SUFFIX = r"(?:\s?(crore|cr|lakh|lac|[kmb])(?![a-z]))?"
+
+_SEP_RE = re.compile(_SEP)
+
+
+def _compile(labels: T.Dict[str, str]) -> re.Pattern:
+    # "<number> <label>" or "<label>: <number>"
+    before = "|".join(f"(?P<{name}_a>{pattern})" for name, pattern in labels.items())
+    after = "|".join(f"(?P<{name}_b>{pattern})" for name, pattern in labels.items())
+
+    return re.compile(
+        rf"(?P<num_a>{_NUMBER}{_SUFFIX})\s*(?:{before})" rf"|(?:{after})\s*[:\-]?\s*(?P<num_b>{_NUMBER}{_SUFFIX})",
+        re.IGNORECASE,
+    )
+
+
+PATTERNS: T.Dict[str, re.Pattern] = {ss_type: _compile(labels) for ss_type, labels in LABELS.items()}
+
+
+def parse_count(number: str, suffix: T.Optional[str] = None) -> int:
+    """
+    "1.2", "k" -> 1200 | "12,34,567" -> 1234567 | "1.234" -> 1234 | "1,5", "M" -> 1500000
+
+    With a suffix the last separator is the decimal point, without one separators are
+    digit grouping unless there's a single separator not followed by exactly 3 digits.
+    """
+    multiplier = SUFFIXES.get((suffix or "").lower(), 1)
+    groups = _SEP_RE.split(number.strip())
+
+    decimal = len(groups) > 1 and (multiplier > 1 or (len(groups) == 2 and len(groups[1]) != 3))
+    if decimal:
+        value = float(f"{''.join(groups[:-1])}.{groups[-1]}")
+    else:
+        value = int("".join(groups))
+
+    return int(round(value * multiplier))
+
+
+def extract_counts(text: str, ss_type: str) -> T.Dict[str, T.Optional[int]]:
+    """`ss_type` is the SSType member name (yt, insta ...), the first match of every count wins."""
+    counts: T.Dict[str, T.Optional[int]] = dict.fromkeys(COUNT_FIELDS)
+
+    if (pattern := PATTERNS.get(ss_type)) is None:
+        return counts
+
+    labels = LABELS[ss_type]
+    for match in pattern.finditer(text):
+        side = "a" if match["num_a"] else "b"
+        name = next(name for name in labels if match[f"{name}_{side}"] is not None)
+
+        if counts[name] is None:
+            # groups of the matched side: (number with suffix, number, suffix)
+            idx = match.re.groupindex[f"num_{side}"]
+            counts[name] = parse_count(match.group(idx + 1), match.group(idx + 2))
+
+    return counts
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import typing as T
+
+import aiohttp
+
+__all__ = ("ScreenshotDownloader", "DownloadError")
+
+
+class DownloadError(Exception):
+    """Screenshot can't (or shouldn't) be downloaded, the message is shown to the user."""
+
+
+class _Attachment(T.Protocol):
+    id: int
+    size: int
+    width: T.Optional[int]
+    height: T.Optional[int]
+    proxy_url: str
+
+
+class ScreenshotDownloader:
+    """
+    Downloads screenshots from the discord cdn.
+
+    Size and dimensions from the attachment metadata are checked before anything is fetched,
+    the body is streamed into a buffer allocated once with a hard cap, and the cdn gets its own
+    keep-alive connection pool.
+    """
+
+    MAX_BYTES = 8 * 1024 * 1024
+    MAX_PIXELS = 4096 * 4096
+    CHUNK_SIZE = 64 * 1024
+
+    TIMEOUT = aiohttp.ClientTimeout(total=30, sock_read=10)
+
+    def __init__(self, *, concurrency: int = 8):
+        self.__session: T.Optional[aiohttp.ClientSession] = None
+        self.__sem = asyncio.Semaphore(concurrency)  # bounds how many buffers are alive at once
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=60, ttl_dns_cache=300)
+            self.__session = aiohttp.ClientSession(connector=connector, timeout=self.TIMEOUT)
+        return self.__session
+
+    def check(self, attachment: _Attachment):
+        if attachment.size > self.MAX_BYTES:
+            raise DownloadError(f"Screenshot is too large ({attachment.size / 1024 / 1024:.1f} MB), max 8 MB")
+
+        if attachment.width and attachment.height and attachment.width * attachment.height > self.MAX_PIXELS:
+            raise DownloadError(f"Screenshot resolution is too large ({attachment.width}x{attachment.height})")
+
+    async def fetch(self, attachment: _Attachment) -> bytearray:
+        self.check(attachment)
+
+        async with self.__sem:
+            async with self.session.get(attachment.proxy_url) as resp:
+                if resp.status != 200:
+                    raise DownloadError("Failed to download image")
+
+                # content-length / metadata may be missing or wrong, the cap is enforced while reading.
+                expected = resp.content_length or attachment.size or self.CHUNK_SIZE
+                if expected > self.MAX_BYTES:
+                    raise DownloadError("Screenshot is too large, max 8 MB")
+
+                buffer = bytearray(expected)
+                view, read = memoryview(buffer), 0
+
+                async for chunk in resp.content.iter_chunked(self.CHUNK_SIZE):
+                    end = read + len(chunk)
+                    if end > self.MAX_BYTES:
+                        raise DownloadError("Screenshot is too large, max 8 MB")
+
+                    if end > len(buffer):
+                        view.release()
+                        buffer.extend(bytes(end - len(buffer)))
+                        view = memoryview(buffer)
+
+                    view[read:end] = chunk
+                    read = end
+
+                view.release()
+                del buffer[read:]
+                return buffer
+
+    async def close(self):
+        if self.__session is not None:
+            await self.__session.close()
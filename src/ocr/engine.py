@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import typing as T
+from concurrent.futures import ProcessPoolExecutor
+
+from . import worker
+
+__all__ = ("OCREngine",)
+
+
+class OCREngine:
+    """
+    Runs screenshot hashing + OCR in a pool of warm worker processes.
+
+    Tesseract is looked up once and handed to every worker through the pool initializer,
+    so the event loop process never runs OCR itself.
+    """
+
+    def __init__(self, workers: T.Optional[int] = None):
+        self.workers = workers or self.default_workers()
+        self.tesseract_cmd = worker.find_tesseract()
+
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=worker.init_worker,
+            initargs=(self.tesseract_cmd,),
+        )
+
+        self.pending = 0
+
+        for _ in range(self.workers):
+            self.pool.submit(worker.warmup)
+
+    @staticmethod
+    def default_workers() -> int:
+        return os.cpu_count() or 1
+
+    async def process(self, image_data: bytes) -> dict:
+        loop = asyncio.get_running_loop()
+
+        self.pending += 1
+        try:
+            return await loop.run_in_executor(self.pool, worker.process_image, image_data)
+        finally:
+            self.pending -= 1
+
+    async def process_batch(self, images: T.Sequence[bytes]) -> T.List[dict]:
+        return list(await asyncio.gather(*(self.process(data) for data in images)))
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
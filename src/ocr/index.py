@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import typing as T
+
+__all__ = ("BKTree", "hash_to_int", "to_signed")
+
+_MASK = (1 << 64) - 1
+
+
+def to_signed(value: T.Optional[int]) -> T.Optional[int]:
+    """Unsigned 64 bit hash -> what fits a postgres BIGINT."""
+    if value is None:
+        return None
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def hash_to_int(value: T.Union[str, int, None], part: int = 0) -> T.Optional[int]:
+    """
+    Image hash (hex string, or BIGINT from the db) -> unsigned 64 bit int.
+
+    Older rows store phash as "dhash:phash:ahash:whash", `part` picks the hash out of those.
+    """
+    if value is None or value == "":
+        return None
+
+    if isinstance(value, int):
+        return value & _MASK
+
+    parts = value.split(":")
+    value = parts[part] if len(parts) > part else parts[0]
+
+    try:
+        return int(value, 16)
+    except ValueError:
+        return None
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over integer hashes with hamming distance as the metric.
+
+    A search for everything within distance `k` of a hash only descends into children whose
+    edge distance is within [d - k, d + k], so lookups stay far below a full scan.
+    """
+
+    __slots__ = ("root", "size")
+
+    def __init__(self):
+        # node = [hash, items, {distance: child}]
+        self.root: T.Optional[list] = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, key: int, item: T.Any):
+        self.size += 1
+
+        if self.root is None:
+            self.root = [key, [item], {}]
+            return
+
+        node = self.root
+        while True:
+            distance = (node[0] ^ key).bit_count()
+            if distance == 0:
+                node[1].append(item)
+                return
+
+            if (child := node[2].get(distance)) is None:
+                node[2][distance] = [key, [item], {}]
+                return
+
+            node = child
+
+    def remove(self, key: int, item: T.Any) -> bool:
+        """Removes the item stored under `key`, empty nodes stay in place as routing nodes."""
+        node = self.root
+        while node is not None:
+            distance = (node[0] ^ key).bit_count()
+            if distance == 0:
+                try:
+                    node[1].remove(item)
+                except ValueError:
+                    return False
+
+                self.size -= 1
+                return True
+
+            node = node[2].get(distance)
+
+        return False
+
+    def search(self, key: int, k: int) -> T.List[T.Tuple[int, T.Any]]:
+        """Every (distance, item) within hamming distance `k` of key, closest first."""
+        if self.root is None:
+            return []
+
+        found, stack = [], [self.root]
+        while stack:
+            node = stack.pop()
+            distance = (node[0] ^ key).bit_count()
+
+            if distance <= k:
+                found.extend((distance, item) for item in node[1])
+
+            for edge, child in node[2].items():
+                if distance - k <= edge <= distance + k:
+                    stack.append(child)
+
+        found.sort(key=lambda x: x[0])
+        return found
@@ -0,0 +1,208 @@
+"""
+Code that runs inside OCR worker processes.
+
+Nothing in here imports discord or the bot, workers only need pillow, numpy, imagehash and pytesseract.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import time
+import typing as T
+
+import imagehash
+import numpy as np
+import pytesseract
+from PIL import Image
+
+__all__ = ("find_tesseract", "init_worker", "warmup", "process_image")
+
+
+TESSERACT_PATHS = ("/usr/bin/tesseract", "/usr/local/bin/tesseract", "tesseract")
+TESSERACT_CONFIG = "--psm 6 --oem 3"
+
+# only these are stored (SSData.dhash / phash), nothing else gets computed.
+HASHES = ("dhash", "phash")
+HASH_FUNCS = {
+    "dhash": imagehash.dhash,
+    "phash": imagehash.phash,
+    "ahash": imagehash.average_hash,
+    "whash": imagehash.whash,
+}
+HASH_SIZE = 256  # px, hashes are computed from a copy no larger than this
+
+OCR_MAX_WIDTH = 1080  # phone screenshots are downscaled to this before ocr
+CROP_MARGIN = 12
+DESKEW_ANGLES = (0.0, -0.5, 0.5, -1.0, 1.0, -2.0, 2.0)
+
+MOBILE_RESOLUTIONS = ((1080, 1920), (1080, 2340), (1080, 2400), (1440, 3040), (720, 1280))
+
+
+def find_tesseract() -> T.Optional[str]:
+    for path in TESSERACT_PATHS:
+        if path == "tesseract" or os.path.exists(path):
+            pytesseract.pytesseract.tesseract_cmd = path
+            try:
+                pytesseract.get_tesseract_version()
+            except Exception:
+                continue
+
+            return path
+
+    return None
+
+
+def init_worker(tesseract_cmd: T.Optional[str] = None):
+    """Process pool initializer, runs once per worker."""
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    else:
+        find_tesseract()
+
+
+def warmup() -> int:
+    """Submitted once per worker so that processes are spawned before the first screenshot arrives."""
+    return os.getpid()
+
+
+def device_info(width: int, height: int) -> dict:
+    aspect_ratio = width / height
+
+    info = {
+        "width": width,
+        "height": height,
+        "aspect_ratio": round(aspect_ratio, 2),
+        "device_type": "unknown",
+        "platform": "unknown",
+    }
+
+    if aspect_ratio > 1.5:
+        info["device_type"], info["platform"] = "desktop", "web"
+    elif 0.4 < aspect_ratio < 0.6:
+        info["device_type"], info["platform"] = "mobile", "app"
+    elif 0.8 < aspect_ratio < 1.2:
+        info["device_type"], info["platform"] = "tablet", "app"
+
+    for mw, mh in MOBILE_RESOLUTIONS:
+        if (width, height) in ((mw, mh), (mh, mw)):
+            info["device_type"], info["platform"] = "mobile", "app"
+            break
+
+    return info
+
+
+def decode(image_data: bytes) -> T.Tuple[Image.Image, T.Tuple[int, int]]:
+    """Decodes the screenshot once, straight to grayscale. Returns the image and its original size."""
+    image = Image.open(io.BytesIO(image_data))
+    size = image.size
+
+    # lets the jpeg decoder skip work, png ignores it.
+    image.draft("L", (OCR_MAX_WIDTH, OCR_MAX_WIDTH * 3))
+    image = image.convert("L")
+
+    if image.width > OCR_MAX_WIDTH:
+        image = image.resize((OCR_MAX_WIDTH, round(image.height * OCR_MAX_WIDTH / image.width)), Image.Resampling.LANCZOS)
+
+    return image, size
+
+
+def calculate_hashes(gray: Image.Image) -> T.Dict[str, str]:
+    """Only the hashes listed in HASHES are computed, from a small copy of the decoded image."""
+    small = gray.copy()
+    small.thumbnail((HASH_SIZE, HASH_SIZE), Image.Resampling.BOX)
+    return {name: str(HASH_FUNCS[name](small)) for name in HASHES}
+
+
+def otsu_threshold(pixels: np.ndarray) -> int:
+    hist = np.bincount(pixels.ravel(), minlength=256).astype(np.float64)
+    levels = np.arange(256)
+
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    sum_bg = np.cumsum(hist * levels)
+    mean_bg = sum_bg / np.maximum(weight_bg, 1)
+    mean_fg = (sum_bg[-1] - sum_bg) / np.maximum(weight_fg, 1)
+
+    return int(np.argmax(weight_bg * weight_fg * (mean_bg - mean_fg) ** 2))
+
+
+def deskew_angle(binary: np.ndarray) -> float:
+    """Projection profile search, the angle where text rows are sharpest wins."""
+    sample = Image.fromarray((binary * 255).astype(np.uint8))
+    sample.thumbnail((400, 400))
+
+    best, best_score = 0.0, -1.0
+    for angle in DESKEW_ANGLES:
+        rows = np.asarray(sample.rotate(angle, fillcolor=0), dtype=np.float64).sum(axis=1)
+        score = float(np.square(np.diff(rows)).sum())
+        if score > best_score:
+            best, best_score = angle, score
+
+    return best
+
+
+def preprocess(gray: Image.Image) -> Image.Image:
+    """Binarized, deskewed image cropped to the text region, dark text on white as tesseract likes it."""
+    pixels = np.asarray(gray, dtype=np.uint8)
+    ink = pixels < otsu_threshold(pixels)
+
+    # dark mode screenshots: text is the minority class whichever side of the threshold it is.
+    if ink.mean() > 0.5:
+        ink = ~ink
+
+    if angle := deskew_angle(ink):
+        rotated = Image.fromarray((ink * 255).astype(np.uint8)).rotate(angle, fillcolor=0, expand=True)
+        ink = np.asarray(rotated) > 127
+
+    rows, cols = np.flatnonzero(ink.any(axis=1)), np.flatnonzero(ink.any(axis=0))
+    if rows.size and cols.size:
+        top, bottom = max(rows[0] - CROP_MARGIN, 0), rows[-1] + CROP_MARGIN
+        left, right = max(cols[0] - CROP_MARGIN, 0), cols[-1] + CROP_MARGIN
+        ink = ink[top:bottom, left:right]
+
+    return Image.fromarray(np.where(ink, 0, 255).astype(np.uint8))
+
+
+def extract_text(image: Image.Image) -> str:
+    text = pytesseract.image_to_string(image, lang="eng", config=TESSERACT_CONFIG)
+    return text.strip()
+
+
+def process_image(image_data: bytes) -> dict:
+    """Hashes and OCRs a screenshot, returns the results along with time spent in each stage (ms)."""
+    timings = {}
+
+    t = time.perf_counter()
+    try:
+        gray, size = decode(image_data)
+    except Exception as e:
+        timings["decode"] = (time.perf_counter() - t) * 1000
+        fallback = hashlib.md5(image_data).hexdigest()[:16]
+        return {
+            "text": "",
+            "device_info": {"device_type": "unknown", "platform": "unknown", "width": 0, "height": 0, "error": str(e)},
+            "dhash": fallback,
+            "phash": fallback,
+            "timings": timings,
+        }
+
+    timings["decode"] = (time.perf_counter() - t) * 1000
+
+    t = time.perf_counter()
+    hashes = calculate_hashes(gray)
+    timings["hash"] = (time.perf_counter() - t) * 1000
+
+    info = device_info(*size)
+
+    t = time.perf_counter()
+    try:
+        text = extract_text(preprocess(gray))
+    except Exception as e:
+        text, info["error"] = "", str(e)
+    timings["ocr"] = (time.perf_counter() - t) * 1000
+
+    return {"text": text, "device_info": info, "dhash": hashes["dhash"], "phash": hashes["phash"], "timings": timings}
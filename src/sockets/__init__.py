@@ -10,7 +10,7 @@ from socketio import AsyncClient
 from core import Cog
 
 from .app import sio
-from .events import DashboardGate, SocketScrims, SockGuild, SockPrime, SockSettings
+from .events import DashboardGate, SockExport, SocketScrims, SockGuild, SockPrime, SockSettings
 
 
 class SocketConnection(Cog):
@@ -43,3 +43,4 @@ async def setup(bot: Quotient):
     await bot.add_cog(SockSettings(bot))
     await bot.add_cog(SockPrime(bot))
     await bot.add_cog(SockGuild(bot))
+    await bot.add_cog(SockExport(bot))
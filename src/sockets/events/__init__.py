@@ -1,4 +1,5 @@
 from .dashgate import *  # noqa: F401, F403
+from .export import *  # noqa: F401, F403
 from .guilds import *  # noqa: F401, F403
 from .premium import *  # noqa: F401, F403
 from .scrims import *  # noqa: F401, F403
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import typing as T
+
+import discord
+
+if T.TYPE_CHECKING:
+    from core import Quotient
+
+from cogs.esports.helpers import export_registrations
+from core import Cog
+from models import Scrim, Tourney
+
+from ..schemas import SockResponse
+
+__all__ = ("SockExport",)
+
+
+class SockExport(Cog):
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+
+    @Cog.listener()
+    async def on_request__bot_export_registrations(self, u: str, data: dict):
+        guild_id, kind, record_id = int(data["guild_id"]), data["kind"], int(data["record_id"])
+        fmt = data.get("format", "csv")
+
+        guild = self.bot.get_guild(guild_id)
+        channel = self.bot.get_channel(int(data.get("channel_id") or 0))
+
+        model = {"tourney": Tourney, "scrim": Scrim}.get(kind)
+
+        error = None
+        if not guild or not model or not await model.filter(pk=record_id, guild_id=guild_id).exists():
+            error = f"Invalid {kind} ID."
+
+        elif not channel or getattr(channel.guild, "id", None) != guild_id:
+            # the export has member ids, it never leaves the guild it belongs to.
+            error = "Invalid channel ID."
+
+        elif not channel.permissions_for(channel.guild.me).attach_files:
+            error = "I need `attach_files` permission in the channel to upload the file."
+
+        if error:
+            return await self.bot.sio.emit(
+                "bot_export_registrations__{0}".format(u), SockResponse(ok=False, error=error).dict()
+            )
+
+        try:
+            m = await channel.send(file=await export_registrations(self.bot, guild, kind, record_id, fmt=fmt))
+        except discord.HTTPException as e:
+            return await self.bot.sio.emit(
+                "bot_export_registrations__{0}".format(u), SockResponse(ok=False, error=str(e)).dict()
+            )
+
+        await self.bot.sio.emit(
+            "bot_export_registrations__{0}".format(u), SockResponse(data={"url": m.attachments[0].url}).dict()
+        )
@@ -24,7 +24,7 @@ class SockSettings(Cog):
     @Cog.listener()
     async def on_request__prefix_change(self, u, data: dict):
         guild_id = data.get("guild_id")
-        await self.bot.cache.update_guild_cache(int(guild_id))
+        await self.bot.cache.changed("guild_settings_changed", int(guild_id))
         await self.bot.sio.emit("prefix_change__{0}".format(u), SockResponse().dict())
 
     @Cog.listener()
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 import dateparser
 
 from constants import IST, AutocleanType, Day
-from models import Guild, Scrim, Timer
+from models import Guild, Scrim
 
 __all__ = ("BaseScrim",)
 
@@ -115,9 +115,13 @@ class BaseScrim(BaseModel):
 
         scrim = await Scrim.create(**_d)
 
-        await bot.reminders.create_timer(scrim.open_time, "scrim_open", scrim_id=scrim.id)
+        await bot.reminders.set_schedule(
+            scrim.open_time, "scrim_open", scrim.id, scrim_id=scrim.id, guild_id=scrim.guild_id
+        )
 
-        await bot.reminders.create_timer(scrim.autoclean_time, "autoclean", scrim_id=scrim.id)
+        await bot.reminders.set_schedule(
+            scrim.autoclean_time, "autoclean", scrim.id, scrim_id=scrim.id, guild_id=scrim.guild_id
+        )
         bot.loop.create_task(scrim.setup_logs())
         return True, scrim
 
@@ -126,11 +130,11 @@ class BaseScrim(BaseModel):
         if not scrim:
             return False, "Scrim not found."
 
-        await Timer.filter(extra={"args": [], "kwargs": {"scrim_id": self.id}}, event="autoclean").delete()
-        await Timer.filter(extra={"args": [], "kwargs": {"scrim_id": self.id}}, event="scrim_open").delete()
-        await bot.reminders.create_timer(self.open_time, "scrim_open", scrim_id=self.id)
+        await bot.reminders.set_schedule(self.open_time, "scrim_open", self.id, scrim_id=self.id, guild_id=self.guild_id)
 
-        await bot.reminders.create_timer(self.autoclean_time, "autoclean", scrim_id=self.id)
+        await bot.reminders.set_schedule(
+            self.autoclean_time, "autoclean", self.id, scrim_id=self.id, guild_id=self.guild_id
+        )
 
         _d = self.dict()
         del _d["id"]
@@ -0,0 +1,20 @@
+"""Shared by the scripts in this folder, which are run one by one (`python tests/<script>.py`)."""
+
+import importlib.util
+import os
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+def load_source(*path: str):
+    """
+    Loads one module of the bot by its path under src/, e.g. `load_source("core", "bus.py")`.
+
+    Its package isn't imported, so modules without discord / tortoise imports of their own
+    can be tested where those aren't installed.
+    """
+    name = "_".join(path).removesuffix(".py")
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SRC, *path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,83 @@
+"""
+Renders the synthetic phone screenshots listed in manifest.json.
+
+    python tests/fixtures/screenshots/make_screenshots.py
+
+They're generated rather than committed so the repo stays small, real screenshots can be dropped
+in next to them and added to the manifest by hand.
+"""
+
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FONT = os.path.join(HERE, "..", "..", "robo-bold.ttf")
+
+SIZE = (1080, 2400)
+LIGHT = ((255, 255, 255), (15, 15, 15))
+DARK = ((15, 15, 15), (240, 240, 240))
+
+
+def font(size: int):
+    return ImageFont.truetype(FONT, size)
+
+
+def youtube(path: str, channel: str, button: str, *, theme=LIGHT, size=SIZE):
+    bg, fg = theme
+    image = Image.new("RGB", size, bg)
+    d = ImageDraw.Draw(image)
+
+    d.text((60, 80), "YouTube", fg, font=font(60))
+    d.ellipse((60, 260, 260, 460), fill=(200, 40, 40))
+    d.text((300, 280), channel, fg, font=font(64))
+    d.text((300, 370), f"@{channel.lower().replace(' ', '')} • 1.2K subscribers • 45 videos", fg, font=font(36))
+    d.rounded_rectangle((60, 520, 1020, 640), radius=60, fill=(230, 230, 230) if theme is LIGHT else (60, 60, 60))
+    d.text((420, 545), button, fg, font=font(52))
+    d.text((60, 720), "Home     Videos     Shorts     Live", fg, font=font(44))
+
+    image.save(path)
+
+
+def instagram(path: str, handle: str, button: str, *, theme=LIGHT, size=SIZE):
+    bg, fg = theme
+    image = Image.new("RGB", size, bg)
+    d = ImageDraw.Draw(image)
+
+    d.text((60, 80), handle, fg, font=font(56))
+    d.ellipse((60, 220, 300, 460), fill=(180, 60, 160))
+    d.text((380, 260), "87        10.4K        312", fg, font=font(52))
+    d.text((380, 340), "posts   followers   following", fg, font=font(40))
+    d.text((60, 500), "Esports organisation", fg, font=font(40))
+    d.rounded_rectangle((60, 600, 1020, 700), radius=20, fill=(0, 149, 246) if button == "Follow" else (220, 220, 220))
+    d.text((460, 620), button, fg, font=font(48))
+
+    image.save(path)
+
+
+def custom(path: str, text: str, *, theme=LIGHT, size=SIZE):
+    bg, fg = theme
+    image = Image.new("RGB", size, bg)
+    d = ImageDraw.Draw(image)
+    d.text((60, 400), text, fg, font=font(64))
+    image.save(path)
+
+
+def main():
+    out = lambda name: os.path.join(HERE, name)  # noqa: E731
+
+    youtube(out("yt_subscribed.png"), "ScrimX Esports", "Subscribed")
+    youtube(out("yt_subscribed_dark.png"), "ScrimX Esports", "Subscribed", theme=DARK)
+    youtube(out("yt_subscribed_1080p.jpg"), "ScrimX Esports", "Subscribed", size=(1080, 1920))
+    youtube(out("yt_not_subscribed.png"), "ScrimX Esports", "Subscribe")
+    youtube(out("yt_wrong_channel.png"), "Another Channel", "Subscribed")
+    instagram(out("insta_following.png"), "scrimx.esports", "Following")
+    instagram(out("insta_following_dark.png"), "scrimx.esports", "Following", theme=DARK)
+    instagram(out("insta_not_following.png"), "scrimx.esports", "Follow")
+    custom(out("custom_keyword.png"), "Joined ScrimX Discord")
+
+    print("Screenshots written to", HERE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Memory of the guild settings cache at 100k guilds, the old dict of dicts vs the slotted store.
+
+    python tests/guild_settings_bench.py [--guilds 100000] [--custom 0.1]
+
+Each layout is built in a fresh subprocess, so the RSS growth it reports isn't muddied by the
+other one. `--custom` is the share of guilds with a non default prefix, color or footer.
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tracemalloc
+
+from _support import load_source
+
+settings = load_source("core", "settings.py")
+
+PREFIX, COLOR, FOOTER = "x", 0x00FFB3, "scrimx is lub!"
+
+
+def rss() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def rows(count: int, custom: float):
+    """(guild_id, prefix, color, footer) like the guild_data table, None where unset."""
+    rng = random.Random(0)
+    for _ in range(count):
+        guild_id = rng.randint(1 << 52, 1 << 60)
+        if rng.random() < custom:
+            # built at runtime like strings decoded from the db, not shared literals.
+            yield guild_id, "".join(rng.choice("!?$.q") for _ in range(2)), rng.randint(0, 0xFFFFFF), None
+        else:
+            yield guild_id, PREFIX, None, None
+
+
+def build_dicts(records):
+    # what CacheManager.fill_guild_data used to do
+    return {
+        guild_id: {"prefix": prefix, "color": color or COLOR, "footer": footer or FOOTER}
+        for guild_id, prefix, color, footer in records
+    }
+
+
+def build_slotted(records):
+    # what CacheManager.set_guild_settings does
+    default = settings.GuildSettings(PREFIX, COLOR, FOOTER)
+
+    data = {}
+    for guild_id, prefix, color, footer in records:
+        s = settings.GuildSettings(prefix or PREFIX, color or COLOR, footer or FOOTER)
+        if s != default:
+            data[guild_id] = s
+
+    return data
+
+
+LAYOUTS = {"dicts": build_dicts, "slotted": build_slotted}
+
+
+def measure(layout: str, count: int, custom: float):
+    records = list(rows(count, custom))
+
+    before = rss()
+    tracemalloc.start()
+    data = LAYOUTS[layout](records)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{layout:<10}{len(data):>9} entries {traced / 2**20:>8.2f} MiB traced {(rss() - before) / 2**20:>8.2f} MiB rss"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--guilds", type=int, default=100000)
+    parser.add_argument("--custom", type=float, default=0.1)
+    parser.add_argument("--layout", choices=LAYOUTS)  # set in the subprocesses
+    args = parser.parse_args()
+
+    if args.layout:
+        return measure(args.layout, args.guilds, args.custom)
+
+    print(f"{args.guilds} guilds, {args.custom:.0%} with custom settings\n")
+    for layout in LAYOUTS:
+        cmd = [sys.executable, __file__, "--layout", layout, "--guilds", str(args.guilds), "--custom", str(args.custom)]
+        subprocess.run(cmd, check=True)
+
+
+if __name__ == "__main__":
+    main()
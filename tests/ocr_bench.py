@@ -0,0 +1,171 @@
+"""
+Offline speed + accuracy benchmark of screenshot verification.
+
+    python tests/fixtures/screenshots/make_screenshots.py   # once, renders the synthetic screenshots
+    python tests/ocr_bench.py [--workers N] [--rounds N]
+
+Every screenshot in fixtures/screenshots/manifest.json goes through Ssverification.verify_screenshot_ocr
+with the cdn download and the OCR result cache replaced by local stand-ins, so nothing touches
+discord or the database. Reports throughput (images/sec per worker), per-stage latency and
+precision / recall of the VALID decision.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from types import SimpleNamespace
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+
+from constants import SSType  # noqa: E402
+from cogs.esports.events.ssverify import Ssverification  # noqa: E402
+
+MANIFEST = os.path.join(HERE, "fixtures", "screenshots", "manifest.json")
+
+
+class FixtureDownloader:
+    """Serves attachment bytes from disk instead of the cdn."""
+
+    def __init__(self, files):
+        self.files = files  # attachment id: path
+
+    def prefetch(self, *attachments):
+        pass
+
+    def discard(self, attachment):
+        pass
+
+    async def fetch(self, attachment):
+        with open(self.files[attachment.id], "rb") as f:
+            return f.read()
+
+    async def close(self):
+        pass
+
+
+class NoCache:
+    """Every screenshot is OCR'd, a cache hit would make the numbers meaningless."""
+
+    hit_rate = 0.0
+
+    def by_attachment(self, attachment_id):
+        return None
+
+    async def get(self, sha256, attachment_id=None):
+        return None
+
+    async def put(self, sha256, result):
+        pass
+
+    async def purge_expired(self):
+        pass
+
+
+def load_manifest():
+    with open(MANIFEST, encoding="utf-8") as f:
+        entries = json.load(f)["screenshots"]
+
+    found = []
+    for idx, entry in enumerate(entries, start=1):
+        path = os.path.join(HERE, entry["file"])
+        if not os.path.exists(path):
+            print(f"skipping {entry['file']} (missing, run make_screenshots.py)")
+            continue
+
+        entry["path"], entry["id"] = path, idx
+        found.append(entry)
+
+    return found
+
+
+async def bench(workers: int, rounds: int):
+    entries = load_manifest()
+    if not entries:
+        return print("No screenshots to benchmark.")
+
+    loop = asyncio.get_running_loop()
+    bot = SimpleNamespace(
+        config=SimpleNamespace(OCR_WORKERS=workers),
+        session=None,
+        current_time=datetime.now(),
+        loop=SimpleNamespace(create_task=lambda coro: coro.close()),  # cog startup tasks talk to the db
+    )
+
+    cog = Ssverification(bot)
+    cog.downloader = FixtureDownloader({e["id"]: e["path"] for e in entries})
+    cog.ocr_cache = NoCache()
+    bot.loop = loop
+
+    ctx = SimpleNamespace(guild=SimpleNamespace(id=0))
+    attachments = {
+        e["id"]: SimpleNamespace(
+            id=e["id"],
+            size=os.path.getsize(e["path"]),
+            width=None,
+            height=None,
+            proxy_url=f"https://cdn.discordapp.com/attachments/0/0/{os.path.basename(e['path'])}",
+        )
+        for e in entries
+    }
+    records = {e["id"]: SimpleNamespace(ss_type=SSType[e["ss_type"]], channel_name=e["channel_name"]) for e in entries}
+
+    # warm up the pool so process start up isn't measured.
+    await cog.verify_screenshot_ocr(attachments[entries[0]["id"]], records[entries[0]["id"]], ctx)
+
+    stages = defaultdict(list)
+    decisions = []
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        results = await asyncio.gather(
+            *(cog.verify_screenshot_ocr(attachments[e["id"]], records[e["id"]], ctx) for e in entries)
+        )
+        for entry, result in zip(entries, results):
+            for stage, ms in result.metadata.get("timings", {}).items():
+                stages[stage].append(ms)
+            decisions.append((entry, "VALID: YES" in result.text))
+    elapsed = time.perf_counter() - started
+
+    cog.engine.close()
+
+    images = len(entries) * rounds
+    print(f"\n{images} screenshots in {elapsed:.2f}s with {cog.engine.workers} workers")
+    print(f"throughput: {images / elapsed:.2f} images/sec, {images / elapsed / cog.engine.workers:.2f} per worker\n")
+
+    print(f"{'stage':<10}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for stage, values in stages.items():
+        values.sort()
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        print(f"{stage:<10}{statistics.mean(values):>10.1f}{statistics.median(values):>10.1f}{p95:>10.1f}")
+
+    tp = sum(1 for e, valid in decisions if valid and e["valid"])
+    fp = sum(1 for e, valid in decisions if valid and not e["valid"])
+    fn = sum(1 for e, valid in decisions if not valid and e["valid"])
+
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    print(f"\nVALID precision: {precision:.2%}  recall: {recall:.2%}")
+
+    for entry, valid in decisions[: len(entries)]:
+        if valid != entry["valid"]:
+            print(f"  wrong: {entry['file']} (expected {entry['valid']}, got {valid})")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(bench(args.workers, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Golden file check + micro benchmark for the OCR count extractor (src/ocr/counts.py).
+
+    python tests/ocr_counts.py            # compare against fixtures/ocr_counts/golden.json, then benchmark
+    python tests/ocr_counts.py --update   # rewrite golden.json from the current extractor
+
+Fixture files are named <sstype>_<anything>.txt, sstype being the SSType member name (yt, insta ...).
+"""
+
+import json
+import os
+import sys
+import timeit
+
+from _support import load_source
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, "fixtures", "ocr_counts")
+GOLDEN = os.path.join(FIXTURES, "golden.json")
+
+# the ocr package itself pulls in numpy / tesseract which this check doesn't need.
+counts = load_source("ocr", "counts.py")
+
+
+def load_corpus():
+    for name in sorted(os.listdir(FIXTURES)):
+        if name.endswith(".txt"):
+            with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+                yield name, name.split("_", 1)[0], f.read()
+
+
+def run(corpus):
+    return {
+        name: {k: v for k, v in counts.extract_counts(text, ss_type).items() if v is not None}
+        for name, ss_type, text in corpus
+    }
+
+
+def main():
+    corpus = list(load_corpus())
+    results = run(corpus)
+
+    if "--update" in sys.argv:
+        with open(GOLDEN, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Updated {GOLDEN} ({len(results)} files)")
+        return
+
+    with open(GOLDEN, encoding="utf-8") as f:
+        golden = json.load(f)
+
+    failed = 0
+    for name, expected in golden.items():
+        if results.get(name) != expected:
+            failed += 1
+            print(f"FAIL {name}\n  expected: {expected}\n  got:      {results.get(name)}")
+
+    print(f"{len(golden) - failed}/{len(golden)} golden files match")
+
+    number = 2000
+    seconds = timeit.timeit(lambda: run(corpus), number=number)
+    per_text = seconds / (number * len(corpus)) * 1e6
+    print(f"extract_counts: {per_text:.1f} µs per text ({len(corpus)} texts x {number} runs)")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()